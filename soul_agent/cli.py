@@ -2,12 +2,74 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
-import httpx
 import typer
-from rich.console import Console
+
+try:
+    import orjson
+except ImportError:  # optional, from the "fast" extra
+    orjson = None
+
+
+class _LazyProxy:
+    """Stand-in for a heavyweight global, built on first attribute access.
+
+    Keeps ``soul --help`` and shell completion from importing httpx/rich
+    while commands keep writing ``_http.get(...)`` / ``console.print(...)``.
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._target: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._target is None:
+            self._target = self._factory()
+        return getattr(self._target, name)
+
+
+def _make_console() -> Any:
+    import sys
+
+    from rich.console import Console
+
+    # No per-print highlighting regex pass; don't hard-wrap piped output
+    return Console(highlight=False, soft_wrap=not sys.stdout.isatty())
+
+
+def _make_client() -> Any:
+    import atexit
+
+    import httpx
+
+    client = httpx.Client(
+        base_url=_API_BASE,
+        timeout=5,
+        transport=httpx.HTTPTransport(retries=0),
+    )
+    atexit.register(client.close)
+    return client
+
+
+# One pooled keep-alive client for all daemon calls in this process
+_http = _LazyProxy(_make_client)
+
+
+def _json(resp: Any) -> Any:
+    """Decode a daemon response body, using orjson when it's installed."""
+    if orjson is None:
+        return resp.json()
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        # Let httpx's decoder handle (and report) anything orjson rejects
+        return resp.json()
+
 
 app = typer.Typer(
     name="soul",
@@ -36,32 +98,119 @@ app.add_typer(memory_app, name="memory")
 app.add_typer(claudecode_app, name="claudecode")
 app.add_typer(soul_app, name="soul")
 
-console = Console()
+console = _LazyProxy(_make_console)
+
+# Paths computed once per process
+_PKG_DIR = Path(__file__).parent
+_REPO_DIR = _PKG_DIR.parent
+_STATE_DIR = Path.home() / ".soul-agent"
+_PLIST_NAME = "com.soul-agent.daemon.plist"
+_LAUNCH_AGENT = Path.home() / "Library" / "LaunchAgents" / _PLIST_NAME
 
 # Default config path
-DEFAULT_CONFIG = Path(__file__).parent.parent / "config" / "soul.json"
+DEFAULT_CONFIG = _REPO_DIR / "config" / "soul.json"
+_API_HOST = "127.0.0.1"
+_API_PORT = 8330
+_API_BASE = f"http://{_API_HOST}:{_API_PORT}"
+_PLIST_PLACEHOLDER_RE = re.compile(r"__(?:PYTHON_PATH|WORKING_DIR|LOG_DIR)__")
+# KEY=value lines of a .env file; comments, blank values and bare keys don't match
+# (matched on raw bytes so only the captured key/value get decoded)
+_ENV_LINE_RE = re.compile(rb"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(\S.*?)[ \t\r]*$")
+# Written by the daemon on startup (see soul_agent.service.PID_FILE)
+_PID_FILE = _STATE_DIR / "daemon.pid"
+
+
+_engine_factory: Callable[[], Any] | None = None
+
+
+def _get_engine() -> Any:
+    """Return the vault engine singleton, resolving its factory only once."""
+    global _engine_factory
+    if _engine_factory is None:
+        from soul_agent.core.vault import get_engine
+
+        _engine_factory = get_engine
+    return _engine_factory()
 
 
 def _init_engine(config: str | None = None) -> None:
     """Initialize the vault engine."""
-    from soul_agent.core.vault import get_engine
-
     config_path = config or str(DEFAULT_CONFIG)
-    get_engine().initialize(config_path=config_path)
+    _get_engine().initialize(config_path=config_path)
+
+
+def _service_or_local(local: Callable[..., None]) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """Run the decorated command via the daemon when it's up, else *local*.
+
+    *local* gets the same arguments once the vault engine has been
+    initialized from the command's ``config`` option.
+    """
+    def decorator(fn: Callable[..., None]) -> Callable[..., None]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> None:
+            if _service_is_running():
+                import httpx
+
+                try:
+                    return fn(*args, **kwargs)
+                except httpx.ConnectError:
+                    pass  # daemon went away after the check; run locally
+            _init_engine(kwargs.get("config"))
+            return local(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 def _service_is_running() -> bool:
-    """Probe /health endpoint with 1s timeout."""
+    """Check the daemon's PID file, falling back to a /health probe.
+
+    The probe (1s timeout) only runs when SOUL_FORCE_HTTP_PROBE=1 or the
+    PID can't be signalled; a missing file or dead PID means not running.
+    A live PID also needs the daemon port to accept connections, which
+    rules out a reused PID from a stale file and a daemon still starting.
+    """
+    if os.environ.get("SOUL_FORCE_HTTP_PROBE") != "1":
+        try:
+            fd = os.open(_PID_FILE, os.O_RDONLY)
+            try:
+                pid = int(os.read(fd, 16))
+            finally:
+                os.close(fd)
+            os.kill(pid, 0)
+            return _port_open()
+        except (OSError, ValueError) as exc:
+            if not isinstance(exc, PermissionError):
+                return False
+
+    import http.client
+
+    # stdlib probe so the liveness check never pays for importing httpx
+    conn = http.client.HTTPConnection(_API_HOST, _API_PORT, timeout=1)
     try:
-        resp = httpx.get(_api_url("/health"), timeout=1)
-        return resp.status_code == 200
+        conn.request("GET", "/health")
+        return conn.getresponse().status == 200
     except Exception:
         return False
+    finally:
+        conn.close()
+
+
+def _port_open() -> bool:
+    """Return True if something accepts TCP connections on the daemon port."""
+    import socket
+
+    try:
+        socket.create_connection((_API_HOST, _API_PORT), timeout=0.5).close()
+        return True
+    except OSError:
+        return False
 
 
 def _api_url(path: str) -> str:
     """Build http://127.0.0.1:8330{path}."""
-    return f"http://127.0.0.1:8330{path}"
+    return f"{_API_BASE}{path}"
 
 
 # ── Note ────────────────────────────────────────────────────────────────────
@@ -73,7 +222,7 @@ def note(
 ) -> None:
     """Record a note."""
     if text and _service_is_running():
-        resp = httpx.post(_api_url("/note"), json={"text": text}, timeout=5)
+        resp = _http.post("/note", json={"text": text}, timeout=5)
         if resp.status_code == 200:
             console.print("[green]Note recorded (via service).[/green]")
         else:
@@ -103,8 +252,8 @@ def todo_add(
         payload = {"text": text, "priority": priority}
         if due:
             payload["due"] = due
-        resp = httpx.post(_api_url("/todo/add"), json=payload, timeout=5)
-        data = resp.json()
+        resp = _http.post("/todo/add", json=payload, timeout=5)
+        data = _json(resp)
         console.print(f"[green]Todo added (via service):[/green] {data.get('todo_id', '?')}")
         return
 
@@ -120,29 +269,16 @@ def todo_ls(
 ) -> None:
     """List active todos."""
     if _service_is_running():
-        from rich.table import Table
+        from soul_agent.modules.todo import build_todo_table
 
-        resp = httpx.get(_api_url("/todo/list"), timeout=5)
-        data = resp.json()
+        resp = _http.get("/todo/list", timeout=5)
+        data = _json(resp)
         todos = data.get("todos", [])
         if not todos:
             console.print("[dim]No active todos.[/dim]")
             return
 
-        table = Table(title="Active Todos")
-        table.add_column("ID", style="cyan", width=10)
-        table.add_column("Task", style="white")
-        table.add_column("Due", style="yellow", width=12)
-        table.add_column("Priority", style="magenta", width=10)
-
-        for t in todos:
-            table.add_row(
-                t.get("id", ""),
-                t.get("text", "")[:60],
-                t.get("due", ""),
-                t.get("priority", ""),
-            )
-        console.print(table)
+        console.print(build_todo_table(todos))
         return
 
     _init_engine(config)
@@ -151,46 +287,44 @@ def todo_ls(
     list_todos()
 
 
+def _todo_done_local(todo_id: str, config: Optional[str] = None) -> None:
+    from soul_agent.modules.todo import complete_todo
+
+    complete_todo(todo_id)
+
+
 @todo_app.command("done")
+@_service_or_local(_todo_done_local)
 def todo_done(
     todo_id: str = typer.Argument(..., help="Todo ID to mark as done"),
     config: Optional[str] = typer.Option(None, "--config", "-c"),
 ) -> None:
     """Mark a todo as completed."""
-    if _service_is_running():
-        resp = httpx.post(_api_url("/todo/done"), json={"todo_id": todo_id}, timeout=5)
-        data = resp.json()
-        if data.get("success"):
-            console.print(f"[green]Todo {todo_id} marked as done.[/green]")
-        else:
-            console.print(f"[red]Todo {todo_id} not found.[/red]")
-        return
+    data = _json(_http.post("/todo/done", json={"todo_id": todo_id}, timeout=5))
+    if data.get("success"):
+        console.print(f"[green]Todo {todo_id} marked as done.[/green]")
+    else:
+        console.print(f"[red]Todo {todo_id} not found.[/red]")
 
-    _init_engine(config)
-    from soul_agent.modules.todo import complete_todo
 
-    complete_todo(todo_id)
+def _todo_rm_local(todo_id: str, config: Optional[str] = None) -> None:
+    from soul_agent.modules.todo import remove_todo
+
+    remove_todo(todo_id)
 
 
 @todo_app.command("rm")
+@_service_or_local(_todo_rm_local)
 def todo_rm(
     todo_id: str = typer.Argument(..., help="Todo ID to delete"),
     config: Optional[str] = typer.Option(None, "--config", "-c"),
 ) -> None:
     """Delete a todo."""
-    if _service_is_running():
-        resp = httpx.post(_api_url("/todo/rm"), json={"todo_id": todo_id}, timeout=5)
-        data = resp.json()
-        if data.get("success"):
-            console.print(f"[green]Todo {todo_id} deleted.[/green]")
-        else:
-            console.print(f"[red]Todo {todo_id} not found.[/red]")
-        return
-
-    _init_engine(config)
-    from soul_agent.modules.todo import remove_todo
-
-    remove_todo(todo_id)
+    data = _json(_http.post("/todo/rm", json={"todo_id": todo_id}, timeout=5))
+    if data.get("success"):
+        console.print(f"[green]Todo {todo_id} deleted.[/green]")
+    else:
+        console.print(f"[red]Todo {todo_id} not found.[/red]")
 
 
 @todo_app.command("merge")
@@ -220,29 +354,10 @@ def search(
 ) -> None:
     """Search across all memories and resources."""
     if _service_is_running():
-        from rich.panel import Panel
-        from rich.text import Text
+        from soul_agent.modules.recall import render_search_results
 
-        resp = httpx.get(_api_url("/search"), params={"q": query, "limit": limit}, timeout=10)
-        data = resp.json()
-        items = data.get("results", [])
-
-        if not items:
-            console.print("[dim]No results found.[/dim]")
-            return
-
-        console.print(f"\n[bold]Found {len(items)} results for:[/bold] {query}\n")
-        for i, item in enumerate(items, 1):
-            header = f"[{i}] {item.get('filename', '')}"
-            snippet = item.get("snippet", "") or "[no content]"
-            path = item.get("path", "")
-            panel = Panel(
-                Text(snippet[:300]),
-                title=header,
-                subtitle=path,
-                border_style="green",
-            )
-            console.print(panel)
+        resp = _http.get("/search", params={"q": query, "limit": limit}, timeout=10)
+        render_search_results(query, _json(resp).get("results", []))
         return
 
     _init_engine(config)
@@ -261,8 +376,8 @@ def recall(
     """Show today's memory summary, or weekly recap with --week."""
     if _service_is_running():
         scope = "week" if week else "today"
-        resp = httpx.get(_api_url("/recall"), params={"scope": scope}, timeout=15)
-        data = resp.json().get("data", {})
+        resp = _http.get("/recall", params={"scope": scope}, timeout=15)
+        data = _json(resp).get("data", {})
         if week:
             console.print(f"\n[bold]Weekly Recall — {data.get('week_start', '')}[/bold]\n")
             for item in data.get("items", [])[:15]:
@@ -318,14 +433,9 @@ def terminal_status() -> None:
 @clipboard_app.command("status")
 def clip_status() -> None:
     """Check clipboard monitoring status (queries the daemon)."""
-    from soul_agent.service import SERVICE_HOST, SERVICE_PORT
-
     try:
-        resp = httpx.get(
-            f"http://{SERVICE_HOST}:{SERVICE_PORT}/clipboard/status",
-            timeout=2,
-        )
-        data = resp.json()
+        resp = _http.get("/clipboard/status", timeout=2)
+        data = _json(resp)
         if data.get("active"):
             console.print(f"[green]Clipboard monitor: active[/green] (clips captured: {data.get('clips_captured', 0)})")
         else:
@@ -366,40 +476,38 @@ def svc_install() -> None:
     import shutil
     import sys
 
-    plist_template = Path(__file__).parent / "launchd" / "com.soul-agent.daemon.plist"
+    plist_template = _PKG_DIR / "launchd" / _PLIST_NAME
     if not plist_template.exists():
         console.print("[red]Plist template not found.[/red]")
         return
 
-    target_dir = Path.home() / "Library" / "LaunchAgents"
-    target_dir.mkdir(parents=True, exist_ok=True)
-    target = target_dir / "com.soul-agent.daemon.plist"
+    target = _LAUNCH_AGENT
+    target.parent.mkdir(parents=True, exist_ok=True)
 
     python_path = sys.executable
-    working_dir = str(Path(__file__).parent.parent.resolve())
-    log_dir = str(Path.home() / ".soul-agent")
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
-
-    content = plist_template.read_text(encoding="utf-8")
-    content = content.replace("__PYTHON_PATH__", python_path)
-    content = content.replace("__WORKING_DIR__", working_dir)
-    content = content.replace("__LOG_DIR__", log_dir)
+    repo_dir = _REPO_DIR.resolve()
+    working_dir = str(repo_dir)
+    log_dir = str(_STATE_DIR)
+    _STATE_DIR.mkdir(parents=True, exist_ok=True)
+
+    subs = {
+        "__PYTHON_PATH__": python_path,
+        "__WORKING_DIR__": working_dir,
+        "__LOG_DIR__": log_dir,
+    }
+    content = _PLIST_PLACEHOLDER_RE.sub(
+        lambda m: subs[m[0]], plist_template.read_text(encoding="utf-8"),
+    )
 
     # Inject environment variables from .env if it exists
-    env_file = Path(working_dir) / ".env"
+    env_file = repo_dir / ".env"
     if env_file.exists():
-        env_lines = []
-        for line in env_file.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key, value = key.strip(), value.strip()
-            if key and value:
-                env_lines.append(f"        <key>{key}</key>\n        <string>{value}</string>")
-        if env_lines:
+        env_block = "\n".join(
+            f"        <key>{m[1].decode()}</key>\n        <string>{m[2].decode()}</string>"
+            for m in _ENV_LINE_RE.finditer(env_file.read_bytes())
+        )
+        if env_block:
             # Insert env vars into EnvironmentVariables dict before closing </dict>
-            env_block = "\n".join(env_lines)
             content = content.replace(
                 "        <key>PATH</key>",
                 env_block + "\n        <key>PATH</key>",
@@ -410,8 +518,14 @@ def svc_install() -> None:
 
     import subprocess
 
-    subprocess.run(["launchctl", "load", str(target)], check=False)
-    console.print("[green]LaunchAgent loaded. soul-agent will start on login.[/green]")
+    # Fire-and-forget: launchctl's exit status isn't reported anyway
+    subprocess.Popen(
+        ["launchctl", "load", str(target)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    console.print("[green]LaunchAgent loading. soul-agent will start on login.[/green]")
 
 
 @service_app.command("uninstall")
@@ -419,11 +533,12 @@ def svc_uninstall() -> None:
     """Uninstall LaunchAgent (stops auto-start on login)."""
     import subprocess
 
-    target = Path.home() / "Library" / "LaunchAgents" / "com.soul-agent.daemon.plist"
+    target = _LAUNCH_AGENT
     if not target.exists():
         console.print("[dim]LaunchAgent not installed.[/dim]")
         return
 
+    # Must finish before the plist is removed, so this one stays blocking
     subprocess.run(["launchctl", "unload", str(target)], check=False)
     target.unlink(missing_ok=True)
     console.print("[green]LaunchAgent uninstalled.[/green]")
@@ -439,8 +554,8 @@ def compact(
     """Compress recent logs into weekly or monthly insights."""
     if _service_is_running():
         scope = "month" if month else "week"
-        resp = httpx.post(_api_url("/compact"), json={"scope": scope}, timeout=30)
-        data = resp.json()
+        resp = _http.post("/compact", json={"scope": scope}, timeout=30)
+        data = _json(resp)
         report = data.get("report", "")
         label = "Monthly" if month else "Weekly"
         if report:
@@ -473,29 +588,24 @@ def compact(
 
 # ── Core (permanent memory) ───────────────────────────────────────────────
 
+def _print_core(content: str | None) -> None:
+    if content:
+        console.print(content)
+    else:
+        console.print("[dim]No permanent memory found. Use 'soul core edit' to create one.[/dim]")
+
+
+def _core_show_local(config: Optional[str] = None) -> None:
+    _print_core(_get_engine().read_resource("core/MEMORY.md"))
+
+
 @core_app.command("show")
+@_service_or_local(_core_show_local)
 def core_show(
     config: Optional[str] = typer.Option(None, "--config", "-c"),
 ) -> None:
     """Display permanent memory (core/MEMORY.md)."""
-    if _service_is_running():
-        resp = httpx.get(_api_url("/core"), timeout=5)
-        data = resp.json()
-        content = data.get("content", "")
-        if content:
-            console.print(content)
-        else:
-            console.print("[dim]No permanent memory found. Use 'soul core edit' to create one.[/dim]")
-        return
-
-    _init_engine(config)
-    engine = _get_engine()
-
-    content = engine.read_resource("core/MEMORY.md")
-    if content:
-        console.print(content)
-    else:
-        console.print("[dim]No permanent memory found. Use 'soul core edit' to create one.[/dim]")
+    _print_core(_json(_http.get("/core", timeout=5)).get("content", ""))
 
 
 @core_app.command("edit")
@@ -503,58 +613,43 @@ def core_edit(
     config: Optional[str] = typer.Option(None, "--config", "-c"),
 ) -> None:
     """Edit permanent memory with $EDITOR."""
-    import os
-    import tempfile
-
     if _service_is_running():
-        resp = httpx.get(_api_url("/core"), timeout=5)
-        content = resp.json().get("content", "")
-
-        editor = os.environ.get("EDITOR", "vim")
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            tmp_path = f.name
-
-        try:
-            import subprocess
-
-            subprocess.run([editor, tmp_path], check=True)
-            new_content = Path(tmp_path).read_text(encoding="utf-8")
-            if new_content != content:
-                httpx.post(_api_url("/core"), json={"content": new_content}, timeout=5)
-                console.print("[green]Permanent memory updated (via service).[/green]")
-            else:
-                console.print("[dim]No changes made.[/dim]")
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        content = _json(_http.get("/core", timeout=5)).get("content", "")
+        new_content = _edit_in_editor(content)
+        if new_content is None:
+            console.print("[dim]No changes made.[/dim]")
+            return
+        _http.post("/core", json={"content": new_content}, timeout=5)
+        console.print("[green]Permanent memory updated (via service).[/green]")
         return
 
     _init_engine(config)
     engine = _get_engine()
 
-    editor = os.environ.get("EDITOR", "vim")
-    content = engine.read_resource("core/MEMORY.md") or ""
+    new_content = _edit_in_editor(engine.read_resource("core/MEMORY.md") or "")
+    if new_content is None:
+        console.print("[dim]No changes made.[/dim]")
+        return
+    engine.write_resource(content=new_content, directory="core", filename="MEMORY.md")
+    console.print("[green]Permanent memory updated.[/green]")
 
+
+def _edit_in_editor(initial: str) -> str | None:
+    """Open *initial* in $EDITOR; return the edited text, or None if unchanged."""
+    import subprocess
+    import tempfile
+
+    editor = os.environ.get("EDITOR", "vim")
     with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-        f.write(content)
-        tmp_path = f.name
+        f.write(initial)
+        tmp_path = Path(f.name)
 
     try:
-        import subprocess
-
-        subprocess.run([editor, tmp_path], check=True)
-        new_content = Path(tmp_path).read_text(encoding="utf-8")
-        if new_content != content:
-            engine.write_resource(
-                content=new_content,
-                directory="core",
-                filename="MEMORY.md",
-            )
-            console.print("[green]Permanent memory updated.[/green]")
-        else:
-            console.print("[dim]No changes made.[/dim]")
+        subprocess.run([editor, str(tmp_path)], check=True)
+        new_content = tmp_path.read_text(encoding="utf-8")
     finally:
-        Path(tmp_path).unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+    return new_content if new_content != initial else None
 
 
 # ── Insight ────────────────────────────────────────────────────────────────
@@ -566,14 +661,14 @@ def insight_today(
 ) -> None:
     """Show today's daily insight report. Use --force to regenerate."""
     if force and _service_is_running():
-        resp = httpx.post(_api_url("/insight/generate"), timeout=30)
-        data = resp.json()
+        resp = _http.post("/insight/generate", timeout=30)
+        data = _json(resp)
         console.print(data.get("report", "[dim]No insight generated.[/dim]"))
         return
 
     if _service_is_running():
-        resp = httpx.get(_api_url("/insight"), params={"date": "today"}, timeout=15)
-        data = resp.json()
+        resp = _http.get("/insight", params={"date": "today"}, timeout=15)
+        data = _json(resp)
         console.print(data.get("report", "[dim]No insight available.[/dim]"))
         return
 
@@ -598,28 +693,35 @@ def insight_week(
     config: Optional[str] = typer.Option(None, "-c", "--config"),
 ) -> None:
     """Show insights for the past week."""
+    from datetime import date, timedelta
+
+    today = date.today()
+    dates = [today - timedelta(days=i) for i in range(6, -1, -1)]
+
     if _service_is_running():
-        from datetime import date, timedelta
-
-        for i in range(6, -1, -1):
-            d = date.today() - timedelta(days=i)
-            resp = httpx.get(_api_url("/insight"), params={"date": d.isoformat()}, timeout=15)
-            data = resp.json()
-            report = data.get("report", "")
-            if report and "\u65e0\u6570\u636e" not in report:
-                console.print(f"\n{'=' * 60}")
-                console.print(report)
-        return
+        get = _http.get  # resolve through the lazy proxy once, not per day
 
-    _init_engine(config)
-    from datetime import date, timedelta
+        resp = get("/insight/week", timeout=60)
+        if resp.status_code == 200:
+            reports = [r.get("report", "") for r in _json(resp).get("reports", [])]
+        else:
+            # Older daemon without /insight/week: fetch days concurrently
+            from concurrent.futures import ThreadPoolExecutor
 
-    from soul_agent.modules.insight import build_daily_insight
+            def fetch(d: date) -> str:
+                resp = get("/insight", params={"date": d.isoformat()}, timeout=15)
+                return _json(resp).get("report", "")
 
-    engine = _get_engine()
-    for i in range(6, -1, -1):
-        d = date.today() - timedelta(days=i)
-        report = build_daily_insight(d, engine)
+            with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+                reports = list(pool.map(fetch, dates))
+    else:
+        _init_engine(config)
+        from soul_agent.modules.insight import build_daily_insight
+
+        engine = _get_engine()
+        reports = (build_daily_insight(d, engine) for d in dates)  # print as built
+
+    for report in reports:
         if report and "\u65e0\u6570\u636e" not in report:
             console.print(f"\n{'=' * 60}")
             console.print(report)
@@ -631,31 +733,21 @@ def insight_tasks(
 ) -> None:
     """Show active and stalled tasks."""
     if _service_is_running():
-        from rich.table import Table
+        from concurrent.futures import ThreadPoolExecutor
+
+        from soul_agent.modules.todo import build_todo_table
 
-        resp = httpx.get(_api_url("/todo/list"), timeout=5)
-        todos = resp.json().get("todos", [])
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            stalled_future = pool.submit(_http.get, "/todo/stalled", timeout=5)
+            todos = _json(_http.get("/todo/list", timeout=5)).get("todos", [])
+            stalled = _json(stalled_future.result()).get("stalled", [])
 
         console.print("\n[bold]Active Todos:[/bold]")
         if todos:
-            table = Table(title="Active Todos")
-            table.add_column("ID", style="cyan", width=10)
-            table.add_column("Task", style="white")
-            table.add_column("Due", style="yellow", width=12)
-            table.add_column("Priority", style="magenta", width=10)
-            for t in todos:
-                table.add_row(
-                    t.get("id", ""),
-                    t.get("text", "")[:60],
-                    t.get("due", ""),
-                    t.get("priority", ""),
-                )
-            console.print(table)
+            console.print(build_todo_table(todos))
         else:
             console.print("[dim]No active todos.[/dim]")
 
-        resp2 = httpx.get(_api_url("/todo/stalled"), timeout=5)
-        stalled = resp2.json().get("stalled", [])
         if stalled:
             console.print(f"\n[bold yellow]Stalled ({len(stalled)}):[/bold yellow]")
             for t in stalled:
@@ -681,14 +773,9 @@ def insight_suggest(
 ) -> None:
     """Show work suggestions based on today's activity."""
     if _service_is_running():
-        resp = httpx.get(_api_url("/suggest"), timeout=15)
-        data = resp.json()
-        suggestions = data.get("suggestions", "")
-        if "\u5de5\u4f5c\u5efa\u8bae" in suggestions:
-            idx = suggestions.index("\u5de5\u4f5c\u5efa\u8bae")
-            console.print(suggestions[idx:])
-        else:
-            console.print("[yellow]No suggestions available yet.[/yellow]")
+        resp = _http.get("/suggest", timeout=15)
+        data = _json(resp)
+        _print_suggestions(data.get("suggestions", ""))
         return
 
     _init_engine(config)
@@ -698,8 +785,13 @@ def insight_suggest(
 
     engine = _get_engine()
     report = build_daily_insight(date.today(), engine)
-    if "\u5de5\u4f5c\u5efa\u8bae" in report:
-        idx = report.index("\u5de5\u4f5c\u5efa\u8bae")
+    _print_suggestions(report)
+
+
+def _print_suggestions(report: str) -> None:
+    """Print the report from its work-suggestions section onward."""
+    idx = report.find("\u5de5\u4f5c\u5efa\u8bae")  # 工作建议
+    if idx != -1:
         console.print(report[idx:])
     else:
         console.print("[yellow]No suggestions available yet.[/yellow]")
@@ -722,7 +814,7 @@ def ihook_start() -> None:
 def ihook_stop() -> None:
     """Stop input method hook."""
     try:
-        httpx.post("http://127.0.0.1:8330/input-hook/stop", timeout=5)
+        _http.post("/input-hook/stop", timeout=5)
         console.print("[green]Input hook stopped.[/green]")
     except Exception:
         console.print("[red]Could not reach daemon.[/red]")
@@ -732,8 +824,8 @@ def ihook_stop() -> None:
 def ihook_status() -> None:
     """Check input hook status."""
     try:
-        resp = httpx.get("http://127.0.0.1:8330/input-hook/status", timeout=5)
-        console.print(resp.json())
+        resp = _http.get("/input-hook/status", timeout=5)
+        console.print(_json(resp))
     except Exception:
         console.print("[red]Daemon not running.[/red]")
 
@@ -752,8 +844,8 @@ def memory_ls(
         params: dict = {}
         if importance is not None:
             params["importance"] = importance
-        resp = httpx.get(_api_url("/memories"), params=params, timeout=5)
-        data = resp.json()
+        resp = _http.get("/memories", params=params, timeout=5)
+        data = _json(resp)
         memories = data.get("memories", [])
         if not memories:
             console.print("[dim]No memories found.[/dim]")
@@ -812,51 +904,17 @@ def memory_search(
     config: Optional[str] = typer.Option(None, "--config", "-c"),
 ) -> None:
     """Search long-term memories."""
-    if _service_is_running():
-        from rich.panel import Panel
-        from rich.text import Text
-
-        resp = httpx.get(_api_url("/memories/search"), params={"q": query, "limit": limit}, timeout=10)
-        data = resp.json()
-        items = data.get("results", [])
+    from soul_agent.modules.recall import render_memory_results
 
-        if not items:
-            console.print("[dim]No memories found.[/dim]")
-            return
-
-        console.print(f"\n[bold]Found {len(items)} memories for:[/bold] {query}\n")
-        for i, item in enumerate(items, 1):
-            snippet = item.get("snippet", "") or "[no content]"
-            panel = Panel(
-                Text(snippet[:300]),
-                title=f"[{i}] {item.get('filename', '')}",
-                border_style="blue",
-            )
-            console.print(panel)
+    if _service_is_running():
+        resp = _http.get("/memories/search", params={"q": query, "limit": limit}, timeout=10)
+        render_memory_results(query, _json(resp).get("results", []))
         return
 
     _init_engine(config)
-    from rich.panel import Panel
-    from rich.text import Text
-
     from soul_agent.modules.memory import search_memories_by_query
 
-    engine = _get_engine()
-    results = search_memories_by_query(query, engine, limit=limit)
-
-    if not results:
-        console.print("[dim]No memories found.[/dim]")
-        return
-
-    console.print(f"\n[bold]Found {len(results)} memories for:[/bold] {query}\n")
-    for i, item in enumerate(results, 1):
-        snippet = item.get("snippet", "") or "[no content]"
-        panel = Panel(
-            Text(snippet[:300]),
-            title=f"[{i}] {item.get('filename', '')}",
-            border_style="blue",
-        )
-        console.print(panel)
+    render_memory_results(query, search_memories_by_query(query, _get_engine(), limit=limit))
 
 
 # ── Claude Code ────────────────────────────────────────────────────────────
@@ -885,8 +943,8 @@ def soul_show(
 ) -> None:
     """Display current digital soul profile."""
     if _service_is_running():
-        resp = httpx.get(_api_url("/soul"), timeout=5)
-        data = resp.json()
+        resp = _http.get("/soul", timeout=5)
+        data = _json(resp)
         content = data.get("content", "")
         if content:
             console.print(content)
@@ -915,8 +973,8 @@ def soul_init(
         preset = typer.prompt("Describe yourself (identity, traits, preferences)")
 
     if _service_is_running():
-        resp = httpx.post(_api_url("/soul/init"), json={"preset": preset}, timeout=15)
-        data = resp.json()
+        resp = _http.post("/soul/init", json={"preset": preset}, timeout=15)
+        data = _json(resp)
         if data.get("status") == "ok":
             console.print("[green]Soul initialized (via service).[/green]")
         else:
@@ -931,6 +989,24 @@ def soul_init(
     console.print("[green]Soul initialized.[/green]")
 
 
+def _print_stream(chunks: Any) -> bool:
+    """Print text chunks as they arrive, framed like a single answer.
+
+    Returns False if there was nothing to print.
+    """
+    printed = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if not printed:
+            console.out("")
+            printed = True
+        console.out(chunk, end="", highlight=False)
+    if printed:
+        console.out("\n")
+    return printed
+
+
 @soul_app.command("chat")
 def soul_chat(
     question: Optional[str] = typer.Argument(None, help="Question to ask your digital soul."),
@@ -941,8 +1017,14 @@ def soul_chat(
         question = typer.prompt("Ask your soul")
 
     if _service_is_running():
-        resp = httpx.post(_api_url("/soul/chat"), json={"question": question}, timeout=30)
-        data = resp.json()
+        with _http.stream("POST", "/soul/chat/stream", json={"question": question}, timeout=30) as resp:
+            if resp.status_code == 200:
+                if not _print_stream(resp.iter_text()):
+                    console.print("[red]No answer returned.[/red]")
+                return
+        # Daemon predates the streaming endpoint
+        resp = _http.post("/soul/chat", json={"question": question}, timeout=30)
+        data = _json(resp)
         answer = data.get("answer", "")
         if answer:
             console.print(f"\n{answer}\n")
@@ -951,11 +1033,10 @@ def soul_chat(
         return
 
     _init_engine(config)
-    from soul_agent.modules.soul import chat_with_soul
+    from soul_agent.modules.soul import stream_chat_with_soul
 
     engine = _get_engine()
-    answer = chat_with_soul(question, engine)
-    console.print(f"\n{answer}\n")
+    _print_stream(stream_chat_with_soul(question, engine))
 
 
 @soul_app.command("evolve")
@@ -964,8 +1045,8 @@ def soul_evolve(
 ) -> None:
     """Manually trigger soul evolution based on recent memories and insights."""
     if _service_is_running():
-        resp = httpx.post(_api_url("/soul/evolve"), timeout=30)
-        data = resp.json()
+        resp = _http.post("/soul/evolve", timeout=30)
+        data = _json(resp)
         if data.get("evolved"):
             console.print("[green]Soul evolved.[/green]")
         else:
@@ -1001,12 +1082,25 @@ def soul_evolve(
         console.print("[dim]No evolution needed.[/dim]")
 
 
-def _get_engine():
-    """Helper to get the initialized engine instance."""
-    from soul_agent.core.vault import get_engine
+def main() -> None:
+    """Console entry point.
+
+    When argv names a sub-app (``soul todo add ...``), only that group is
+    converted to a click command; the other sub-apps are never built.
+    ``--help`` and top-level commands go through the full app.
+    """
+    import sys
+
+    name = sys.argv[1] if len(sys.argv) > 1 else ""
+    group = next((g for g in app.registered_groups if g.name == name), None)
+    if group is None:
+        app()
+        return
 
-    return get_engine()
+    trimmed = typer.Typer(name=app.info.name, help=app.info.help, no_args_is_help=True)
+    trimmed.registered_groups.append(group)
+    trimmed()
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "soul.json"
 _ENV_FILE = Path(__file__).parent.parent.parent / ".env"
+_VAR_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_DOTENV_LOADED = False
 
 
 def _load_dotenv() -> None:
-    """Load .env file into os.environ if it exists (does not overwrite)."""
+    """Load .env file into os.environ if it exists (does not overwrite).
+
+    Runs once per process; later calls are no-ops.
+    """
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _DOTENV_LOADED = True
     if not _ENV_FILE.exists():
         return
     for line in _ENV_FILE.read_text(encoding="utf-8").splitlines():
@@ -28,9 +39,10 @@ def _load_dotenv() -> None:
 def _expand_env_vars(obj: dict | list | str) -> dict | list | str:
     """Recursively expand ${VAR} references in config values."""
     if isinstance(obj, str):
-        for key, value in os.environ.items():
-            obj = obj.replace(f"${{{key}}}", value)
-        return obj
+        if "${" not in obj:
+            return obj
+        # Unset variables are left as-is
+        return _VAR_RE.sub(lambda m: os.environ.get(m.group(1), m.group(0)), obj)
     if isinstance(obj, dict):
         return {k: _expand_env_vars(v) for k, v in obj.items()}
     if isinstance(obj, list):
@@ -38,14 +50,22 @@ def _expand_env_vars(obj: dict | list | str) -> dict | list | str:
     return obj
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a config file; *mtime_ns* is part of the key so edits invalidate it."""
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+
 def load_config(config_path: str | Path | None = None) -> dict:
     """Load and return the configuration with env vars expanded."""
     _load_dotenv()
     path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    raw = json.loads(path.read_text(encoding="utf-8"))
-    return _expand_env_vars(raw)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    # Expansion rebuilds every dict/list, so callers never share the cached object
+    return _expand_env_vars(_load_config_cached(str(path), mtime_ns))
 
 
 def get_vault_path(config: dict) -> Path:
@@ -2,17 +2,166 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-import os
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    pass
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
-# Proxy env vars that interfere with OpenAI SDK (e.g. SOCKS proxy)
-_PROXY_VARS = ("http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY", "all_proxy", "ALL_PROXY")
+MODEL = "deepseek-chat"
+CACHE_FILE = "core/.llm_cache.sqlite"
+_CACHE_TTL = 7 * 86400
+_CACHE_MAX_ENTRIES = 2000
+# Responses also kept in memory, in front of SQLite
+_MEMO_MAX_ENTRIES = 256
+
+# DeepSeek clients keyed by API key, so calls share pooled connections
+_client_cache: dict[str, Any] = {}
+_client_lock = threading.Lock()
+
+
+def _get_client(api_key: str) -> Any:
+    """Return the cached OpenAI client for *api_key*, creating it once."""
+    with _client_lock:
+        client = _client_cache.get(api_key)
+        if client is None:
+            import httpx
+            from openai import OpenAI
+
+            client = OpenAI(
+                api_key=api_key,
+                base_url="https://api.deepseek.com",
+                # trust_env=False ignores SOCKS/HTTP proxy env vars that
+                # interfere with the SDK, without touching os.environ
+                http_client=httpx.Client(
+                    trust_env=False,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                ),
+            )
+            _client_cache[api_key] = client
+        return client
+
+
+class _LLMCache:
+    """SQLite-backed store of LLM responses with TTL and size-bounded eviction.
+
+    Recent entries are also kept in an in-process LRU so repeats within
+    one process skip the SQLite round trip.
+    """
+
+    def __init__(self, path: Path, ttl: float, max_entries: int) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memo: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._memo_max = min(_MEMO_MAX_ENTRIES, max_entries)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_ts ON responses (ts)")
+        self._conn.commit()
+
+    @staticmethod
+    def cache_key(system: str, prompt: str, max_tokens: int) -> str:
+        payload = json.dumps(
+            {"m": MODEL, "s": system, "p": prompt, "t": max_tokens},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            hit = self._memo.get(key)
+            if hit is not None and hit[1] > cutoff:
+                self._memo.move_to_end(key)
+                return hit[0]
+            row = self._conn.execute(
+                "SELECT response, ts FROM responses WHERE key = ? AND ts > ?",
+                (key, cutoff),
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+        return row[0]
+
+    def _remember(self, key: str, response: str, ts: float) -> None:
+        self._memo[key] = (response, ts)
+        self._memo.move_to_end(key)
+        if len(self._memo) > self._memo_max:
+            self._memo.popitem(last=False)
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            self._remember(key, response, time.time())
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            # Drop expired rows, then the oldest ones beyond the size cap
+            self._conn.execute(
+                "DELETE FROM responses WHERE ts <= ?", (time.time() - self.ttl,)
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY ts DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: _LLMCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def _get_response_cache(config: dict | None) -> _LLMCache | None:
+    """Return the shared response cache, or None when ``llm.cache.enabled`` is off.
+
+    Falls back to the VaultEngine config when *config* is not given, and
+    stores the database under the vault's ``core/`` directory.
+    """
+    global _response_cache
+    if config is None:
+        from .vault import get_engine
+
+        engine = get_engine()
+        if not engine._initialized:
+            return None
+        config = engine.config
+    settings = config.get("llm", {}).get("cache", {})
+    if not settings.get("enabled"):
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                from .config import get_vault_path
+
+                _response_cache = _LLMCache(
+                    get_vault_path(config) / CACHE_FILE,
+                    ttl=float(settings.get("ttl", _CACHE_TTL)),
+                    max_entries=int(settings.get("max_entries", _CACHE_MAX_ENTRIES)),
+                )
+            except (KeyError, OSError, sqlite3.Error) as e:
+                logger.warning("LLM cache unavailable: %s", e)
+                return None
+        return _response_cache
 
 
 def call_deepseek(
@@ -23,10 +172,13 @@ def call_deepseek(
 ) -> str:
     """Call DeepSeek chat API and return the response text.
 
-    Uses openai.OpenAI with DeepSeek base_url.
+    Uses a cached openai.OpenAI client with DeepSeek base_url. When
+    ``llm.cache.enabled`` is set, identical requests are answered from
+    the on-disk response cache.
     Returns empty string on any error.
     """
-    from openai import OpenAI
+    if not prompt.strip():
+        return ""
 
     from .config import get_deepseek_api_key
 
@@ -34,13 +186,20 @@ def call_deepseek(
     if not api_key:
         return ""
 
-    # Temporarily clear proxy env vars to avoid SOCKS/HTTP proxy interference
-    saved = {k: os.environ.pop(k) for k in _PROXY_VARS if k in os.environ}
+    cache = _get_response_cache(config)
+    cache_key = ""
+    if cache is not None:
+        cache_key = _LLMCache.cache_key(system, prompt, max_tokens)
+        try:
+            cached = cache.get(cache_key)
+        except sqlite3.Error as e:
+            logger.warning("LLM cache read failed: %s", e)
+            cached = None
+        if cached is not None:
+            return cached
+
     try:
-        client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.deepseek.com",
-        )
+        client = _get_client(api_key)
 
         messages: list[dict[str, str]] = []
         if system:
@@ -51,11 +210,17 @@ def call_deepseek(
         for attempt in range(2):
             try:
                 response = client.chat.completions.create(
-                    model="deepseek-chat",
+                    model=MODEL,
                     messages=messages,
                     max_tokens=max_tokens,
                 )
-                return response.choices[0].message.content or ""
+                text = response.choices[0].message.content or ""
+                if cache is not None and text:
+                    try:
+                        cache.put(cache_key, text)
+                    except sqlite3.Error as e:
+                        logger.warning("LLM cache write failed: %s", e)
+                return text
             except Exception as e:
                 last_err = e
                 logger.warning("DeepSeek API attempt %d failed: %s", attempt + 1, e)
@@ -65,5 +230,70 @@ def call_deepseek(
     except Exception as e:
         logger.error("DeepSeek API setup error: %s", e)
         return ""
-    finally:
-        os.environ.update(saved)
+
+
+def call_deepseek_many(
+    prompts: list[str],
+    system: str = "",
+    max_tokens: int = 512,
+    config: dict | None = None,
+    max_workers: int = 8,
+) -> list[str]:
+    """Run several independent ``call_deepseek`` requests concurrently.
+
+    Requests share the pooled client, so the batch takes roughly as long
+    as its slowest call. Results are returned in the order of *prompts*.
+    """
+    if len(prompts) <= 1:
+        return [call_deepseek(p, system=system, max_tokens=max_tokens, config=config) for p in prompts]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+        return list(pool.map(
+            lambda p: call_deepseek(p, system=system, max_tokens=max_tokens, config=config),
+            prompts,
+        ))
+
+
+def call_deepseek_stream(
+    prompt: str,
+    system: str = "",
+    max_tokens: int = 512,
+    config: dict | None = None,
+) -> Iterator[str]:
+    """Stream a DeepSeek chat completion, yielding text chunks as they arrive.
+
+    Yields nothing on any error before the first chunk, so callers can
+    detect failure the same way as an empty ``call_deepseek`` result.
+    The response cache is bypassed.
+    """
+    if not prompt.strip():
+        return
+
+    from .config import get_deepseek_api_key
+
+    api_key = get_deepseek_api_key(config)
+    if not api_key:
+        return
+
+    messages: list[dict[str, str]] = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+
+    try:
+        stream = _get_client(api_key).chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        for event in stream:
+            if not event.choices:
+                continue
+            delta = event.choices[0].delta.content
+            if delta:
+                yield delta
+    except Exception as e:
+        logger.error("DeepSeek streaming call failed: %s", e)
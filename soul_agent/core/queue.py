@@ -9,6 +9,7 @@ from __future__ import annotations
 import hashlib
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -18,7 +19,7 @@ from typing import Any
 # Data models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class IngestItem:
     """Raw item captured from any source before classification."""
 
@@ -28,7 +29,7 @@ class IngestItem:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedItem(IngestItem):
     """IngestItem after passing through the LLM classifier."""
 
@@ -45,9 +46,9 @@ class ClassifiedItem(IngestItem):
 # IngestQueue
 # ---------------------------------------------------------------------------
 
-def _text_hash(text: str) -> str:
-    """Return a short SHA-256 hex digest for dedup purposes."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _text_hash(text: str) -> bytes:
+    """Return a 16-byte BLAKE2b digest for dedup purposes."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
 
 class IngestQueue:
@@ -76,10 +77,11 @@ class IngestQueue:
 
         self._queue: list[IngestItem] = []
         self._lock = threading.Lock()
-        self._batch_ready = threading.Event()
+        # Signalled on every put; get_batch waits on it instead of polling
+        self._cond = threading.Condition(self._lock)
 
-        # dedup: hash -> timestamp of last seen
-        self._seen: dict[str, float] = {}
+        # dedup: hash -> timestamp first seen, in insertion (= time) order
+        self._seen: OrderedDict[bytes, float] = OrderedDict()
 
     # -- public API ---------------------------------------------------------
 
@@ -101,9 +103,7 @@ class IngestQueue:
 
             self._seen[h] = now
             self._queue.append(item)
-
-            if len(self._queue) >= self._batch_size:
-                self._batch_ready.set()
+            self._cond.notify()
 
         return True
 
@@ -124,32 +124,17 @@ class IngestQueue:
         present they are returned; if the queue is empty an empty list is
         returned.
         """
-        deadline = time.monotonic() + (timeout if timeout is not None else 1e9)
-
-        while True:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
-
-            wait_time = min(remaining, self._flush_interval)
-            triggered = self._batch_ready.wait(timeout=wait_time)
-
-            with self._lock:
-                if triggered or len(self._queue) > 0:
-                    batch = list(self._queue)
-                    self._queue.clear()
-                    self._batch_ready.clear()
-                    if batch:
-                        return batch
-
-            # If we get here, the event timed out and queue was empty.
-            # Loop to re-check against the outer deadline.
-
-        # Final drain on overall timeout expiry.
-        with self._lock:
-            batch = list(self._queue)
-            self._queue.clear()
-            self._batch_ready.clear()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        first_wait = self._flush_interval if timeout is None else min(self._flush_interval, timeout)
+
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._queue) >= self._batch_size, timeout=first_wait)
+            if not self._queue:
+                # Flush window passed with nothing queued: release on the first put
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is None or remaining > 0:
+                    self._cond.wait_for(lambda: len(self._queue) > 0, timeout=remaining)
+            batch, self._queue = self._queue, []
         return batch
 
     # -- internal -----------------------------------------------------------
@@ -157,6 +142,10 @@ class IngestQueue:
     def _purge_seen(self, now: float) -> None:
         """Remove dedup entries older than *dedup_window*."""
         cutoff = now - self._dedup_window
-        expired = [h for h, ts in self._seen.items() if ts < cutoff]
-        for h in expired:
-            del self._seen[h]
+        # Oldest entries come first, so stop at the first unexpired one
+        seen = self._seen
+        while seen:
+            ts = next(iter(seen.values()))
+            if ts >= cutoff:
+                break
+            seen.popitem(last=False)
@@ -0,0 +1,172 @@
+"""SQLite FTS5 index over vault markdown files for VaultEngine.search."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+INDEX_FILE = "core/.search_index.sqlite"
+
+# The trigram tokenizer can only use the index for tokens this long
+_MIN_MATCH_LEN = 3
+
+# File reads are I/O-bound, so fan out well past the core count
+READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Below this many changed files a refresh reads them inline
+_PARALLEL_READ_MIN = 8
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception:
+        return None
+
+
+def match_all(text: str, tokens: list[str]) -> str | None:
+    """Return *text* in searchable form if it contains every lowercased token, else None.
+
+    Tokens without case (CJK, digits, punctuation) are checked against the
+    raw text first, longest first, so most misses never pay for
+    ``text.lower()``. On a hit the returned string is ``text.lower()``, or
+    *text* itself when no token has case, so callers can locate tokens in
+    it without lowercasing again.
+    """
+    cased: list[str] = []
+    for t in sorted(tokens, key=len, reverse=True):
+        if t.upper() == t:
+            if t not in text:
+                return None
+        else:
+            cased.append(t)
+    if not cased:
+        return text
+    lower = text.lower()
+    return lower if all(t in lower for t in cased) else None
+
+
+def _fts_phrase(token: str) -> str:
+    """Quote *token* as an FTS5 phrase so operators in it are taken literally."""
+    return '"' + token.replace('"', '""') + '"'
+
+
+class SearchIndex:
+    """Full-text index of vault files, refreshed incrementally by mtime and size."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.executescript(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS docs "
+            "USING fts5(dir UNINDEXED, path UNINDEXED, body, tokenize='trigram');"
+            "CREATE TABLE IF NOT EXISTS files "
+            "(path TEXT PRIMARY KEY, doc_id INTEGER, mtime_ns INTEGER, size INTEGER);"
+        )
+        self._conn.commit()
+
+    def refresh(self, root: Path, subdirs: list[str]) -> None:
+        """Re-index files under *subdirs* that changed since the last refresh."""
+        with self._lock:
+            known: dict[str, tuple[int, int]] = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute(
+                    "SELECT path, mtime_ns, size FROM files"
+                )
+            }
+            seen: set[str] = set()
+            stale: list[tuple[str, Path, tuple[int, int]]] = []
+            for subdir in subdirs:
+                try:
+                    with os.scandir(root / subdir) as it:
+                        entries = [
+                            e for e in it
+                            if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()
+                        ]
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+                for entry in entries:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    rel_path = f"{subdir}/{entry.name}"
+                    seen.add(rel_path)
+                    key = (st.st_mtime_ns, st.st_size)
+                    if known.get(rel_path) != key:
+                        stale.append((rel_path, Path(entry.path), key))
+
+            # Read changed files concurrently (a cold build reads the whole
+            # vault); writes stay on this thread's connection
+            paths = [md_file for _, md_file, _ in stale]
+            if len(paths) >= _PARALLEL_READ_MIN:
+                with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+                    bodies = list(pool.map(_read_text, paths))
+            else:
+                bodies = [_read_text(p) for p in paths]
+            for (rel_path, _, key), body in zip(stale, bodies):
+                if body is not None:
+                    self._upsert(rel_path, body, key)
+
+            scope = set(subdirs)
+            for rel_path in known.keys() - seen:
+                if rel_path.rsplit("/", 1)[0] in scope:
+                    self._remove(rel_path)
+            self._conn.commit()
+
+    def upsert(self, rel_path: str, body: str, path: Path) -> None:
+        """Index *body* for *rel_path* right after it was written to *path*."""
+        st = path.stat()
+        with self._lock:
+            self._upsert(rel_path, body, (st.st_mtime_ns, st.st_size))
+            self._conn.commit()
+
+    def _upsert(self, rel_path: str, body: str, key: tuple[int, int]) -> None:
+        self._remove(rel_path)
+        cur = self._conn.execute(
+            "INSERT INTO docs (dir, path, body) VALUES (?, ?, ?)",
+            (rel_path.rsplit("/", 1)[0], rel_path, body),
+        )
+        self._conn.execute(
+            "INSERT INTO files (path, doc_id, mtime_ns, size) VALUES (?, ?, ?, ?)",
+            (rel_path, cur.lastrowid, key[0], key[1]),
+        )
+
+    def _remove(self, rel_path: str) -> None:
+        row = self._conn.execute("SELECT doc_id FROM files WHERE path = ?", (rel_path,)).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM docs WHERE rowid = ?", (row[0],))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+
+    def iter_matches(self, tokens: list[str], subdir: str) -> Iterator[tuple[str, str, str]]:
+        """Yield ``(rel_path, body, searchable)`` for files in *subdir* containing every token.
+
+        *searchable* is the form returned by :func:`match_all`.
+
+        Tokens long enough for the trigram index narrow the candidates in
+        SQL; every token is then checked with :func:`match_all` so results
+        keep the substring semantics of a plain scan.
+        """
+        sql = "SELECT path, body FROM docs WHERE dir = ?"
+        params: list[str] = [subdir]
+        long_tokens = [t for t in tokens if len(t) >= _MIN_MATCH_LEN]
+        if long_tokens:
+            sql += " AND docs MATCH ?"
+            params.append(" AND ".join(_fts_phrase(t) for t in long_tokens))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        for rel_path, body in rows:
+            searchable = match_all(body, tokens)
+            if searchable is not None:
+                yield rel_path, body, searchable
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
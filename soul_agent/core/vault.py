@@ -3,11 +3,30 @@
 from __future__ import annotations
 
 import atexit
-import re
+import fnmatch
+import mmap
+import os
+import sqlite3
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .config import get_vault_path, load_config
+from .search_index import INDEX_FILE, READ_WORKERS, SearchIndex, match_all
+
+# Files above this size are pre-checked through mmap before being decoded
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Files larger than this are read straight from disk, not kept in the read
+# cache; with _read_cached's maxsize this bounds the cache to about 16 MiB
+_READ_CACHE_MAX_SIZE = 64 * 1024
+
+# Number of striped file locks; must be a power of two
+_LOCK_STRIPES = 16
 
 # Vault subdirectories
 VAULT_DIRS = [
@@ -28,6 +47,12 @@ class VaultEngine:
     _config: dict | None = None
     _vault_root: Path | None = None
     _initialized: bool = False
+    _index: SearchIndex | None = None
+    _index_failed: bool = False
+    # Directories known to exist, so writes skip the mkdir syscall
+    _dir_cache: set[Path] = set()
+    # Writers to the same file serialize on one stripe; others run in parallel
+    _locks: tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
 
     def __new__(cls) -> VaultEngine:
         if cls._instance is None:
@@ -48,7 +73,17 @@ class VaultEngine:
     def _ensure_directories(self) -> None:
         """Create vault subdirectories if they don't exist."""
         for subdir in VAULT_DIRS:
-            (self._vault_root / subdir).mkdir(parents=True, exist_ok=True)
+            dir_path = self._vault_root / subdir
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._dir_cache.add(dir_path)
+
+    def _ensure_dir(self, dir_path: Path) -> None:
+        if dir_path not in self._dir_cache:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._dir_cache.add(dir_path)
+
+    def _lock_for(self, path: Path) -> threading.Lock:
+        return self._locks[hash(path) & (_LOCK_STRIPES - 1)]
 
     @property
     def vault_root(self) -> Path:
@@ -63,31 +98,71 @@ class VaultEngine:
         return self._config
 
     def read_resource(self, rel_path: str) -> str | None:
-        """Read a file from the vault. Returns None if not found."""
+        """Read a file from the vault. Returns None if not found.
+
+        Content is cached by inode, mtime and size, so unchanged files are
+        not re-read or re-decoded. The inode catches atomic replacements
+        that keep the size and land within the filesystem's mtime
+        granularity.
+        """
         try:
             path = self.vault_root / rel_path
-            if path.exists() and path.is_file():
+            st = path.stat()
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            if st.st_size > _READ_CACHE_MAX_SIZE:
                 return path.read_text(encoding="utf-8")
-            return None
+            return _read_cached(str(path), st.st_ino, st.st_mtime_ns, st.st_size)
         except Exception:
             return None
 
     def write_resource(self, content: str, directory: str, filename: str) -> None:
         """Write text content to a file in the vault."""
         dir_path = self.vault_root / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dir_path)
+        file_path = dir_path / filename
+        with self._lock_for(file_path):
+            try:
+                _atomic_write(file_path, content)
+            except FileNotFoundError:
+                # Directory was removed behind our back; recreate it
+                self._dir_cache.discard(dir_path)
+                self._ensure_dir(dir_path)
+                _atomic_write(file_path, content)
+        if self._index is not None:
+            try:
+                self._index.upsert(f"{directory}/{filename}", content, file_path)
+            except (OSError, sqlite3.Error):
+                pass
+
+    def append_resource(self, content: str, directory: str, filename: str) -> None:
+        """Append text content to a file in the vault, creating it if needed.
+
+        Only the new bytes are written. The search index picks the change
+        up from the file's mtime and size on its next refresh.
+        """
+        dir_path = self.vault_root / directory
+        self._ensure_dir(dir_path)
         file_path = dir_path / filename
-        file_path.write_text(content, encoding="utf-8")
+        with self._lock_for(file_path):
+            try:
+                _append(file_path, content)
+            except FileNotFoundError:
+                self._dir_cache.discard(dir_path)
+                self._ensure_dir(dir_path)
+                _append(file_path, content)
+
+    def list_resources(self, directory: str, pattern: str | None = None) -> list[str]:
+        """List .md filenames under a vault directory.
 
-    def list_resources(self, directory: str) -> list[str]:
-        """List .md filenames under a vault directory."""
+        *pattern* is an optional glob (e.g. ``"2026-W*.md"``) the names
+        must also match.
+        """
         try:
-            dir_path = self.vault_root / directory
-            if not dir_path.exists():
-                return []
-            return sorted(
-                f.name for f in dir_path.glob("*.md") if f.is_file()
-            )
+            names = [e.name for e in _iter_md_entries(self.vault_root / directory)]
+            if pattern is not None:
+                names = fnmatch.filter(names, pattern)
+            return sorted(names)
         except Exception:
             return []
 
@@ -107,19 +182,33 @@ class VaultEngine:
         try:
             src = self.vault_root / from_rel
             dst = self.vault_root / to_rel
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            src.rename(dst)
+            self._ensure_dir(dst.parent)
+            with ExitStack() as stack:
+                # Take both stripes in a fixed order so concurrent moves can't deadlock
+                for lock in sorted({self._lock_for(src), self._lock_for(dst)}, key=id):
+                    stack.enter_context(lock)
+                src.rename(dst)
             return True
         except Exception:
             return False
 
+    def _get_index(self) -> SearchIndex | None:
+        """Open the search index on first use; None if SQLite can't provide it."""
+        if self._index is None and not self._index_failed:
+            try:
+                self._index = SearchIndex(self.vault_root / INDEX_FILE)
+            except (OSError, sqlite3.Error):
+                self._index_failed = True
+        return self._index
+
     def search(self, query: str, directory: str | None = None, limit: int = 10) -> list[dict[str, Any]]:
         """Keyword search across vault markdown files.
 
         Tokenizes the query, matches files containing all tokens,
-        returns snippets with match context.
+        returns snippets with match context. Uses the FTS index, refreshed
+        for changed files first, and falls back to scanning the files.
         """
-        tokens = [t.lower() for t in re.split(r'\s+', query.strip()) if t]
+        tokens = query.lower().split()
         if not tokens:
             return []
 
@@ -129,30 +218,58 @@ class VaultEngine:
         else:
             search_dirs = ["logs", "insights", "memories", "core", "todos/active", "todos/done", "archive"]
 
-        results: list[dict[str, Any]] = []
+        index = self._get_index()
+        if index is not None:
+            try:
+                index.refresh(self.vault_root, search_dirs)
+                results: list[dict[str, Any]] = []
+                for subdir in search_dirs:
+                    for rel_path, text, searchable in index.iter_matches(tokens, subdir):
+                        results.append({
+                            "path": rel_path,
+                            "snippet": _extract_snippet(text, searchable, tokens[0]),
+                            "filename": rel_path.rsplit("/", 1)[-1],
+                        })
+                        if len(results) >= limit:
+                            return results
+                return results
+            except sqlite3.Error:
+                pass
+
+        return self._scan_search(tokens, search_dirs, limit)
+
+    def _scan_search(self, tokens: list[str], search_dirs: list[str], limit: int) -> list[dict[str, Any]]:
+        """Search by reading every file; used when the index is unavailable.
+
+        Files are matched on a thread pool; results keep directory order and
+        outstanding reads are cancelled once *limit* hits are collected.
+        """
+        candidates: list[tuple[str, Path]] = []
         for subdir in search_dirs:
-            dir_path = self.vault_root / subdir
-            if not dir_path.exists():
-                continue
-            for md_file in dir_path.glob("*.md"):
-                if not md_file.is_file():
-                    continue
-                try:
-                    text = md_file.read_text(encoding="utf-8")
-                except Exception:
-                    continue
-                lower_text = text.lower()
-                if all(t in lower_text for t in tokens):
-                    # Extract a snippet around the first match
-                    snippet = _extract_snippet(text, tokens[0])
-                    results.append({
-                        "path": f"{subdir}/{md_file.name}",
-                        "snippet": snippet,
-                        "filename": md_file.name,
-                    })
-                    if len(results) >= limit:
-                        return results
+            candidates.extend(
+                (subdir, Path(e.path)) for e in _iter_md_entries(self.vault_root / subdir)
+            )
 
+        results: list[dict[str, Any]] = []
+        if not candidates:
+            return results
+        pool = ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(candidates)))
+        try:
+            matches = pool.map(lambda c: _read_if_match(c[1], tokens), candidates)
+            for (subdir, md_file), match in zip(candidates, matches):
+                if match is None:
+                    continue
+                # Extract a snippet around the first match
+                snippet = _extract_snippet(match[0], match[1], tokens[0])
+                results.append({
+                    "path": f"{subdir}/{md_file.name}",
+                    "snippet": snippet,
+                    "filename": md_file.name,
+                })
+                if len(results) >= limit:
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         return results
 
     def append_log(self, text: str, source: str = "note") -> None:
@@ -161,18 +278,93 @@ class VaultEngine:
         append_daily_log(text, source, self)
 
     def close(self) -> None:
-        """No-op for vault (no connections to close)."""
+        """Close the search index connection."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._index_failed = False
         self._initialized = False
 
 
-def _extract_snippet(text: str, token: str, context_chars: int = 100) -> str:
-    """Extract a snippet around the first occurrence of token."""
-    lower = text.lower()
-    idx = lower.find(token.lower())
+@lru_cache(maxsize=256)
+def _read_cached(path_str: str, ino: int, mtime_ns: int, size: int) -> str:
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _iter_md_entries(dir_path: Path) -> list[os.DirEntry]:
+    """Return the visible ``.md`` files in *dir_path*, or [] if it doesn't exist.
+
+    Same selection as ``glob("*.md")`` plus ``is_file()``, but the file
+    type comes from readdir instead of one stat per entry.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return [
+                e for e in it
+                if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    """Write *content* to a temp file beside *path*, then rename it into place.
+
+    Readers never see a half-written note, and a crash leaves the old
+    version intact. The pid in the temp name keeps the CLI and daemon
+    from clobbering each other's temp file.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Sized so a whole batch of log entries goes out in a single write(2)
+_APPEND_BUFFER_SIZE = 128 * 1024
+
+
+def _append(path: Path, content: str) -> None:
+    with open(path, "a", encoding="utf-8", buffering=_APPEND_BUFFER_SIZE) as f:
+        f.write(content)
+
+
+def _read_if_match(md_file: Path, tokens: list[str]) -> tuple[str, str] | None:
+    """Return ``(text, searchable)`` if the file contains every token, else None.
+
+    Large files are first checked for their caseless tokens in an mmap,
+    so misses skip decoding the file at all.
+    """
+    try:
+        caseless = [t.encode("utf-8") for t in tokens if t.upper() == t]
+        with md_file.open("rb") as f:
+            size = md_file.stat().st_size
+            if caseless and size >= _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if any(mm.find(t) == -1 for t in sorted(caseless, key=len, reverse=True)):
+                        return None
+            text = f.read().decode("utf-8")
+    except Exception:
+        return None
+    searchable = match_all(text, tokens)
+    return None if searchable is None else (text, searchable)
+
+
+def _extract_snippet(text: str, lower_text: str, lower_token: str, context_chars: int = 100) -> str:
+    """Extract a snippet around the first occurrence of *lower_token*.
+
+    *lower_text* is the searchable form from ``match_all``, so the note
+    isn't lowercased a second time for every hit.
+    """
+    idx = lower_text.find(lower_token)
     if idx == -1:
         return text[:200]
     start = max(0, idx - context_chars)
-    end = min(len(text), idx + len(token) + context_chars)
+    end = min(len(text), idx + len(lower_token) + context_chars)
     snippet = text[start:end].replace("\n", " ").strip()
     if start > 0:
         snippet = "..." + snippet
@@ -8,15 +8,25 @@ daemon running on localhost:8330.
 from __future__ import annotations
 
 import json
+import time
 from datetime import date, timedelta
 from typing import Any
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional, from the "fast" extra
+    orjson = None
+
 # ── Constants ────────────────────────────────────────────────────────────────
 
 DAEMON_URL = "http://127.0.0.1:8330"
 
+# Seconds a read-mostly daemon response (insights, core memory) is reused
+READ_CACHE_TTL = 60
+_READ_CACHE_MAX = 64
+
 # ── Tool definitions ─────────────────────────────────────────────────────────
 
 TOOL_DEFINITIONS: list[dict[str, Any]] = [
@@ -189,25 +199,82 @@ RESOURCE_DEFINITIONS: list[dict[str, Any]] = [
 # ── HTTP helper ──────────────────────────────────────────────────────────────
 
 
-def _call_daemon(method: str, path: str, **kwargs: Any) -> dict | str:
+# Fail fast when the daemon isn't listening; searches still get 30s to answer
+_DAEMON_TIMEOUT = httpx.Timeout(connect=0.5, read=30.0, write=10.0, pool=1.0)
+
+_aclient: httpx.AsyncClient | None = None
+
+
+def _get_aclient() -> httpx.AsyncClient:
+    """Return the async daemon client, created on first use inside the event loop."""
+    global _aclient
+    if _aclient is None:
+        _aclient = httpx.AsyncClient(base_url=DAEMON_URL, timeout=_DAEMON_TIMEOUT)
+    return _aclient
+
+
+async def _aclose_client() -> None:
+    """Close the async daemon client, if one was opened."""
+    global _aclient
+    if _aclient is not None:
+        client, _aclient = _aclient, None
+        await client.aclose()
+
+
+async def _acall_daemon(method: str, path: str, **kwargs: Any) -> dict | str:
     """Make an HTTP request to the soul-agent daemon.
 
     Returns the parsed JSON dict on success, or an error string on failure.
     """
-    url = f"{DAEMON_URL}{path}"
     try:
-        with httpx.Client(timeout=30) as client:
-            response = client.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+        response = await _get_aclient().request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as exc:
         return f"HTTP {exc.response.status_code}: {exc.response.text}"
-    except httpx.ConnectError:
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         return "Error: soul-agent daemon is not running. Start it with 'soul service start'."
     except Exception as exc:
         return f"Error: {exc}"
 
 
+_read_cache: dict[tuple[str, str, str], tuple[float, dict]] = {}
+
+
+async def _acall_cached(path: str, params: dict[str, Any] | None = None) -> dict | str:
+    """GET *path* via :func:`_acall_daemon`, reusing successful responses for a while.
+
+    Entries are keyed by today's date as well, so "today" views roll over
+    at midnight. Error strings are never cached.
+    """
+    key = (path, json.dumps(params, sort_keys=True), date.today().isoformat())
+    now = time.monotonic()
+    hit = _read_cache.get(key)
+    if hit is not None and now - hit[0] < READ_CACHE_TTL:
+        return hit[1]
+
+    result = await _acall_daemon("GET", path, params=params)
+    if isinstance(result, dict):
+        if len(_read_cache) >= _READ_CACHE_MAX:
+            for k in [k for k, (ts, _) in _read_cache.items() if now - ts >= READ_CACHE_TTL]:
+                del _read_cache[k]
+            if len(_read_cache) >= _READ_CACHE_MAX:
+                del _read_cache[next(iter(_read_cache))]
+        _read_cache[key] = (now, result)
+    return result
+
+
+def _dumps(result: dict) -> str:
+    """Pretty-print a daemon response, using orjson when it's installed.
+
+    Both branches emit the same text: two-space indent and raw (not
+    \\u-escaped) non-ASCII characters.
+    """
+    if orjson is None:
+        return json.dumps(result, indent=2, ensure_ascii=False)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+
 # ── Tool handler ─────────────────────────────────────────────────────────────
 
 
@@ -219,7 +286,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
     if name == "soul_search":
         query = arguments.get("query", "")
         limit = arguments.get("limit", 10)
-        result = _call_daemon("GET", "/search", params={"q": query, "limit": limit})
+        result = await _acall_daemon("GET", "/search", params={"q": query, "limit": limit})
 
     elif name == "soul_recall":
         period = arguments.get("period", "today")
@@ -229,15 +296,13 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
             target = (date.today() - timedelta(days=7)).isoformat()
         else:
             target = (date.today() - timedelta(days=30)).isoformat()
-        result = _call_daemon(
+        result = await _acall_daemon(
             "GET", "/search", params={"q": f"recall since {target}", "limit": 20}
         )
 
     elif name == "soul_insight":
         target_date = arguments.get("date", date.today().isoformat())
-        result = _call_daemon(
-            "GET", f"/abstract/insights/daily-{target_date}.md"
-        )
+        result = await _acall_cached(f"/abstract/insights/daily-{target_date}.md")
 
     elif name == "soul_categories":
         period = arguments.get("period", "today")
@@ -245,14 +310,14 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
         params: dict[str, Any] = {"q": f"category breakdown {period}", "limit": 20}
         if category:
             params["q"] = f"category {category} {period}"
-        result = _call_daemon("GET", "/search", params=params)
+        result = await _acall_daemon("GET", "/search", params=params)
 
     elif name == "soul_todos":
         status = arguments.get("status", "active")
         if status == "all":
-            result = _call_daemon("GET", "/todo/list")
+            result = await _acall_daemon("GET", "/todo/list")
         else:
-            result = _call_daemon(
+            result = await _acall_daemon(
                 "GET", "/search", params={"q": f"todo {status}", "limit": 50}
             )
 
@@ -261,18 +326,21 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
         query = "suggest next actions"
         if focus:
             query = f"suggest next actions for {focus}"
-        result = _call_daemon("GET", "/search", params={"q": query, "limit": 10})
+        result = await _acall_daemon("GET", "/search", params={"q": query, "limit": 10})
 
     elif name == "soul_note":
         text = arguments.get("text", "")
         tags = arguments.get("tags", [])
         if tags:
             text = f"{text}\n\nTags: {', '.join(tags)}"
-        result = _call_daemon("POST", "/note", json={"text": text})
+        result = await _acall_daemon("POST", "/note", json={"text": text})
+        if isinstance(result, dict):
+            # A new note can change today's insight and core memory
+            _read_cache.clear()
 
     elif name == "soul_task_progress":
         todo_id = arguments.get("todo_id", "")
-        result = _call_daemon(
+        result = await _acall_daemon(
             "GET", "/search", params={"q": f"todo progress {todo_id}", "limit": 10}
         )
 
@@ -280,7 +348,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> str:
         result = f"Unknown tool: {name}"
 
     if isinstance(result, dict):
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     return result
 
 
@@ -294,28 +362,28 @@ async def handle_resource_read(uri: str) -> str:
     """
     if uri == "soul://insight/today":
         target = date.today().isoformat()
-        result = _call_daemon("GET", f"/abstract/insights/daily-{target}.md")
+        result = await _acall_cached(f"/abstract/insights/daily-{target}.md")
 
     elif uri == "soul://insight/week":
-        result = _call_daemon(
-            "GET", "/search", params={"q": "weekly insight recap", "limit": 20}
+        result = await _acall_cached(
+            "/search", params={"q": "weekly insight recap", "limit": 20}
         )
 
     elif uri == "soul://todos/active":
-        result = _call_daemon(
+        result = await _acall_daemon(
             "GET", "/search", params={"q": "todo active", "limit": 50}
         )
 
     elif uri == "soul://todos/stalled":
-        result = _call_daemon(
+        result = await _acall_daemon(
             "GET", "/search", params={"q": "todo stalled", "limit": 50}
         )
 
     elif uri == "soul://core/memory":
-        result = _call_daemon("GET", "/abstract/core/MEMORY.md")
+        result = await _acall_cached("/abstract/core/MEMORY.md")
 
     elif uri == "soul://stats/categories":
-        result = _call_daemon(
+        result = await _acall_daemon(
             "GET", "/search", params={"q": "category stats breakdown", "limit": 20}
         )
 
@@ -323,7 +391,7 @@ async def handle_resource_read(uri: str) -> str:
         result = f"Unknown resource: {uri}"
 
     if isinstance(result, dict):
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     return result
 
 
@@ -345,16 +413,27 @@ def run_mcp_server() -> None:
 
     server = Server("soul-agent")
 
+    # Built once; clients may list these at the start of every session
+    tools = [
+        types.Tool(
+            name=t["name"],
+            description=t["description"],
+            inputSchema=t["inputSchema"],
+        )
+        for t in TOOL_DEFINITIONS
+    ]
+    resources = [
+        types.Resource(
+            uri=r["uri"],
+            name=r["name"],
+            description=r["description"],
+        )
+        for r in RESOURCE_DEFINITIONS
+    ]
+
     @server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(
-                name=t["name"],
-                description=t["description"],
-                inputSchema=t["inputSchema"],
-            )
-            for t in TOOL_DEFINITIONS
-        ]
+        return tools
 
     @server.call_tool()
     async def call_tool(
@@ -365,28 +444,30 @@ def run_mcp_server() -> None:
 
     @server.list_resources()
     async def list_resources() -> list[types.Resource]:
-        return [
-            types.Resource(
-                uri=r["uri"],
-                name=r["name"],
-                description=r["description"],
-            )
-            for r in RESOURCE_DEFINITIONS
-        ]
+        return resources
 
     @server.read_resource()
     async def read_resource(uri: str) -> str:
         return await handle_resource_read(str(uri))
 
     async def _run() -> None:
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream,
-                write_stream,
-                server.create_initialization_options(),
-            )
-
-    asyncio.run(_run())
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream,
+                    write_stream,
+                    server.create_initialization_options(),
+                )
+        finally:
+            await _aclose_client()
+
+    # uvloop's C event loop speeds up the stdio transport when installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_run())
+    else:
+        uvloop.run(_run())
 
 
 if __name__ == "__main__":
@@ -9,15 +9,26 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any
+from typing import Any, Callable
 
-from ..core.llm import call_deepseek
+try:
+    import orjson
+except ImportError:  # optional, from the "fast" extra
+    orjson = None
+
+from ..core.llm import call_deepseek, call_deepseek_many
 from ..core.queue import ClassifiedItem, IngestItem
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
+# Max items per LLM prompt; matches the daemon's IngestQueue batch size so
+# only bursts larger than one queue batch are split and sent concurrently
+CLASSIFY_CHUNK_SIZE = 10
+# Texts shorter than this (after stripping) skip the LLM and use the rules
+MIN_LLM_TEXT_LEN = 2
+
 VALID_CATEGORIES = {"coding", "work", "learning", "communication", "browsing", "life"}
 
 SOURCE_CATEGORY_MAP: dict[str, str] = {
@@ -59,6 +70,11 @@ action_type 严格规则（必须遵守）：
 {items_block}
 """
 
+# The category list never changes, so substitute it into the template once
+_BATCH_PROMPT = BATCH_PROMPT_TEMPLATE.replace(
+    "{valid_categories}", ", ".join(sorted(VALID_CATEGORIES))
+)
+
 # ---------------------------------------------------------------------------
 # Fallback (rule-based) classification
 # ---------------------------------------------------------------------------
@@ -88,6 +104,13 @@ def fallback_classify(text: str, source: str) -> dict[str, Any]:
 _FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
 
 
+def _loads(text: str) -> Any:
+    """Decode JSON with orjson when it's installed, else the stdlib."""
+    if orjson is None:
+        return json.loads(text)
+    return orjson.loads(text)
+
+
 def _parse_llm_response(raw: str, count: int) -> list[dict[str, Any]]:
     """Parse the LLM JSON response into a list of classification dicts.
 
@@ -98,14 +121,15 @@ def _parse_llm_response(raw: str, count: int) -> list[dict[str, Any]]:
     if not text:
         return []
 
-    # Strip markdown fences if present
-    fence_match = _FENCE_RE.search(text)
-    if fence_match:
-        text = fence_match.group(1).strip()
+    # Strip markdown fences if present; bare JSON skips the regex scan
+    if text[0] not in "[{":
+        fence_match = _FENCE_RE.search(text)
+        if fence_match:
+            text = fence_match.group(1).strip()
 
     try:
-        parsed = json.loads(text)
-    except (json.JSONDecodeError, ValueError):
+        parsed = _loads(text)
+    except ValueError:
         return []
 
     if not isinstance(parsed, list):
@@ -122,6 +146,32 @@ def _parse_llm_response(raw: str, count: int) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+def _resolve_category(
+    entry: dict[str, Any],
+    source: str,
+    _valid: set[str] = VALID_CATEGORIES,
+    _by_source: dict[str, str] = SOURCE_CATEGORY_MAP,
+) -> str:
+    """Return the LLM's category if valid, else the default for *source*.
+
+    The lookup tables are bound as defaults so the per-item call reads
+    locals rather than module globals.
+    """
+    category = entry.get("category", "")
+    return category if category in _valid else _by_source.get(source, "work")
+
+
+def _todo_fields(todos: list[Any]) -> Callable[[Any], tuple[Any, Any]]:
+    """Return an ``(id, text)`` extractor for *todos*, chosen once from the first one.
+
+    A batch's todos all come from one source, so they are either all
+    dicts or all objects.
+    """
+    if isinstance(todos[0], dict):
+        return lambda t: (t.get("id", "?"), t.get("text", ""))
+    return lambda t: (getattr(t, "id", "?"), getattr(t, "text", ""))
+
+
 def classify_batch(
     items: list[IngestItem],
     active_todos: list[Any],
@@ -137,68 +187,72 @@ def classify_batch(
 
     # Build the todo context block
     if active_todos:
-        todo_lines = []
-        for t in active_todos:
-            tid = t.get("id", "?") if isinstance(t, dict) else getattr(t, "id", "?")
-            txt = t.get("text", "") if isinstance(t, dict) else getattr(t, "text", "")
-            todo_lines.append(f"  - [{tid}] {txt}")
-        todo_context = "Active todos:\n" + "\n".join(todo_lines)
+        todo_context = "Active todos:\n" + "\n".join(
+            f"  - [{tid}] {txt}" for tid, txt in map(_todo_fields(active_todos), active_todos)
+        )
     else:
         todo_context = "No active todos."
 
-    # Build items block
-    items_block_parts: list[str] = []
-    for idx, item in enumerate(items):
-        items_block_parts.append(
-            f"{idx + 1}. [{item.source}] {item.text}"
+    # Send each distinct (source, text) once; repeats share its entry.
+    # Trivial texts are left out and go straight to the rule-based path.
+    slot: dict[tuple[str, str], int] = {}
+    unique: list[IngestItem] = []
+    for item in items:
+        key = (item.source, item.text)
+        if key not in slot and len(item.text.strip()) >= MIN_LLM_TEXT_LEN:
+            slot[key] = len(unique)
+            unique.append(item)
+
+    # One prompt per chunk so long bursts don't overrun max_tokens
+    chunks = [
+        unique[start:start + CLASSIFY_CHUNK_SIZE]
+        for start in range(0, len(unique), CLASSIFY_CHUNK_SIZE)
+    ]
+    prompts = [
+        _BATCH_PROMPT.format(
+            count=len(chunk),
+            todo_context=todo_context,
+            items_block="\n".join(
+                f"{idx + 1}. [{item.source}] {item.text}" for idx, item in enumerate(chunk)
+            ),
         )
-    items_block = "\n".join(items_block_parts)
+        for chunk in chunks
+    ]
 
-    prompt = BATCH_PROMPT_TEMPLATE.format(
-        valid_categories=", ".join(sorted(VALID_CATEGORIES)),
-        count=len(items),
-        todo_context=todo_context,
-        items_block=items_block,
-    )
+    if not prompts:
+        raws = []
+    elif len(prompts) == 1:
+        raws = [call_deepseek(prompts[0], system=SYSTEM_PROMPT, max_tokens=1024, config=config)]
+    else:
+        raws = call_deepseek_many(prompts, system=SYSTEM_PROMPT, max_tokens=1024, config=config)
 
-    raw = call_deepseek(prompt, system=SYSTEM_PROMPT, max_tokens=1024, config=config)
-    parsed = _parse_llm_response(raw, count=len(items))
+    parsed: list[dict[str, Any] | None] = []
+    for chunk, raw in zip(chunks, raws):
+        chunk_parsed = _parse_llm_response(raw, count=len(chunk))
+        parsed.extend(chunk_parsed or [None] * len(chunk))
 
     results: list[ClassifiedItem] = []
-    for idx, item in enumerate(items):
-        if parsed and idx < len(parsed):
-            entry = parsed[idx]
-            category = entry.get("category", "")
-            if category not in VALID_CATEGORIES:
-                category = SOURCE_CATEGORY_MAP.get(item.source, "work")
-            classified = ClassifiedItem(
-                text=item.text,
-                source=item.source,
-                timestamp=item.timestamp,
-                meta=item.meta,
-                category=category,
-                tags=entry.get("tags", []),
-                importance=entry.get("importance", 3),
-                summary=entry.get("summary", ""),
-                action_type=entry.get("action_type"),
-                action_detail=entry.get("action_detail"),
-                related_todo_id=entry.get("related_todo_id"),
-            )
+    for item in items:
+        idx = slot.get((item.source, item.text))
+        entry = parsed[idx] if idx is not None else None
+        if entry is not None:
+            fields = {
+                "category": _resolve_category(entry, item.source),
+                "tags": entry.get("tags", []),
+                "importance": entry.get("importance", 3),
+                "summary": entry.get("summary", ""),
+                "action_type": entry.get("action_type"),
+                "action_detail": entry.get("action_detail"),
+                "related_todo_id": entry.get("related_todo_id"),
+            }
         else:
-            fb = fallback_classify(item.text, item.source)
-            classified = ClassifiedItem(
-                text=item.text,
-                source=item.source,
-                timestamp=item.timestamp,
-                meta=item.meta,
-                category=fb["category"],
-                tags=fb["tags"],
-                importance=fb["importance"],
-                summary=fb["summary"],
-                action_type=fb["action_type"],
-                action_detail=fb["action_detail"],
-                related_todo_id=fb["related_todo_id"],
-            )
-        results.append(classified)
+            fields = fallback_classify(item.text, item.source)
+        results.append(ClassifiedItem(
+            text=item.text,
+            source=item.source,
+            timestamp=item.timestamp,
+            meta=item.meta,
+            **fields,
+        ))
 
     return results
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -46,76 +47,112 @@ def build_hook_config() -> dict:
     }
 
 
+def _dump_settings(settings: dict) -> str:
+    return json.dumps(settings, indent=2) + "\n"
+
+
+def _rewrite(f: Any, raw: str, settings: dict) -> None:
+    """Write *settings* back over the open file *f* unless the text is unchanged."""
+    new = _dump_settings(settings)
+    if new != raw:
+        f.seek(0)
+        f.write(new)
+        f.truncate()
+
+
+def _has_marker(settings: dict) -> bool:
+    for group in settings.get("hooks", {}).get("postToolUse", []):
+        for hook in group.get("hooks", []):
+            if hook.get("description") == HOOK_MARKER:
+                return True
+    return False
+
+
+def _merge_hook(settings: dict) -> None:
+    hook_config = build_hook_config()
+    settings.setdefault("hooks", {}).setdefault("postToolUse", []).extend(
+        hook_config["hooks"]["postToolUse"]
+    )
+
+
 def install_hook() -> None:
     """Merge the soul-agent hook config into Claude Code settings.json.
 
     If the settings file does not exist it will be created.  If the hook
-    is already present the operation is a no-op.
+    is already present the operation is a no-op.  An existing file is
+    opened once for both the read and the rewrite.
     """
-    settings: dict = {}
-    if CLAUDE_SETTINGS.exists():
+    try:
+        f = CLAUDE_SETTINGS.open("r+", encoding="utf-8")
+    except FileNotFoundError:
+        settings: dict = {}
+        _merge_hook(settings)
+        CLAUDE_SETTINGS.parent.mkdir(parents=True, exist_ok=True)
+        CLAUDE_SETTINGS.write_text(_dump_settings(settings), encoding="utf-8")
+        logger.info("Claude Code hook installed in %s", CLAUDE_SETTINGS)
+        return
+    except OSError:
+        logger.warning("Could not open %s, hook not installed.", CLAUDE_SETTINGS)
+        return
+
+    with f:
+        raw = f.read()
         try:
-            settings = json.loads(CLAUDE_SETTINGS.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            settings = json.loads(raw) if raw.strip() else {}
+        except json.JSONDecodeError:
             logger.warning("Could not parse %s, starting fresh.", CLAUDE_SETTINGS)
+            settings = {}
 
-    # Check if already installed
-    existing_hooks = settings.get("hooks", {}).get("postToolUse", [])
-    for group in existing_hooks:
-        for hook in group.get("hooks", []):
-            if hook.get("description") == HOOK_MARKER:
-                logger.info("Claude Code hook already installed.")
-                return
-
-    # Merge
-    hook_config = build_hook_config()
-    if "hooks" not in settings:
-        settings["hooks"] = {}
-    if "postToolUse" not in settings["hooks"]:
-        settings["hooks"]["postToolUse"] = []
+        if _has_marker(settings):
+            logger.info("Claude Code hook already installed.")
+            return
 
-    settings["hooks"]["postToolUse"].extend(hook_config["hooks"]["postToolUse"])
-
-    CLAUDE_SETTINGS.parent.mkdir(parents=True, exist_ok=True)
-    CLAUDE_SETTINGS.write_text(
-        json.dumps(settings, indent=2) + "\n",
-        encoding="utf-8",
-    )
+        _merge_hook(settings)
+        _rewrite(f, raw, settings)
     logger.info("Claude Code hook installed in %s", CLAUDE_SETTINGS)
 
 
 def uninstall_hook() -> None:
-    """Remove the soul-agent hook from Claude Code settings.json."""
-    if not CLAUDE_SETTINGS.exists():
-        logger.info("No Claude settings file found, nothing to remove.")
-        return
+    """Remove the soul-agent hook from Claude Code settings.json.
 
+    The file is left untouched when it holds no soul-agent hook.
+    """
     try:
-        settings = json.loads(CLAUDE_SETTINGS.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        logger.warning("Could not parse %s, nothing to remove.", CLAUDE_SETTINGS)
+        f = CLAUDE_SETTINGS.open("r+", encoding="utf-8")
+    except FileNotFoundError:
+        logger.info("No Claude settings file found, nothing to remove.")
         return
-
-    existing_hooks = settings.get("hooks", {}).get("postToolUse", [])
-    if not existing_hooks:
-        logger.info("No hooks found in settings.")
+    except OSError:
+        logger.warning("Could not open %s, nothing to remove.", CLAUDE_SETTINGS)
         return
 
-    # Filter out our hook groups
-    filtered = []
-    for group in existing_hooks:
-        filtered_hooks = [
-            h for h in group.get("hooks", [])
-            if h.get("description") != HOOK_MARKER
-        ]
-        if filtered_hooks:
-            group["hooks"] = filtered_hooks
-            filtered.append(group)
-
-    settings["hooks"]["postToolUse"] = filtered
-
-    CLAUDE_SETTINGS.write_text(
-        json.dumps(settings, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    with f:
+        raw = f.read()
+        try:
+            settings = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Could not parse %s, nothing to remove.", CLAUDE_SETTINGS)
+            return
+
+        existing_hooks = settings.get("hooks", {}).get("postToolUse", [])
+        if not existing_hooks:
+            logger.info("No hooks found in settings.")
+            return
+        if not _has_marker(settings):
+            logger.info("Claude Code hook not installed, nothing to remove.")
+            return
+
+        # Filter out our hook groups
+        filtered = []
+        for group in existing_hooks:
+            filtered_hooks = [
+                h for h in group.get("hooks", [])
+                if h.get("description") != HOOK_MARKER
+            ]
+            if filtered_hooks:
+                group["hooks"] = filtered_hooks
+                filtered.append(group)
+
+        settings["hooks"]["postToolUse"] = filtered
+        _rewrite(f, raw, settings)
     logger.info("Claude Code hook removed from %s", CLAUDE_SETTINGS)
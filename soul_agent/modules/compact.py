@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import calendar
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
-from ..core.frontmatter import build_frontmatter
+from ..core.frontmatter import build_frontmatter, parse_frontmatter
 from ..core.llm import call_deepseek
 from .daily_log import LOGS_DIR, get_daily_log
 
@@ -14,6 +17,9 @@ if TYPE_CHECKING:
 
 INSIGHTS_DIR = "insights"
 
+# Vault reads for a monthly report are fanned out over this many threads
+_READ_WORKERS = 8
+
 WEEKLY_PROMPT = """\
 You are a personal memory analyst. Given the following daily logs and context
 from a week, produce a structured weekly report in markdown with these sections:
@@ -64,6 +70,30 @@ def _month_label(target_date: date) -> str:
     return target_date.strftime("%Y-%m")
 
 
+def _read_all(read: Callable[[Any], str | None], keys: list[Any]) -> list[str | None]:
+    """Call *read* for every key on a small thread pool, keeping the order of *keys*."""
+    if len(keys) <= 1:
+        return [read(k) for k in keys]
+    with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(keys))) as pool:
+        return list(pool.map(read, keys))
+
+
+def _source_hash(system: str, prompt: str) -> str:
+    """Return a short digest of the LLM input a report was generated from."""
+    return hashlib.blake2b(f"{system}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _unchanged_report(engine: VaultEngine, rel_path: str, source_hash: str) -> str | None:
+    """Return the body of the report at *rel_path* if it was built from *source_hash*."""
+    existing = engine.read_resource(rel_path)
+    if not existing:
+        return None
+    fields, body = parse_frontmatter(existing)
+    if fields.get("source_hash") == source_hash and body:
+        return body
+    return None
+
+
 def compact_week(target_date: date, engine: VaultEngine) -> str:
     """Generate a weekly report from daily logs.
 
@@ -110,6 +140,15 @@ def compact_week(target_date: date, engine: VaultEngine) -> str:
         f"{context}"
     )
 
+    label = _week_label(target_date)
+    filename = f"{label}.md"
+
+    # Same logs as the last run: keep that report instead of calling the LLM
+    source_hash = _source_hash(WEEKLY_PROMPT, prompt)
+    unchanged = _unchanged_report(engine, f"{INSIGHTS_DIR}/{filename}", source_hash)
+    if unchanged is not None:
+        return unchanged
+
     report = call_deepseek(
         prompt=prompt,
         system=WEEKLY_PROMPT,
@@ -117,15 +156,15 @@ def compact_week(target_date: date, engine: VaultEngine) -> str:
         config=engine.config,
     )
 
-    if not report:
+    fields = {"type": "weekly-report", "week": label}
+    if report:
+        fields["source_hash"] = source_hash
+    else:
         # Fallback: simple concatenation
-        report = f"# Week {_week_label(target_date)}\n\n" + "\n\n".join(logs)
+        report = f"# Week {label}\n\n" + "\n\n".join(logs)
 
     # Write report
-    label = _week_label(target_date)
-    fields = {"type": "weekly-report", "week": label}
     content = build_frontmatter(fields, report)
-    filename = f"{label}.md"
 
     # Remove old version if exists
     engine.delete_resource(f"{INSIGHTS_DIR}/{filename}")
@@ -150,26 +189,23 @@ def compact_month(target_date: date, engine: VaultEngine) -> str:
     month = target_date.month
 
     # Collect weekly reports for this month
-    weekly_reports: list[str] = []
-    entries = engine.list_resources(INSIGHTS_DIR)
-    for name in entries:
-        if name.startswith(f"{year}-W") and name.endswith(".md"):
-            content = engine.read_resource(f"{INSIGHTS_DIR}/{name}")
-            if content:
-                weekly_reports.append(f"### {name.replace('.md', '')}\n{content}")
+    names = engine.list_resources(INSIGHTS_DIR, pattern=f"{year}-W*.md")
+    weekly_reports = [
+        f"### {name.replace('.md', '')}\n{content}"
+        for name, content in zip(
+            names, _read_all(engine.read_resource, [f"{INSIGHTS_DIR}/{n}" for n in names])
+        )
+        if content
+    ]
 
     # Also collect daily logs for the month as fallback context
     daily_context: list[str] = []
     if not weekly_reports:
-        day = date(year, month, 1)
-        while day.month == month:
-            log = get_daily_log(day, engine)
-            if log:
-                daily_context.append(f"### {day.isoformat()}\n{log[:200]}")
-            try:
-                day = day + timedelta(days=1)
-            except (ValueError, OverflowError):
-                break
+        days = [date(year, month, d) for d in range(1, calendar.monthrange(year, month)[1] + 1)]
+        logs = _read_all(lambda d: get_daily_log(d, engine), days)
+        daily_context = [
+            f"### {day.isoformat()}\n{log[:200]}" for day, log in zip(days, logs) if log
+        ]
 
     if not weekly_reports and not daily_context:
         return ""
@@ -177,6 +213,13 @@ def compact_month(target_date: date, engine: VaultEngine) -> str:
     context = "\n\n".join(weekly_reports) if weekly_reports else "\n\n".join(daily_context)
     prompt = f"Month: {month_label}\n\n{context}"
 
+    filename = f"{month_label}.md"
+
+    source_hash = _source_hash(MONTHLY_PROMPT, prompt)
+    unchanged = _unchanged_report(engine, f"{INSIGHTS_DIR}/{filename}", source_hash)
+    if unchanged is not None:
+        return unchanged
+
     report = call_deepseek(
         prompt=prompt,
         system=MONTHLY_PROMPT,
@@ -184,13 +227,14 @@ def compact_month(target_date: date, engine: VaultEngine) -> str:
         config=engine.config,
     )
 
-    if not report:
+    fields = {"type": "monthly-report", "month": month_label}
+    if report:
+        fields["source_hash"] = source_hash
+    else:
         report = f"# Month {month_label}\n\n" + context
 
     # Write report
-    fields = {"type": "monthly-report", "month": month_label}
     content = build_frontmatter(fields, report)
-    filename = f"{month_label}.md"
 
     engine.delete_resource(f"{INSIGHTS_DIR}/{filename}")
 
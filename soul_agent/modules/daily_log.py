@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
 import threading
+import time
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
@@ -11,18 +14,120 @@ from ..core.frontmatter import build_frontmatter, parse_frontmatter
 if TYPE_CHECKING:
     from ..core.vault import VaultEngine
 
+logger = logging.getLogger(__name__)
+
 LOGS_DIR = "logs"
 
-# In-memory cache for today's log to avoid repeated reads
+# Appends are written at most every FLUSH_INTERVAL seconds or FLUSH_BATCH
+# entries; a timer writes whatever is left over
+FLUSH_INTERVAL = 2.0
+FLUSH_BATCH = 16
+
+# In-memory cache for today's log to avoid repeated reads. _log_lock only
+# guards memory; _flush_lock serializes vault writes and is taken first.
 _log_lock = threading.Lock()
-_today_cache: dict[str, str] = {}  # date_str -> accumulated body text
+_flush_lock = threading.Lock()
+# date_str -> body pieces (the stored body, then one per entry), joined
+# with "\n" only when the log is written or read
+_today_cache: dict[str, list[str]] = {}
 _today_fields: dict[str, dict] = {}  # date_str -> frontmatter fields
+# date_str -> serialized frontmatter block; fields don't change once seeded
+_today_prefix: dict[str, str] = {}
+# date_str -> how many body pieces are already on disk; None until the
+# file exists, after which flushes append only the new pieces
+_written: dict[str, int | None] = {}
+
+# Buffered appends not yet written to the vault (all guarded by _log_lock)
+_dirty: set[str] = set()  # date_strs whose cached log is ahead of disk
+_pending_count = 0
+_last_flush = float("-inf")
+_flush_timer: threading.Timer | None = None
+_flush_engine: VaultEngine | None = None
 
 
 def clear_daily_log_cache() -> None:
     """Clear the in-memory daily log cache. Used for testing."""
-    _today_cache.clear()
-    _today_fields.clear()
+    global _pending_count, _last_flush, _flush_engine
+    with _log_lock:
+        _cancel_timer()
+        _today_cache.clear()
+        _today_fields.clear()
+        _today_prefix.clear()
+        _written.clear()
+        _dirty.clear()
+        _pending_count = 0
+        _last_flush = float("-inf")
+        _flush_engine = None
+
+
+def _cancel_timer() -> None:
+    global _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+
+
+def _take_batch() -> list[tuple[str, str, bool, int]]:
+    """Snapshot dirty days as ``(day, text, full, count)``; caller holds ``_log_lock``.
+
+    *full* means *text* is the whole file, otherwise it is appended.
+    *count* is how many body pieces will be on disk once it is written.
+    """
+    global _pending_count, _last_flush
+    _cancel_timer()
+    batch = []
+    for day in sorted(_dirty):
+        pieces = _today_cache[day]
+        done = _written.get(day)
+        if done is None:
+            batch.append((day, _render(day), True, len(pieces)))
+        else:
+            batch.append((day, "\n" + "\n".join(pieces[done:]), False, len(pieces)))
+    _dirty.clear()
+    _pending_count = 0
+    _last_flush = time.monotonic()
+    return batch
+
+
+def _flush(engine: VaultEngine) -> None:
+    """Write every dirty day's log to the vault.
+
+    The in-memory state is snapshotted under ``_log_lock`` and the
+    writes happen outside it, so appenders and readers aren't held up
+    by disk I/O. ``_flush_lock`` keeps concurrent flushes in order.
+    """
+    with _flush_lock:
+        with _log_lock:
+            batch = _take_batch()
+        for i, (day, text, full, count) in enumerate(batch):
+            try:
+                if full:
+                    engine.write_resource(content=text, directory=LOGS_DIR, filename=f"{day}.md")
+                else:
+                    engine.append_resource(content=text, directory=LOGS_DIR, filename=f"{day}.md")
+            except Exception:
+                # Leave the unwritten days dirty so the next flush retries them
+                with _log_lock:
+                    _dirty.update(d for d, *_ in batch[i:])
+                raise
+            with _log_lock:
+                _written[day] = count
+
+
+def flush_daily_log() -> None:
+    """Write any buffered daily log entries to the vault now."""
+    with _log_lock:
+        engine = _flush_engine
+        if not _dirty or engine is None:
+            _cancel_timer()
+            return
+    try:
+        _flush(engine)
+    except Exception as e:
+        logger.warning("Daily log flush failed: %s", e)
+
+
+atexit.register(flush_daily_log)
 
 
 def _seed_cache(today: str, engine: VaultEngine) -> None:
@@ -35,12 +140,26 @@ def _seed_cache(today: str, engine: VaultEngine) -> None:
     if content:
         fields, body = parse_frontmatter(content)
         _today_fields[today] = fields
-        _today_cache[today] = body or ""
-        return
+        _today_cache[today] = [body] if body else []
+        _written[today] = len(_today_cache[today])
+    else:
+        # No existing log — initialize empty
+        _today_fields[today] = {"date": today}
+        _today_cache[today] = []
+        _written[today] = None
+    _today_prefix[today] = build_frontmatter(_today_fields[today])
+
 
-    # No existing log — initialize empty
-    _today_fields[today] = {"date": today}
-    _today_cache[today] = ""
+def _render(day: str) -> str:
+    """Return the cached log for *day* as file content; caller holds ``_log_lock``.
+
+    Same output as ``build_frontmatter(fields, body)``, reusing the
+    frontmatter block serialized when the day was seeded.
+    """
+    pieces = _today_cache[day]
+    if not pieces:
+        return _today_prefix[day]
+    return _today_prefix[day] + "\n" + "\n".join(pieces)
 
 
 def append_daily_log(
@@ -51,9 +170,14 @@ def append_daily_log(
     tags: list[str] | None = None,
     importance: int = 3,
 ) -> None:
-    """Append a timestamped entry to today's daily log."""
+    """Append a timestamped entry to today's daily log.
+
+    The first entry after a quiet spell is written straight away; bursts
+    are batched and written by count, by interval, or by
+    :func:`flush_daily_log`.
+    """
+    global _pending_count, _flush_engine, _flush_timer
     today = date.today().isoformat()
-    filename = f"{today}.md"
     now = datetime.now().strftime("%H:%M")
     cat_tag = f" [{category}]" if category else ""
     entry = f"[{now}] ({source}){cat_tag} {text}"
@@ -61,18 +185,19 @@ def append_daily_log(
     with _log_lock:
         _seed_cache(today, engine)
 
-        if _today_cache[today]:
-            _today_cache[today] += "\n" + entry
-        else:
-            _today_cache[today] = entry
+        _today_cache[today].append(entry)
 
-        content = build_frontmatter(_today_fields[today], _today_cache[today])
+        _dirty.add(today)
+        _pending_count += 1
+        _flush_engine = engine
+        due = _pending_count >= FLUSH_BATCH or time.monotonic() - _last_flush >= FLUSH_INTERVAL
+        if not due and _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, flush_daily_log)
+            _flush_timer.daemon = True
+            _flush_timer.start()
 
-        engine.write_resource(
-            content=content,
-            directory=LOGS_DIR,
-            filename=filename,
-        )
+    if due:
+        _flush(engine)
 
 
 def get_daily_log(target_date: date, engine: VaultEngine) -> str | None:
@@ -81,8 +206,8 @@ def get_daily_log(target_date: date, engine: VaultEngine) -> str | None:
 
     # For today, use the in-memory cache if available
     with _log_lock:
-        if today_str in _today_cache and _today_cache[today_str]:
-            return build_frontmatter(_today_fields[today_str], _today_cache[today_str])
+        if _today_cache.get(today_str):
+            return _render(today_str)
 
     # For past days, read from storage
     rel_path = f"{LOGS_DIR}/{today_str}.md"
@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import stat
 import threading
 import time as _time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -63,6 +67,12 @@ BINARY_EXTENSIONS = frozenset({
     ".crdownload", ".part", ".download",  # Partial downloads
 })
 
+# Any ignored directory name as a whole path component, in one regex
+# search instead of a loop over Path.parts
+_IGNORE_DIR_RE = re.compile(
+    r"(?:^|[\\/])(?:" + "|".join(re.escape(d) for d in sorted(IGNORE_DIRS)) + r")(?:[\\/]|$)"
+)
+
 # Extensions where content preview adds noise, not value
 _SKIP_PREVIEW_EXTENSIONS = frozenset({
     ".json", ".plist", ".xml", ".yaml", ".yml",  # Config/data — often huge, rarely insightful
@@ -73,6 +83,9 @@ _SKIP_PREVIEW_EXTENSIONS = frozenset({
     ".skill",  # Claude skill files
 })
 
+# Larger files get no preview; they are rarely hand-written notes
+_PREVIEW_MAX_FILE_SIZE = 1_000_000
+
 DEFAULT_WATCH_DIRS = [
     str(Path.home() / "Desktop"),
     str(Path.home() / "Documents"),
@@ -85,9 +98,13 @@ DEFAULT_WATCH_DIRS = [
 # ---------------------------------------------------------------------------
 
 def _should_ignore(path: str | Path) -> bool:
-    """Return True if the path should be ignored by the file watcher."""
-    p = Path(path)
-    name = p.name
+    """Return True if the path should be ignored by the file watcher.
+
+    Works on the path string directly; this runs for every filesystem
+    event, so it avoids building a ``Path``.
+    """
+    path = os.fspath(path)
+    name = path[max(path.rfind("/"), path.rfind(os.sep)) + 1:]
 
     # Ignore empty names or whitespace-only
     if not name or not name.strip():
@@ -102,7 +119,8 @@ def _should_ignore(path: str | Path) -> bool:
         return True
 
     # Ignore binary extensions
-    if p.suffix.lower() in BINARY_EXTENSIONS:
+    dot = name.rfind(".")
+    if dot > 0 and name[dot:].lower() in BINARY_EXTENSIONS:
         return True
 
     # Ignore editor temp/swap files (e.g., "insight.py.tmp.71819.1772270157689")
@@ -110,37 +128,51 @@ def _should_ignore(path: str | Path) -> bool:
         return True
 
     # Ignore paths containing ignored directory names
-    parts = p.parts
-    for part in parts:
-        if part in IGNORE_DIRS:
-            return True
-
-    return False
+    return _IGNORE_DIR_RE.search(path) is not None
 
 
 def _extract_preview(path: str | Path, max_chars: int = 200) -> str:
     """Read the first *max_chars* characters from a text file.
 
-    Returns an empty string if the file cannot be read, is binary,
-    or has an extension in ``_SKIP_PREVIEW_EXTENSIONS``.
+    Returns an empty string if the file cannot be read, is binary, is
+    larger than ``_PREVIEW_MAX_FILE_SIZE``, or has an extension in
+    ``_SKIP_PREVIEW_EXTENSIONS``. Only the bytes needed for *max_chars*
+    are read, in a single ``os.read``.
     """
     try:
-        p = Path(path)
-        if not p.exists() or not p.is_file():
-            return ""
+        path = os.fspath(path)
         # Skip extensions where preview is just noise
-        if p.suffix.lower() in _SKIP_PREVIEW_EXTENSIONS:
+        name = path[max(path.rfind("/"), path.rfind(os.sep)) + 1:]
+        dot = name.rfind(".")
+        if dot > 0 and name[dot:].lower() in _SKIP_PREVIEW_EXTENSIONS:
             return ""
-        with open(p, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read(max_chars)
-        # Reject content that looks binary (contains null bytes or control chars)
-        if "\x00" in content or "\ufffd" in content[:50]:
+        # Stat before opening: opening a FIFO for reading would block
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode) or st.st_size > _PREVIEW_MAX_FILE_SIZE:
             return ""
-        return content
+        # Editors fire several events per save; unchanged files hit the cache
+        return _read_preview_cached(path, st.st_mtime_ns, st.st_size, max_chars)
     except Exception:
         return ""
 
 
+@lru_cache(maxsize=1024)
+def _read_preview_cached(path: str, mtime_ns: int, size: int, max_chars: int) -> str:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # A UTF-8 character is at most 4 bytes
+        raw = os.read(fd, max_chars * 4)
+    finally:
+        os.close(fd)
+    # Reject content that looks binary (contains null bytes or control chars)
+    if b"\x00" in raw:
+        return ""
+    content = raw.decode("utf-8", errors="replace")[:max_chars]
+    if "\ufffd" in content[:50]:
+        return ""
+    return content
+
+
 # ---------------------------------------------------------------------------
 # Watchdog handler
 # ---------------------------------------------------------------------------
@@ -153,7 +185,8 @@ class _FileHandler:
 
     def __init__(self, queue: IngestQueue) -> None:
         self._queue = queue
-        self._recent: dict[str, float] = {}  # path -> last event timestamp
+        # path -> last accepted event time, oldest first
+        self._recent: OrderedDict[str, float] = OrderedDict()
 
     def dispatch(self, event) -> None:  # noqa: ANN001
         """Called by watchdog for every filesystem event."""
@@ -174,15 +207,16 @@ class _FileHandler:
 
         # Dedup: suppress created+modified double-fires within window
         now = _time.monotonic()
-        last = self._recent.get(src_path, 0.0)
-        if now - last < _DEDUP_WINDOW:
+        recent = self._recent
+        # Expire from the oldest end, so the dict only holds the live window
+        while recent:
+            path, ts = next(iter(recent.items()))
+            if now - ts < _DEDUP_WINDOW:
+                break
+            del recent[path]
+        if src_path in recent:
             return
-        self._recent[src_path] = now
-
-        # Prune stale entries periodically
-        if len(self._recent) > 200:
-            cutoff = now - _DEDUP_WINDOW * 2
-            self._recent = {k: v for k, v in self._recent.items() if v > cutoff}
+        recent[src_path] = now
 
         self._handle_file_event(src_path, event_type)
 
@@ -222,14 +256,16 @@ def start_file_watcher(
     watch_dirs:
         Directories to watch.  Defaults to ~/Desktop, ~/Documents, ~/Downloads.
 
-    Returns ``(observer, stop_event)``.  Set stop_event to trigger shutdown.
+    Returns ``(observer, running_event)``.  Like the other monitors the
+    event is set while active; stop the watcher with ``observer.stop()``
+    and clear the event.
     """
     from watchdog.observers import Observer
 
     dirs = watch_dirs or DEFAULT_WATCH_DIRS
     handler = _FileHandler(queue)
-    stop_event = threading.Event()
-    stop_event.set()
+    running = threading.Event()
+    running.set()
 
     observer = Observer()
     observer.daemon = True
@@ -242,4 +278,4 @@ def start_file_watcher(
             logger.debug("Skipping non-existent directory: %s", d)
 
     observer.start()
-    return observer, stop_event
+    return observer, running
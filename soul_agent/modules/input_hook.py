@@ -281,6 +281,9 @@ def run_standalone(service_url: str = "http://127.0.0.1:8330") -> None:
 
     import httpx
 
+    # One keep-alive connection for every flush instead of one per post
+    client = httpx.Client(base_url=service_url, timeout=3)
+
     _hook_status["active"] = True
     flush_interval = 5.0
     last_flush_time = time.monotonic()
@@ -300,10 +303,9 @@ def run_standalone(service_url: str = "http://127.0.0.1:8330") -> None:
             text = "".join(text_buffer)
             text_buffer.clear()
         try:
-            httpx.post(
-                f"{service_url}/ingest/claudecode",
+            client.post(
+                "/ingest/claudecode",
                 json={"text": f"Typed text: {text}"},
-                timeout=3,
             )
             _hook_status["flushes"] = int(_hook_status.get("flushes", 0)) + 1
             _hook_status["last_flush"] = datetime.now(tz=timezone.utc).isoformat()
@@ -356,6 +358,7 @@ def run_standalone(service_url: str = "http://127.0.0.1:8330") -> None:
     if tap is None:
         print("Error: Failed to create CGEventTap. Check accessibility permissions.")
         _hook_status["active"] = False
+        client.close()
         return
 
     run_loop_source = Quartz.CFMachPortCreateRunLoopSource(None, tap, 0)
@@ -374,5 +377,6 @@ def run_standalone(service_url: str = "http://127.0.0.1:8330") -> None:
         pass
     finally:
         _flush()
+        client.close()
         _hook_status["active"] = False
         print("\nInput hook stopped.")
@@ -7,11 +7,11 @@ Two-phase LLM analysis:
 
 from __future__ import annotations
 
+import hashlib
 import re
-import threading
-import time as _time
 from collections import Counter
-from datetime import date, datetime, time as dt_time
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ..core.frontmatter import (
@@ -28,18 +28,32 @@ if TYPE_CHECKING:
 
 INSIGHTS_DIR = "insights"
 
+# Fallback texts used when an LLM call fails; reports containing them aren't cached
+NO_SUMMARY = "- 暂无法总结今日工作"
+NO_INSIGHTS = "- 暂无洞察"
+
+# Daily insight is generated once the clock passes this time
+INSIGHT_TIME = dt_time(20, 0)
+# Threads used to read active todo files
+TODO_READ_WORKERS = 8
+
 # Matches: [HH:MM] (source) [category] text  OR  [HH:MM] (source) text
 ENTRY_PATTERN = re.compile(
     r"\[(\d{2}:\d{2})\]\s+\(([^)]+)\)\s+(?:\[([^\]]+)\]\s+)?(.*)"
 )
 
 # Noise patterns to filter out
-_NOISE_PATTERNS = [
-    re.compile(r"\.tmp\b", re.IGNORECASE),
-    re.compile(r"\.crdownload\b", re.IGNORECASE),
-    re.compile(r"~\$"),  # Office temp lock files
-    re.compile(r"\.DS_Store\b"),
-]
+# One alternation so each entry costs a single search; (?i:...) keeps the
+# case-insensitive parts scoped
+_NOISE_RE = re.compile(
+    r"(?i:\.tmp\b)"
+    r"|(?i:\.crdownload\b)"
+    r"|~\$"  # Office temp lock files
+    r"|\.DS_Store\b"
+)
+
+_TAG_RE = re.compile(r"#(\w+)")
+_URL_RE = re.compile(r"https?://\S+")
 
 
 # ---------------------------------------------------------------------------
@@ -59,7 +73,7 @@ def parse_daily_log_entries(log_content: str) -> list[dict]:
         return []
 
     entries: list[dict] = []
-    for line in body.strip().split("\n"):
+    for line in body.splitlines():
         line = line.strip()
         if not line:
             continue
@@ -69,7 +83,8 @@ def parse_daily_log_entries(log_content: str) -> list[dict]:
             source = m.group(2)
             category = m.group(3) or "uncategorized"
             text = m.group(4)
-            tags = re.findall(r"#(\w+)", text)
+            # Most entries carry no tags; skip the second regex pass for them
+            tags = _TAG_RE.findall(text) if "#" in text else []
             entries.append({
                 "time": time_str,
                 "source": source,
@@ -85,22 +100,12 @@ def compute_time_allocation(entries: list[dict]) -> dict:
     if not entries:
         return {}
 
-    total = len(entries)
-    allocation: dict[str, dict[str, Any]] = {}
-
-    for entry in entries:
-        cat = entry["category"]
-        if cat not in allocation:
-            allocation[cat] = {"count": 0, "percent": 0.0, "entries": []}
-        allocation[cat]["count"] += 1
-        allocation[cat]["entries"].append(entry["time"])
-
-    for cat in allocation:
-        allocation[cat]["percent"] = round(
-            allocation[cat]["count"] / total * 100, 1
-        )
-
-    return allocation
+    counts = Counter(entry["category"] for entry in entries)
+    scale = 100.0 / len(entries)
+    return {
+        cat: {"count": n, "percent": round(n * scale, 1)}
+        for cat, n in counts.items()
+    }
 
 
 def get_top_tags(entries: list[dict], n: int = 10) -> list[tuple[str, int]]:
@@ -118,10 +123,7 @@ def get_top_tags(entries: list[dict], n: int = 10) -> list[tuple[str, int]]:
 
 def _is_noise(text: str) -> bool:
     """Check if an entry text matches known noise patterns."""
-    for pat in _NOISE_PATTERNS:
-        if pat.search(text):
-            return True
-    return False
+    return _NOISE_RE.search(text) is not None
 
 
 def _dedup_browsing(entries: list[dict]) -> list[dict]:
@@ -130,8 +132,9 @@ def _dedup_browsing(entries: list[dict]) -> list[dict]:
     result: list[dict] = []
     for entry in entries:
         if entry["source"] == "browsing":
-            url_match = re.search(r"https?://\S+", entry["text"])
-            key = url_match.group(0) if url_match else entry["text"]
+            text = entry["text"]
+            url_match = _URL_RE.search(text) if "http" in text else None
+            key = url_match.group(0) if url_match else text
             if key in seen_urls:
                 continue
             seen_urls.add(key)
@@ -139,14 +142,14 @@ def _dedup_browsing(entries: list[dict]) -> list[dict]:
     return result
 
 
+# Period label per hour of the day
+_PERIODS = ("上午",) * 12 + ("下午",) * 6 + ("晚上",) * 6
+
+
 def _time_period(time_str: str) -> str:
     """Classify HH:MM into a time period label."""
-    hour = int(time_str.split(":")[0])
-    if hour < 12:
-        return "上午"
-    if hour < 18:
-        return "下午"
-    return "晚上"
+    hour = int(time_str[:2])
+    return _PERIODS[hour] if hour < 24 else "晚上"
 
 
 def _cluster_entries(entries: list[dict]) -> list[dict]:
@@ -154,51 +157,44 @@ def _cluster_entries(entries: list[dict]) -> list[dict]:
     if not entries:
         return []
 
-    clusters: list[dict] = []
-    current = {
-        "period": _time_period(entries[0]["time"]),
-        "start": entries[0]["time"],
-        "end": entries[0]["time"],
-        "category": entries[0]["category"],
-        "texts": [entries[0]["text"]],
-    }
+    # Read each entry's fields once; the loop below works on plain tuples
+    rows = [
+        (e["time"], _time_period(e["time"]), e["category"], e["text"])
+        for e in entries
+    ]
 
-    for entry in entries[1:]:
-        same_cat = entry["category"] == current["category"]
-        same_period = _time_period(entry["time"]) == current["period"]
-        if same_cat and same_period:
-            current["end"] = entry["time"]
-            current["texts"].append(entry["text"])
+    clusters: list[dict] = []
+    start, period, category, text = rows[0]
+    end = start
+    texts = [text]
+
+    for time_str, row_period, row_category, text in rows[1:]:
+        if row_category == category and row_period == period:
+            end = time_str
+            texts.append(text)
         else:
-            clusters.append(_finalize_cluster(current))
-            current = {
-                "period": _time_period(entry["time"]),
-                "start": entry["time"],
-                "end": entry["time"],
-                "category": entry["category"],
-                "texts": [entry["text"]],
-            }
-
-    clusters.append(_finalize_cluster(current))
+            clusters.append(_finalize_cluster(period, start, end, category, texts))
+            start = end = time_str
+            period, category, texts = row_period, row_category, [text]
+
+    clusters.append(_finalize_cluster(period, start, end, category, texts))
     return clusters
 
 
-def _finalize_cluster(cluster: dict) -> dict:
-    """Convert raw cluster dict into its final summary form."""
-    count = len(cluster["texts"])
+def _finalize_cluster(
+    period: str, start: str, end: str, category: str, texts: list[str],
+) -> dict:
+    """Build the summary dict for one cluster."""
+    count = len(texts)
     if count == 1:
-        summary = cluster["texts"][0]
+        summary = texts[0]
     else:
-        summary = f"{cluster['texts'][0]} ... 等{count}项操作"
-
-    time_range = cluster["start"]
-    if cluster["end"] != cluster["start"]:
-        time_range = f"{cluster['start']}-{cluster['end']}"
+        summary = f"{texts[0]} ... 等{count}项操作"
 
     return {
-        "period": cluster["period"],
-        "time_range": time_range,
-        "category": cluster["category"],
+        "period": period,
+        "time_range": start if end == start else f"{start}-{end}",
+        "category": category,
         "summary": summary,
         "count": count,
     }
@@ -212,28 +208,53 @@ def _filter_and_cluster_entries(entries: list[dict]) -> tuple[list[dict], list[d
     return cleaned, clusters
 
 
+@lru_cache(maxsize=1024)
+def _parse_todo(name: str, content: str) -> tuple[str, str, str, str, str]:
+    """Parse an active todo file into its insight fields.
+
+    Cached on the file content, so todos that haven't changed since the
+    last insight run aren't parsed again.
+    """
+    fields, body = parse_frontmatter(content)
+    return (
+        fields.get("id", name.replace(".md", "")),
+        body.strip(),
+        fields.get("due", ""),
+        fields.get("priority_label", "normal"),
+        fields.get("created", ""),
+    )
+
+
 def _get_active_todos_detail(engine: VaultEngine) -> list[dict[str, Any]]:
     """Get full details for all active todos."""
-    todos: list[dict[str, Any]] = []
+    names = [
+        name for name in engine.list_resources(ACTIVE_DIR)
+        if name.endswith(".md") and not name.startswith(".")
+    ]
+    if not names:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = [f"{ACTIVE_DIR}/{name}" for name in names]
+    with ThreadPoolExecutor(max_workers=min(TODO_READ_WORKERS, len(paths))) as pool:
+        contents = list(pool.map(engine.read_resource, paths))
 
-    for name in engine.list_resources(ACTIVE_DIR):
-        if not name.endswith(".md") or name.startswith("."):
+    todos: list[dict[str, Any]] = []
+    for name, content in zip(names, contents):
+        if not content:
             continue
-        rel_path = f"{ACTIVE_DIR}/{name}"
         try:
-            content = engine.read_resource(rel_path)
-            if not content:
-                continue
-            fields, body = parse_frontmatter(content)
-            todos.append({
-                "id": fields.get("id", name.replace(".md", "")),
-                "text": body.strip(),
-                "due": fields.get("due", ""),
-                "priority": fields.get("priority_label", "normal"),
-                "created": fields.get("created", ""),
-            })
+            todo_id, text, due, priority, created = _parse_todo(name, content)
         except Exception:
             continue
+        todos.append({
+            "id": todo_id,
+            "text": text,
+            "due": due,
+            "priority": priority,
+            "created": created,
+        })
     return todos
 
 
@@ -312,176 +333,197 @@ def _gather_insight_context(
 # Phase 1: Semantic understanding
 # ---------------------------------------------------------------------------
 
+SUMMARY_SYSTEM = "你是一个工作日志分析助手。从原始日志中提取用户真正做了什么，输出简洁的工作事项列表。"
+
+SUMMARY_PROMPT_TEMPLATE = """\
+根据以下原始工作日志，提炼出用户今天实际做的工作事项。
+忽略具体文件名和技术细节，聚焦于：做了什么事、为什么做、产出是什么。
+
+用户日志：
+{clustered_text}
+
+用户笔记：
+{notes_text}
+
+请用简洁的列表输出今天的工作事项，每项一行，用 - 开头。"""
+
+
 def _summarize_work(
     context: dict[str, Any],
     engine: VaultEngine,
 ) -> str:
     """Phase 1 LLM call: extract work items from raw log data."""
-    cluster_lines: list[str] = []
-    for c in context["clusters"]:
-        cluster_lines.append(
-            f"[{c['time_range']}] [{c['category']}] {c['summary']}"
-        )
-    clustered_text = "\n".join(cluster_lines) if cluster_lines else "（无自动记录）"
-
-    notes_lines: list[str] = []
-    for n in context["notes"]:
-        notes_lines.append(f"[{n['time']}] {n['text']}")
-    notes_text = "\n".join(notes_lines) if notes_lines else "（无手动笔记）"
-
-    prompt = (
-        "根据以下原始工作日志，提炼出用户今天实际做的工作事项。\n"
-        "忽略具体文件名和技术细节，聚焦于：做了什么事、为什么做、产出是什么。\n\n"
-        "用户日志：\n"
-        f"{clustered_text}\n\n"
-        "用户笔记：\n"
-        f"{notes_text}\n\n"
-        "请用简洁的列表输出今天的工作事项，每项一行，用 - 开头。"
-    )
+    clustered_text = "\n".join(
+        f"[{c['time_range']}] [{c['category']}] {c['summary']}"
+        for c in context["clusters"]
+    ) or "（无自动记录）"
+    notes_text = "\n".join(
+        f"[{n['time']}] {n['text']}" for n in context["notes"]
+    ) or "（无手动笔记）"
 
     summary = call_deepseek(
-        prompt=prompt,
-        system="你是一个工作日志分析助手。从原始日志中提取用户真正做了什么，输出简洁的工作事项列表。",
+        prompt=SUMMARY_PROMPT_TEMPLATE.format(
+            clustered_text=clustered_text,
+            notes_text=notes_text,
+        ),
+        system=SUMMARY_SYSTEM,
         max_tokens=300,
         config=engine.config,
     )
-    return summary or "- 暂无法总结今日工作"
+    return summary or NO_SUMMARY
 
 
 # ---------------------------------------------------------------------------
 # Phase 2: Deep insights
 # ---------------------------------------------------------------------------
 
-def _generate_insights(
-    work_summary: str,
-    context: dict[str, Any],
-    engine: VaultEngine,
-) -> str:
-    """Phase 2 LLM call: generate actionable insights."""
-    active_lines: list[str] = []
-    for t in context["active_todos"]:
-        due = f"（截止: {t['due']}）" if t["due"] else ""
-        active_lines.append(f"- [{t['priority']}] {t['text'][:80]}{due}")
-    active_text = "\n".join(active_lines) if active_lines else "（无活跃任务）"
-
-    stalled_lines: list[str] = []
-    for s in context["stalled_todos"]:
-        stalled_lines.append(
-            f"- {s['text'][:80]}（最后活动: {s.get('last_activity', '未知')}）"
-        )
-    stalled_text = "\n".join(stalled_lines) if stalled_lines else "（无停滞任务）"
+INSIGHTS_SYSTEM = (
+    "你是用户的私人工作顾问。基于用户的工作内容和任务状态，"
+    "给出有决策价值的洞察和建议。直接输出建议列表，不要寒暄。"
+)
+
+INSIGHTS_PROMPT_TEMPLATE = """\
+基于今日工作总结和任务上下文，给出有价值的洞察。
+
+要求：
+- 不要给出"少切标签""多休息""注意文件管理"这种表面建议
+- 聚焦于：未完成的关键事项、可能被遗忘的后续行动、工作优先级判断、值得深入的方向
+- 如果有会议纪要或笔记，提取未落实的 action items
+- 结合活跃任务和停滞任务，指出哪些任务需要立即关注
+- 输出 2-4 条洞察，每条用 - 开头，配简短说明
+
+今日工作总结：
+{work_summary}
+
+{task_text}"""
+
+TASK_CONTEXT_TEMPLATE = """\
+活跃任务：
+{active_text}
 
-    memory_text = ""
+停滞任务：
+{stalled_text}{memory_text}"""
+
+
+def _task_context_text(context: dict[str, Any]) -> str:
+    """Format the task and memory part of the Phase 2 prompt."""
+    active_text = "\n".join(
+        f"- [{t['priority']}] {t['text'][:80]}" + (f"（截止: {t['due']}）" if t["due"] else "")
+        for t in context["active_todos"]
+    ) or "（无活跃任务）"
+    stalled_text = "\n".join(
+        f"- {t['text'][:80]}（最后活动: {t.get('last_activity', '未知')}）"
+        for t in context["stalled_todos"]
+    ) or "（无停滞任务）"
+
+    memory_sections = []
     if context["memories"]:
-        memory_text = "\n相关历史记忆：\n" + "\n".join(
+        memory_sections.append("\n相关历史记忆：\n" + "\n".join(
             f"- {m}" for m in context["memories"]
-        )
+        ))
     if context.get("long_term_memories"):
-        memory_text += "\n用户长期记忆：\n" + "\n".join(
+        memory_sections.append("\n用户长期记忆：\n" + "\n".join(
             f"- {m}" for m in context["long_term_memories"]
-        )
+        ))
 
-    prompt = (
-        "基于今日工作总结和任务上下文，给出有价值的洞察。\n\n"
-        "要求：\n"
-        "- 不要给出\"少切标签\"\"多休息\"\"注意文件管理\"这种表面建议\n"
-        "- 聚焦于：未完成的关键事项、可能被遗忘的后续行动、工作优先级判断、值得深入的方向\n"
-        "- 如果有会议纪要或笔记，提取未落实的 action items\n"
-        "- 结合活跃任务和停滞任务，指出哪些任务需要立即关注\n"
-        "- 输出 2-4 条洞察，每条用 - 开头，配简短说明\n\n"
-        "今日工作总结：\n"
-        f"{work_summary}\n\n"
-        "活跃任务：\n"
-        f"{active_text}\n\n"
-        "停滞任务：\n"
-        f"{stalled_text}"
-        f"{memory_text}"
+    return TASK_CONTEXT_TEMPLATE.format(
+        active_text=active_text,
+        stalled_text=stalled_text,
+        memory_text="".join(memory_sections),
     )
 
-    soul_prefix = ""
-    soul = context.get("soul", "")
-    if soul:
-        soul_prefix = f"用户画像：\n{soul}\n\n"
 
+def _generate_insights(
+    work_summary: str,
+    task_text: str,
+    context: dict[str, Any],
+    engine: VaultEngine,
+) -> str:
+    """Phase 2 LLM call: generate actionable insights."""
+    soul = context.get("soul", "")
     insights = call_deepseek(
-        prompt=prompt,
-        system=(
-            f"{soul_prefix}"
-            "你是用户的私人工作顾问。基于用户的工作内容和任务状态，"
-            "给出有决策价值的洞察和建议。直接输出建议列表，不要寒暄。"
-        ),
+        prompt=INSIGHTS_PROMPT_TEMPLATE.format(work_summary=work_summary, task_text=task_text),
+        system=f"{INSIGHTS_SYSTEM}\n\n用户画像：\n{soul}" if soul else INSIGHTS_SYSTEM,
         max_tokens=512,
         config=engine.config,
     )
-    return insights or "- 暂无洞察"
+    return insights or NO_INSIGHTS
 
 
 # ---------------------------------------------------------------------------
 # Report builder
 # ---------------------------------------------------------------------------
 
+def _insight_source_hash(context: dict[str, Any]) -> str:
+    """Return a short digest of the log entries and task state behind a report."""
+    key = repr((context["entries"], context["active_todos"], context["stalled_todos"]))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def build_daily_insight(target_date: date, engine: VaultEngine) -> str:
     """Build a daily insight markdown report."""
+    return _build_daily_insight(target_date, engine)[0]
+
+
+def _build_daily_insight(
+    target_date: date,
+    engine: VaultEngine,
+) -> tuple[str, str | None, bool]:
+    """Build the report, reusing the saved one if its inputs are unchanged.
+
+    Returns ``(report, source_hash, reused)``. *source_hash* is None when
+    the report shouldn't be cached (no data, or an LLM call failed).
+    """
     context = _gather_insight_context(target_date, engine)
     if context is None:
-        return f"# 每日洞察 — {target_date.isoformat()}\n\n无数据"
+        return f"# 每日洞察 — {target_date.isoformat()}\n\n无数据", None, False
+
+    source_hash = _insight_source_hash(context)
+    existing = engine.read_resource(f"{INSIGHTS_DIR}/daily-{target_date.isoformat()}.md")
+    if existing:
+        fields, body = parse_frontmatter(existing)
+        if fields.get("source_hash") == source_hash and body:
+            return body, source_hash, True
 
     work_summary = _summarize_work(context, engine)
-    insights = _generate_insights(work_summary, context, engine)
+    insights = _generate_insights(work_summary, _task_context_text(context), context, engine)
     allocation = compute_time_allocation(context["entries"])
 
-    lines: list[str] = []
-    lines.append(f"# 每日洞察 — {target_date.isoformat()}")
-    lines.append("")
-
-    lines.append("## 今日工作总结")
-    lines.append("")
-    lines.append(work_summary)
-    lines.append("")
-
-    lines.append("## 任务状态")
-    lines.append("")
     active = context["active_todos"]
     stalled = context["stalled_todos"]
+
     if active:
-        lines.append(f"**活跃任务** ({len(active)})")
-        lines.append("")
-        for t in active:
-            due = f" | 截止: {t['due']}" if t["due"] else ""
-            lines.append(f"- {t['text'][:80]}{due}")
-        lines.append("")
+        tasks = f"**活跃任务** ({len(active)})\n\n" + "\n".join(
+            f"- {t['text'][:80]}" + (f" | 截止: {t['due']}" if t["due"] else "")
+            for t in active
+        ) + "\n"
     else:
-        lines.append("暂无活跃任务")
-        lines.append("")
-
+        tasks = "暂无活跃任务\n"
     if stalled:
-        lines.append(f"**停滞任务** ({len(stalled)}) ⚠")
-        lines.append("")
-        for s in stalled:
-            lines.append(
-                f"- {s['text'][:80]}（最后活动: {s.get('last_activity', '未知')}）"
-            )
-        lines.append("")
-
-    lines.append("## 洞察与建议")
-    lines.append("")
-    lines.append(insights)
-    lines.append("")
-
-    lines.append("## 时间分布")
-    lines.append("")
+        tasks += f"\n**停滞任务** ({len(stalled)}) ⚠\n\n" + "\n".join(
+            f"- {t['text'][:80]}（最后活动: {t.get('last_activity', '未知')}）"
+            for t in stalled
+        ) + "\n"
+
     if allocation:
-        for cat, info in sorted(
-            allocation.items(), key=lambda x: -x[1]["count"]
-        ):
-            lines.append(
-                f"- **{cat}**: {info['count']}条 ({info['percent']}%)"
-            )
+        time_split = "\n".join(
+            f"- **{cat}**: {info['count']}条 ({info['percent']}%)"
+            for cat, info in sorted(allocation.items(), key=lambda x: -x[1]["count"])
+        )
     else:
-        lines.append("暂无数据")
-    lines.append("")
+        time_split = "暂无数据"
+
+    if work_summary == NO_SUMMARY or insights == NO_INSIGHTS:
+        source_hash = None
 
-    return "\n".join(lines)
+    report = (
+        f"# 每日洞察 — {target_date.isoformat()}\n\n"
+        f"## 今日工作总结\n\n{work_summary}\n\n"
+        f"## 任务状态\n\n{tasks}\n"
+        f"## 洞察与建议\n\n{insights}\n\n"
+        f"## 时间分布\n\n{time_split}\n"
+    )
+    return report, source_hash, False
 
 
 # ---------------------------------------------------------------------------
@@ -490,10 +532,15 @@ def build_daily_insight(target_date: date, engine: VaultEngine) -> str:
 
 def save_daily_insight(target_date: date, engine: VaultEngine) -> str:
     """Generate and save daily insight report."""
-    report = build_daily_insight(target_date, engine)
+    report, source_hash, reused = _build_daily_insight(target_date, engine)
+    if reused:
+        # Already saved, and its memories were extracted when it was written
+        return report
 
     filename = f"daily-{target_date.isoformat()}.md"
     fields = {"date": target_date.isoformat(), "type": "daily-insight"}
+    if source_hash:
+        fields["source_hash"] = source_hash
     content = build_frontmatter(fields, report)
 
     engine.write_resource(
@@ -524,43 +571,25 @@ def save_daily_insight(target_date: date, engine: VaultEngine) -> str:
     return report
 
 
-def _insight_loop(engine: VaultEngine, running: threading.Event) -> None:
-    """Background loop that generates daily insight at 20:00."""
-    generated_today = False
-    while running.is_set():
-        now = datetime.now()
-        current_time = now.time()
-        target_time = dt_time(20, 0)
+def run_daily_insight_tick(engine: VaultEngine, generated_on: date | None) -> date | None:
+    """Generate today's insight once past 20:00.
 
-        if current_time >= target_time and not generated_today:
-            try:
-                save_daily_insight(now.date(), engine)
-            except Exception:
-                pass
-            generated_today = True
-
-        if current_time < dt_time(0, 1):
-            generated_today = False
-
-        if not running.is_set():
-            break
-        for _ in range(60):
-            if not running.is_set():
-                return
-            _time.sleep(1)
+    *generated_on* is the date the insight was last generated for; the
+    updated date is returned for the caller to pass back next tick.
+    """
+    now = datetime.now()
+    if now.time() >= INSIGHT_TIME and generated_on != now.date():
+        try:
+            save_daily_insight(now.date(), engine)
+        except Exception:
+            pass
+        generated_on = now.date()
+    return generated_on
 
 
-def start_insight_thread(
-    engine: VaultEngine,
-) -> tuple[threading.Thread, threading.Event]:
-    """Start background thread that generates daily insight at 20:00."""
-    running = threading.Event()
-    running.set()
-    thread = threading.Thread(
-        target=_insight_loop,
-        args=(engine, running),
-        daemon=True,
-        name="insight",
-    )
-    thread.start()
-    return thread, running
+def seconds_until_insight(now: datetime, generated_on: date | None) -> float:
+    """Seconds from *now* until the next 20:00 that hasn't had its insight yet."""
+    target = datetime.combine(now.date(), INSIGHT_TIME)
+    if generated_on == now.date():
+        target += timedelta(days=1)
+    return max((target - now).total_seconds(), 0.0)
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import json
 import re
+from collections import Counter, defaultdict
 from datetime import date
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from ..core.frontmatter import build_frontmatter, parse_frontmatter
@@ -19,6 +21,8 @@ if TYPE_CHECKING:
 
 MEMORIES_DIR = "memories"
 
+_TOKEN_SPLIT_RE = re.compile(r"[\s,，。！？；：、\.\!\?\;\:]+")
+
 VALID_CATEGORIES = {"preference", "pattern", "decision", "learning", "belief"}
 
 _EXTRACT_SYSTEM = (
@@ -27,9 +31,9 @@ _EXTRACT_SYSTEM = (
     "不要提取临时性的事件细节。"
 )
 
+# Fixed instructions come before the report so requests share a cacheable prefix
 _EXTRACT_PROMPT_TEMPLATE = (
-    "从以下每日洞察报告中提炼 3-5 条值得长期记住的记忆片段。\n\n"
-    "报告内容：\n{report}\n\n"
+    "从下面的每日洞察报告中提炼 3-5 条值得长期记住的记忆片段。\n\n"
     "要求：\n"
     "- 每条记忆是一个独立的、可长期保留的观察或结论\n"
     "- category 必须是以下之一：preference, pattern, decision, learning, belief\n"
@@ -37,7 +41,8 @@ _EXTRACT_PROMPT_TEMPLATE = (
     "- tags 用英文逗号分隔\n\n"
     '请严格返回 JSON 数组，格式：\n'
     '[{{"text": "记忆内容", "category": "pattern", "importance": 4, "tags": "focus,deep-work"}}]\n'
-    "只输出 JSON，不要其他内容。"
+    "只输出 JSON，不要其他内容。\n\n"
+    "报告内容：\n{report}"
 )
 
 
@@ -79,13 +84,14 @@ def _llm_extract(report: str, engine: VaultEngine) -> list[dict[str, Any]]:
     """Call LLM to extract memory fragments from report."""
     prompt = _EXTRACT_PROMPT_TEMPLATE.format(report=report[:3000])
 
-    # Inject soul context for personality-aware extraction
+    # Inject soul context for personality-aware extraction; it goes after
+    # the fixed instructions so they stay a stable prompt prefix
     system = _EXTRACT_SYSTEM
     try:
         from .soul import get_soul_context
         soul = get_soul_context(engine)
         if soul:
-            system = f"用户画像：\n{soul}\n\n{system}"
+            system = f"{system}\n\n用户画像：\n{soul}"
     except Exception:
         pass
 
@@ -204,33 +210,58 @@ def _deduplicate(
     if not existing_texts:
         return candidates
 
-    result: list[dict[str, Any]] = []
-    for candidate in candidates:
-        if not _is_duplicate(candidate["text"], existing_texts):
-            result.append(candidate)
-    return result
+    index = _token_index(existing_texts)
+    return [c for c in candidates if not _overlaps_index(_token_set(c["text"]), index)]
 
 
 def _is_duplicate(text: str, existing: list[str], threshold: float = 0.6) -> bool:
     """Check if text is a duplicate of any existing memory via token overlap."""
-    tokens_new = set(_tokenize(text))
+    return _overlaps_index(_token_set(text), _token_index(existing), threshold)
+
+
+def _token_index(texts: list[str]) -> tuple[list[frozenset[str]], dict[str, list[int]]]:
+    """Return each text's token set plus a token -> text positions map.
+
+    Lets a candidate be checked against only the memories it shares a
+    token with, instead of every memory.
+    """
+    token_sets = [_token_set(t) for t in texts]
+    postings: dict[str, list[int]] = defaultdict(list)
+    for idx, tokens in enumerate(token_sets):
+        for token in tokens:
+            postings[token].append(idx)
+    return token_sets, postings
+
+
+def _overlaps_index(
+    tokens_new: frozenset[str],
+    index: tuple[list[frozenset[str]], dict[str, list[int]]],
+    threshold: float = 0.6,
+) -> bool:
+    """True if *tokens_new* overlaps any indexed text by at least *threshold*.
+
+    Overlap is measured against the smaller of the two token sets.
+    """
     if not tokens_new:
         return False
+    token_sets, postings = index
+    shared = Counter(idx for token in tokens_new for idx in postings.get(token, ()))
+    size_new = len(tokens_new)
+    return any(
+        count / min(size_new, len(token_sets[idx])) >= threshold
+        for idx, count in shared.items()
+    )
 
-    for existing_text in existing:
-        tokens_old = set(_tokenize(existing_text))
-        if not tokens_old:
-            continue
-        overlap = len(tokens_new & tokens_old)
-        smaller = min(len(tokens_new), len(tokens_old))
-        if smaller > 0 and overlap / smaller >= threshold:
-            return True
-    return False
+
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> frozenset[str]:
+    """Cached token set of *text*; existing memories are re-checked on every extraction."""
+    return frozenset(_tokenize(text))
 
 
 def _tokenize(text: str) -> list[str]:
     """Simple tokenizer: split on whitespace and punctuation."""
-    return [t.lower() for t in re.split(r"[\s,，。！？；：、\.\!\?\;\:]+", text) if len(t) > 1]
+    return [t.lower() for t in _TOKEN_SPLIT_RE.split(text) if len(t) > 1]
 
 
 def _save_memory(
@@ -13,30 +13,64 @@ from ..core.vault import get_engine
 console = Console()
 
 
-def search_memories(query: str, limit: int = 10) -> list[dict[str, Any]]:
-    """Keyword search across all vault files."""
-    engine = get_engine()
-    results = engine.search(query=query, limit=limit)
+def render_search_results(query: str, results: list[dict[str, Any]]) -> None:
+    """Print search results as panels, or as plain text when piped.
 
+    Items follow the ``VaultEngine.search`` schema, so the ``path``,
+    ``filename`` and ``snippet`` keys are always present.
+    """
     if not results:
         console.print("[dim]No results found.[/dim]")
-        return results
+        return
 
     console.print(f"\n[bold]Found {len(results)} results for:[/bold] {query}\n")
 
-    for i, item in enumerate(results, 1):
-        header = f"[{i}] {item.get('filename', '')}"
-        snippet = item.get("snippet", "[no content]")
-        path = item.get("path", "")
+    if not console.is_terminal:
+        console.file.write("".join(
+            f"[{i}] {item['filename']}\n{(item['snippet'] or '[no content]')[:300]}\n{item['path']}\n\n"
+            for i, item in enumerate(results, 1)
+        ))
+        return
 
+    for i, item in enumerate(results, 1):
         panel = Panel(
-            Text(snippet[:300]),
-            title=header,
-            subtitle=path,
+            Text((item["snippet"] or "[no content]")[:300]),
+            title=f"[{i}] {item['filename']}",
+            subtitle=item["path"],
             border_style="green",
         )
         console.print(panel)
 
+
+def render_memory_results(query: str, results: list[dict[str, Any]]) -> None:
+    """Print memory search results as panels, or as plain text when piped."""
+    if not results:
+        console.print("[dim]No memories found.[/dim]")
+        return
+
+    console.print(f"\n[bold]Found {len(results)} memories for:[/bold] {query}\n")
+
+    if not console.is_terminal:
+        console.file.write("".join(
+            f"[{i}] {item.get('filename', '')}\n{(item.get('snippet', '') or '[no content]')[:300]}\n\n"
+            for i, item in enumerate(results, 1)
+        ))
+        return
+
+    for i, item in enumerate(results, 1):
+        panel = Panel(
+            Text((item.get("snippet", "") or "[no content]")[:300]),
+            title=f"[{i}] {item.get('filename', '')}",
+            border_style="blue",
+        )
+        console.print(panel)
+
+
+def search_memories(query: str, limit: int = 10) -> list[dict[str, Any]]:
+    """Keyword search across all vault files."""
+    engine = get_engine()
+    results = engine.search(query=query, limit=limit)
+    render_search_results(query, results)
     return results
 
 
@@ -10,10 +10,10 @@ from __future__ import annotations
 import json
 import re
 from datetime import date
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
 from ..core.frontmatter import build_frontmatter, parse_frontmatter
-from ..core.llm import call_deepseek
+from ..core.llm import call_deepseek, call_deepseek_stream
 
 if TYPE_CHECKING:
     from ..core.vault import VaultEngine
@@ -52,18 +52,19 @@ _EVOLVE_SYSTEM = (
     "只更新有实质性变化的部分，保守更新——宁可不改也不要乱改。"
 )
 
+# Fixed rules come before the per-call inputs so requests share a cacheable prefix
 _EVOLVE_PROMPT_TEMPLATE = (
-    "当前灵魂画像：\n{current_soul}\n\n"
-    "新记忆片段：\n{memories}\n\n"
-    "今日洞察报告摘要：\n{insight}\n\n"
-    "请判断灵魂画像的哪些分节需要更新。\n"
+    "请根据下面的新记忆和洞察，判断灵魂画像的哪些分节需要更新。\n"
     "规则：\n"
     "- 只返回需要更新的分节，不需要更新的不要包含\n"
     "- 不要更新'成长轨迹'（系统会自动追加）\n"
     "- 如果没有任何分节需要更新，返回空对象 {{}}\n"
     "- 更新内容应该是该分节的完整新内容（不是增量）\n\n"
     '请严格返回 JSON 对象，格式：{{"分节名": "新内容", ...}}\n'
-    "只输出 JSON，不要其他内容。"
+    "只输出 JSON，不要其他内容。\n\n"
+    "当前灵魂画像：\n{current_soul}\n\n"
+    "新记忆片段：\n{memories}\n\n"
+    "今日洞察报告摘要：\n{insight}"
 )
 
 
@@ -318,8 +319,11 @@ def _parse_evolve_response(response: str) -> dict[str, str]:
     return valid
 
 
-def chat_with_soul(question: str, engine: VaultEngine) -> str:
-    """Answer a user question based on soul profile + recent memories + latest insight."""
+def _build_chat_prompt(question: str, engine: VaultEngine) -> tuple[str, str]:
+    """Build the chat prompt from soul profile + recent memories + latest insight.
+
+    Returns ``(prompt, soul_context)``; the soul context feeds the fallback.
+    """
     # 1. Soul context
     soul_context = get_soul_context(engine)
 
@@ -343,22 +347,43 @@ def chat_with_soul(question: str, engine: VaultEngine) -> str:
 
     full_context = "\n\n".join(context_parts)
     prompt = _CHAT_PROMPT_TEMPLATE.format(context=full_context, question=question)
+    return prompt, soul_context
+
+
+def _chat_fallback(soul_context: str) -> str:
+    if soul_context:
+        return f"（LLM 暂时不可用，无法回答。以下是你的灵魂摘要供参考：）\n\n{soul_context}"
+    return "（LLM 暂时不可用，且尚未建立灵魂画像。请先运行 `mem soul init`。）"
+
+
+def chat_with_soul(question: str, engine: VaultEngine) -> str:
+    """Answer a user question based on soul profile + recent memories + latest insight."""
+    prompt, soul_context = _build_chat_prompt(question, engine)
 
-    # 5. Call LLM
     response = call_deepseek(
         prompt=prompt,
         system=_CHAT_SYSTEM,
         max_tokens=800,
         config=engine.config,
     )
+    return response or _chat_fallback(soul_context)
 
-    # 6. Fallback
-    if not response:
-        if soul_context:
-            return f"（LLM 暂时不可用，无法回答。以下是你的灵魂摘要供参考：）\n\n{soul_context}"
-        return "（LLM 暂时不可用，且尚未建立灵魂画像。请先运行 `mem soul init`。）"
 
-    return response
+def stream_chat_with_soul(question: str, engine: VaultEngine) -> Iterator[str]:
+    """Like :func:`chat_with_soul`, but yield the answer as it is generated."""
+    prompt, soul_context = _build_chat_prompt(question, engine)
+
+    streamed = False
+    for chunk in call_deepseek_stream(
+        prompt=prompt,
+        system=_CHAT_SYSTEM,
+        max_tokens=800,
+        config=engine.config,
+    ):
+        streamed = True
+        yield chunk
+    if not streamed:
+        yield _chat_fallback(soul_context)
 
 
 def _load_latest_insight(engine: VaultEngine) -> str:
@@ -77,6 +77,24 @@ def add_todo(text: str, due: str | None = None, priority: str = "normal") -> str
     return todo_id
 
 
+def _read_id_prefix(content: str, length: int = 8) -> str:
+    """Return the first *length* chars of the frontmatter ``id`` field.
+
+    Scans only the frontmatter block for the ``id:`` line instead of
+    parsing every field, so callers matching a todo ID can skip the full
+    ``parse_frontmatter`` for files that don't match.
+    """
+    end = content.find("\n---", 3)
+    head = content[:end] if end != -1 else content[:512]
+    idx = head.find("\nid:")
+    if idx == -1:
+        return ""
+    start = idx + 4
+    line_end = head.find("\n", start)
+    value = head[start:line_end] if line_end != -1 else head[start:]
+    return value.strip()[:length]
+
+
 def _parse_frontmatter(content: str) -> dict[str, str]:
     """Extract YAML frontmatter fields from markdown content."""
     fields, _ = parse_frontmatter(content)
@@ -114,17 +132,32 @@ def list_todos() -> list[dict[str, Any]]:
         console.print("[dim]No active todos.[/dim]")
         return todos
 
-    table = Table(title="Active Todos")
-    table.add_column("ID", style="cyan", width=10)
-    table.add_column("Task", style="white")
-    table.add_column("Due", style="yellow", width=12)
-    table.add_column("Priority", style="magenta", width=10)
+    console.print(build_todo_table(todos))
+    return todos
 
-    for t in todos:
-        table.add_row(t["id"], t["text"][:60], t["due"], t["priority"])
 
-    console.print(table)
-    return todos
+# (header, style, width) for each column of the todo table
+_TODO_COLUMNS: tuple[tuple[str, str, int | None], ...] = (
+    ("ID", "cyan", 10),
+    ("Task", "white", None),
+    ("Due", "yellow", 12),
+    ("Priority", "magenta", 10),
+)
+
+
+def build_todo_table(todos: list[dict[str, Any]], title: str = "Active Todos") -> Table:
+    """Build the Rich table used wherever active todos are listed."""
+    table = Table(title=title)
+    for header, style, width in _TODO_COLUMNS:
+        table.add_column(header, style=style, width=width)
+    for t in todos:
+        table.add_row(
+            t.get("id", ""),
+            t.get("text", "")[:60],
+            t.get("due", ""),
+            t.get("priority", ""),
+        )
+    return table
 
 
 def complete_todo(todo_id: str) -> bool:
@@ -174,19 +207,19 @@ def update_todo_activity(todo_id: str, source: str, engine: Any = None) -> bool:
     from ..core.frontmatter import add_activity_entry
     from datetime import date as _date
 
+    prefix = todo_id[:8]
     for filename in engine.list_resources(ACTIVE_DIR):
         rel_path = f"{ACTIVE_DIR}/{filename}"
         content = engine.read_resource(rel_path)
-        if content is None:
+        if content is None or _read_id_prefix(content) != prefix:
             continue
         fields, body = parse_frontmatter(content)
-        if fields.get("id", "")[:8] == todo_id[:8]:
-            today = _date.today().isoformat()
-            add_activity_entry(fields, today, source)
-            new_content = build_frontmatter(fields, body)
-            engine.delete_resource(rel_path)
-            engine.write_resource(content=new_content, directory=ACTIVE_DIR, filename=filename)
-            return True
+        today = _date.today().isoformat()
+        add_activity_entry(fields, today, source)
+        new_content = build_frontmatter(fields, body)
+        engine.delete_resource(rel_path)
+        engine.write_resource(content=new_content, directory=ACTIVE_DIR, filename=filename)
+        return True
     return False
 
 
@@ -6,6 +6,7 @@ terminal command capture, search, and clipboard monitoring.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import signal
 import subprocess
@@ -28,6 +29,7 @@ SERVICE_HOST = "127.0.0.1"
 SERVICE_PORT = 8330
 PID_DIR = Path.home() / ".soul-agent"
 PID_FILE = PID_DIR / "daemon.pid"
+_SHUTDOWN_TIMEOUT = 5.0  # seconds shared by all worker joins on shutdown
 DEFAULT_CONFIG = Path(__file__).parent.parent / "config" / "soul.json"
 _ENV_FILE = Path(__file__).parent.parent / ".env"
 
@@ -86,45 +88,101 @@ def _flush_cmd_buffer(engine: Any, ingest_queue: IngestQueue | None = None) -> N
             pass
 
 
-# ── Compaction scheduler ──────────────────────────────────────────────────
+# ── Claude Code message buffer ─────────────────────────────────────────────
 
-def _compaction_loop(engine: Any, stop_event: threading.Event) -> None:
-    """Check daily if last week's report exists; generate if missing."""
-    from datetime import date, timedelta
+_cc_buffer: list[str] = []
+_CC_FLUSH_COUNT = 10
+_CC_FLUSH_DELAY = 2.0  # seconds a burst may sit before it is queued
+_cc_flush_handle: asyncio.TimerHandle | None = None
+_cc_lock = threading.Lock()
 
-    # Initial check on startup
-    try:
-        from soul_agent.modules.compact import INSIGHTS_DIR, _week_label, compact_week
 
-        today = date.today()
-        last_week = today - timedelta(days=7)
-        label = _week_label(last_week)
-        rel_path = f"{INSIGHTS_DIR}/{label}.md"
-        if not engine.read_resource(rel_path):
-            compact_week(last_week, engine)
-    except Exception:
-        pass
-
-    # Then check once per day
-    while not stop_event.wait(timeout=86400):
-        try:
-            from soul_agent.modules.compact import INSIGHTS_DIR, _week_label, compact_week
-
-            today = date.today()
-            last_week = today - timedelta(days=7)
-            label = _week_label(last_week)
-            rel_path = f"{INSIGHTS_DIR}/{label}.md"
-            if not engine.read_resource(rel_path):
-                compact_week(last_week, engine)
-        except Exception:
-            pass
+def _flush_cc_buffer(ingest_queue: IngestQueue) -> None:
+    """Queue buffered Claude Code messages as a single ingest item."""
+    global _cc_flush_handle
+    with _cc_lock:
+        if _cc_flush_handle is not None:
+            _cc_flush_handle.cancel()
+            _cc_flush_handle = None
+        if not _cc_buffer:
+            return
+        texts = list(_cc_buffer)
+        _cc_buffer.clear()
+
+    from datetime import datetime
+
+    from soul_agent.core.queue import IngestItem
+
+    ingest_queue.put(IngestItem(
+        text="\n\n".join(texts),
+        source="claude-code",
+        timestamp=datetime.now(),
+        meta={"messages": len(texts)} if len(texts) > 1 else {},
+    ))
+
+
+# ── Maintenance scheduler ─────────────────────────────────────────────────
+
+_MAX_MAINTENANCE_SLEEP = 3600  # longest single wait between maintenance checks
+_COMPACTION_INTERVAL = 86400  # seconds between weekly-report checks
+
+
+def _maintenance_loop(engine: Any, stop_event: threading.Event) -> None:
+    """Run the periodic vault jobs on a single thread.
+
+    Once past 20:00: generate the daily insight.
+    Each day (and on startup): write last week's report if it's missing.
+    Between jobs the thread sleeps until whichever is due next.
+    """
+    from datetime import date, datetime, timedelta
+
+    from soul_agent.modules.compact import INSIGHTS_DIR, _week_label, compact_week
+    from soul_agent.modules.insight import run_daily_insight_tick, seconds_until_insight
+
+    # Report path is only recomputed when the target date moves
+    checked_date: date | None = None
+    rel_path = ""
+    next_compaction = 0.0
+    insight_date: date | None = None
+
+    while True:
+        if time.monotonic() >= next_compaction:
+            next_compaction = time.monotonic() + _COMPACTION_INTERVAL
+            try:
+                last_week = date.today() - timedelta(days=7)
+                if last_week != checked_date:
+                    rel_path = f"{INSIGHTS_DIR}/{_week_label(last_week)}.md"
+                    checked_date = last_week
+                if not engine.read_resource(rel_path):
+                    compact_week(last_week, engine)
+            except Exception:
+                pass
+
+        insight_date = run_daily_insight_tick(engine, insight_date)
+
+        # The cap re-checks the wall clock after a suspend or clock change,
+        # which the wait's timeout doesn't track
+        delay = min(
+            seconds_until_insight(datetime.now(), insight_date),
+            next_compaction - time.monotonic(),
+            _MAX_MAINTENANCE_SLEEP,
+        )
+        if stop_event.wait(timeout=max(delay, 0.0)):
+            break
 
 
 # ── FastAPI app ────────────────────────────────────────────────────────────
 
 from fastapi import FastAPI, Query
+from fastapi.responses import Response
 from pydantic import BaseModel
 
+# /health is a constant; serve pre-encoded bytes instead of re-serializing
+_HEALTH_RESPONSE = Response(
+    content=b'{"status":"ok","service":"soul-agent"}',
+    media_type="application/json",
+)
+
 
 class NoteRequest(BaseModel):
     text: str
@@ -176,13 +234,16 @@ def create_app() -> Any:
         from soul_agent.modules.browser import start_browser_monitor
         from soul_agent.modules.clipboard import start_clipboard_monitor
         from soul_agent.modules.filewatcher import start_file_watcher
-        from soul_agent.modules.insight import start_insight_thread
         from soul_agent.modules.pipeline import start_pipeline_thread
 
         engine = get_engine()
         engine.initialize(config_path=str(DEFAULT_CONFIG))
         state["engine"] = engine
 
+        # Record our PID so CLI liveness checks work for launchd starts too
+        PID_DIR.mkdir(parents=True, exist_ok=True)
+        PID_FILE.write_text(str(os.getpid()))
+
         # Ingest queue and classification pipeline
         ingest_queue = IngestQueue(batch_size=10, flush_interval=60)
         state["ingest_queue"] = ingest_queue
@@ -201,47 +262,54 @@ def create_app() -> Any:
         state["file_observer"] = file_observer
         state["file_stop"] = file_stop
 
-        # Insight thread (daily insight at 20:00)
-        insight_thread, insight_stop = start_insight_thread(engine)
-        state["insight_thread"] = insight_thread
-        state["insight_stop"] = insight_stop
-
         # Clipboard monitor (now with ingest queue)
         clip_thread, clip_running = start_clipboard_monitor(engine, ingest_queue=ingest_queue)
         state["clip_thread"] = clip_thread
         state["clip_running"] = clip_running
 
-        # Compaction scheduler thread
-        compact_stop = threading.Event()
-        compact_thread = threading.Thread(
-            target=_compaction_loop,
-            args=(engine, compact_stop),
+        # Maintenance thread (daily insight at 20:00, weekly compaction)
+        maintenance_stop = threading.Event()
+        maintenance_thread = threading.Thread(
+            target=_maintenance_loop,
+            args=(engine, maintenance_stop),
             daemon=True,
-            name="compaction-scheduler",
+            name="maintenance",
         )
-        compact_thread.start()
-        state["compact_thread"] = compact_thread
-        state["compact_stop"] = compact_stop
+        maintenance_thread.start()
+        state["maintenance_thread"] = maintenance_thread
+        state["maintenance_stop"] = maintenance_stop
 
         global _last_flush_time
         _last_flush_time = time.time()
 
         yield
 
-        # Shutdown all threads
+        # Shutdown: signal every worker first, then join against one deadline.
+        # Monitors run while their event is set (clear to stop); the
+        # maintenance loop waits on its event (set to stop).
+        _flush_cc_buffer(ingest_queue)
         clip_running.clear()
-        clip_thread.join(timeout=5)
-        compact_stop.set()
-        compact_thread.join(timeout=5)
+        maintenance_stop.set()
         pipeline_stop.clear()
-        pipeline_thread.join(timeout=5)
         browser_stop.clear()
-        browser_thread.join(timeout=5)
+        file_stop.clear()
         file_observer.stop()
-        file_observer.join(timeout=5)
-        insight_stop.clear()
-        insight_thread.join(timeout=5)
+
+        deadline = time.monotonic() + _SHUTDOWN_TIMEOUT
+        for worker in (
+            clip_thread,
+            maintenance_thread,
+            pipeline_thread,
+            browser_thread,
+            file_observer,
+        ):
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+        from soul_agent.modules.daily_log import flush_daily_log
+
+        flush_daily_log()
         engine.close()
+        if _read_pid() == os.getpid():
+            PID_FILE.unlink(missing_ok=True)
 
     app = FastAPI(title="soul-agent", lifespan=lifespan)
 
@@ -309,7 +377,7 @@ def create_app() -> Any:
 
     @app.get("/health")
     def get_health():
-        return {"status": "ok", "service": "soul-agent"}
+        return _HEALTH_RESPONSE
 
     # ── Phase 3 endpoints ─────────────────────────────────────────────
 
@@ -373,17 +441,21 @@ def create_app() -> Any:
 
     @app.post("/ingest/claudecode")
     async def ingest_claudecode(req: ClaudeCodeRequest):
-        from datetime import datetime
-
-        from soul_agent.core.queue import IngestItem
-
-        state["ingest_queue"].put(
-            IngestItem(text=req.text, source="claude-code", timestamp=datetime.now(), meta={})
-        )
+        global _cc_flush_handle
+        ingest_queue = state["ingest_queue"]
+        with _cc_lock:
+            _cc_buffer.append(req.text)
+            should_flush = len(_cc_buffer) >= _CC_FLUSH_COUNT
+            if not should_flush and _cc_flush_handle is None:
+                _cc_flush_handle = asyncio.get_running_loop().call_later(
+                    _CC_FLUSH_DELAY, _flush_cc_buffer, ingest_queue,
+                )
+        if should_flush:
+            _flush_cc_buffer(ingest_queue)
         return {"status": "queued"}
 
     @app.get("/insight")
-    async def get_insight(date: str = "today"):
+    def get_insight(date: str = "today"):
         from datetime import date as _date
 
         from soul_agent.modules.insight import build_daily_insight
@@ -393,6 +465,25 @@ def create_app() -> Any:
         report = build_daily_insight(target, engine)
         return {"date": target.isoformat(), "report": report}
 
+    @app.get("/insight/week")
+    def get_insight_week():
+        from concurrent.futures import ThreadPoolExecutor
+        from datetime import date as _date, timedelta
+
+        from soul_agent.modules.insight import build_daily_insight
+
+        engine = state["engine"]
+        today = _date.today()
+        dates = [today - timedelta(days=i) for i in range(6, -1, -1)]
+        # Each day may hit the LLM; build them concurrently, keep day order
+        with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+            reports = list(pool.map(lambda d: build_daily_insight(d, engine), dates))
+        return {
+            "reports": [
+                {"date": d.isoformat(), "report": r} for d, r in zip(dates, reports)
+            ]
+        }
+
     @app.post("/insight/generate")
     async def post_insight_generate():
         from datetime import date as _date
@@ -432,16 +523,16 @@ def create_app() -> Any:
     @app.get("/todo/progress/{todo_id}")
     async def get_todo_progress(todo_id: str):
         from soul_agent.core.frontmatter import parse_activity_log, parse_frontmatter
-        from soul_agent.modules.todo import ACTIVE_DIR
+        from soul_agent.modules.todo import ACTIVE_DIR, _read_id_prefix
 
         engine = state["engine"]
+        prefix = todo_id[:8]
         for filename in engine.list_resources(ACTIVE_DIR):
             content = engine.read_resource(f"{ACTIVE_DIR}/{filename}")
-            if content:
+            if content and _read_id_prefix(content) == prefix:
                 fields, body = parse_frontmatter(content)
-                if fields.get("id", "")[:8] == todo_id[:8]:
-                    activity = parse_activity_log(fields.get("activity_log", ""))
-                    return {"id": todo_id, "text": body.strip(), "activity": activity}
+                activity = parse_activity_log(fields.get("activity_log", ""))
+                return {"id": todo_id, "text": body.strip(), "activity": activity}
         return {"error": "not found"}
 
     @app.get("/input-hook/status")
@@ -516,6 +607,18 @@ def create_app() -> Any:
         answer = chat_with_soul(req.question, engine)
         return {"status": "ok", "answer": answer}
 
+    @app.post("/soul/chat/stream")
+    def post_soul_chat_stream(req: SoulChatRequest):
+        from fastapi.responses import StreamingResponse
+
+        from soul_agent.modules.soul import stream_chat_with_soul
+
+        # Sync generator: Starlette iterates it in the threadpool
+        return StreamingResponse(
+            stream_chat_with_soul(req.question, state["engine"]),
+            media_type="text/plain; charset=utf-8",
+        )
+
     @app.post("/soul/evolve")
     async def post_soul_evolve():
         from datetime import date as _date
@@ -543,10 +646,16 @@ def create_app() -> Any:
 
 def _read_pid() -> Optional[int]:
     """Read PID from file, return None if missing or stale."""
-    if not PID_FILE.exists():
+    try:
+        fd = os.open(PID_FILE, os.O_RDONLY)
+    except OSError:
         return None
     try:
-        pid = int(PID_FILE.read_text().strip())
+        raw = os.read(fd, 16)
+    finally:
+        os.close(fd)
+    try:
+        pid = int(raw)  # int() tolerates the surrounding whitespace
         os.kill(pid, 0)  # Check if process exists
         return pid
     except (ValueError, ProcessLookupError, PermissionError):
@@ -31,6 +31,15 @@ class TestConfig:
         assert result == {"a": {"b": "value"}}
         del os.environ["TEST_NESTED"]
 
+    def test_expand_env_vars_unset_and_mixed(self):
+        from soul_agent.core.config import _expand_env_vars
+
+        os.environ["TEST_HOST_123"] = "example.com"
+        os.environ.pop("TEST_UNSET_123", None)
+        result = _expand_env_vars(["https://${TEST_HOST_123}/v1", "${TEST_UNSET_123}", "plain", 3])
+        assert result == ["https://example.com/v1", "${TEST_UNSET_123}", "plain", 3]
+        del os.environ["TEST_HOST_123"]
+
     def test_load_config(self):
         from soul_agent.core.config import load_config
 
@@ -44,6 +53,19 @@ class TestConfig:
         finally:
             os.unlink(tmp)
 
+    def test_load_config_reparses_after_edit(self, tmp_path):
+        from soul_agent.core.config import load_config
+
+        path = tmp_path / "soul.json"
+        path.write_text(json.dumps({"vault_path": "/a"}))
+        first = load_config(path)
+        first["vault_path"] = "mutated"
+        assert load_config(path)["vault_path"] == "/a"
+
+        path.write_text(json.dumps({"vault_path": "/b"}))
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert load_config(path)["vault_path"] == "/b"
+
     def test_load_config_missing(self):
         from soul_agent.core.config import load_config
 
@@ -166,6 +188,14 @@ class TestService:
         assert "/compact" in paths
         assert "/daily-log" in paths
 
+    def test_health_returns_static_json(self):
+        from fastapi.testclient import TestClient
+        from soul_agent.service import app
+
+        resp = TestClient(app).get("/health")
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok", "service": "soul-agent"}
+
     def test_pid_helpers(self):
         from soul_agent.service import _read_pid, PID_FILE
 
@@ -173,6 +203,37 @@ class TestService:
             PID_FILE.unlink()
         assert _read_pid() is None
 
+    def test_flush_cc_buffer_coalesces(self):
+        from unittest.mock import MagicMock
+        from soul_agent import service
+
+        queue = MagicMock()
+        service._cc_buffer.extend(["first", "second"])
+        service._flush_cc_buffer(queue)
+        item = queue.put.call_args[0][0]
+        assert item.text == "first\n\nsecond"
+        assert item.source == "claude-code"
+        assert item.meta == {"messages": 2}
+        assert service._cc_buffer == []
+
+        service._flush_cc_buffer(queue)
+        queue.put.assert_called_once()
+
+    def test_read_pid_live_and_stale(self, tmp_path):
+        import os
+        from unittest.mock import patch
+
+        pid_file = tmp_path / "daemon.pid"
+        with patch("soul_agent.service.PID_FILE", pid_file):
+            from soul_agent.service import _read_pid
+
+            pid_file.write_text(f"{os.getpid()}\n")
+            assert _read_pid() == os.getpid()
+
+            pid_file.write_text("not-a-pid")
+            assert _read_pid() is None
+            assert not pid_file.exists()
+
 
 # ── Terminal tests ─────────────────────────────────────────────────────────
 
@@ -207,3 +268,40 @@ class TestCLI:
 
         cmd_names = [c.callback.__name__ if c.callback else "" for c in app.registered_commands]
         assert "compact" in cmd_names
+
+    def test_import_defers_httpx_and_rich(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, soul_agent.cli; "
+            "print('httpx' in sys.modules, 'rich.console' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False False"
+
+    def test_main_dispatches_single_group(self, capsys):
+        from unittest.mock import patch
+        from soul_agent.cli import main
+
+        with patch("sys.argv", ["soul", "todo", "--help"]), pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 0
+        assert "Manage todo items" in capsys.readouterr().out
+
+    def test_env_line_regex(self):
+        from soul_agent.cli import _ENV_LINE_RE
+
+        text = b"# comment\nFOO=bar\n  BAZ = qux  \nEMPTY=\n#X=1\nURL=http://a=b\r\nnoeq\n"
+        assert [(m[1], m[2]) for m in _ENV_LINE_RE.finditer(text)] == [
+            (b"FOO", b"bar"),
+            (b"BAZ", b"qux"),
+            (b"URL", b"http://a=b"),
+        ]
+
+    def test_plist_placeholders_all_matched(self):
+        from soul_agent.cli import _PKG_DIR, _PLIST_NAME, _PLIST_PLACEHOLDER_RE
+
+        template = (_PKG_DIR / "launchd" / _PLIST_NAME).read_text(encoding="utf-8")
+        rendered = _PLIST_PLACEHOLDER_RE.sub("X", template)
+        assert "__" not in rendered
@@ -76,6 +76,15 @@ class TestParseLLMResponse:
         result = _parse_llm_response("this is not json at all", count=1)
         assert result == []
 
+    def test_parses_without_orjson(self):
+        from unittest.mock import patch
+
+        from soul_agent.modules import classifier
+
+        with patch.object(classifier, "orjson", None):
+            assert classifier._parse_llm_response('[{"category": "life"}]', count=1) == [{"category": "life"}]
+            assert classifier._parse_llm_response("[oops", count=1) == []
+
     def test_json_with_markdown_fences(self):
         from soul_agent.modules.classifier import _parse_llm_response
 
@@ -105,6 +114,13 @@ class TestParseLLMResponse:
         result = _parse_llm_response(raw, count=2)
         assert result == []
 
+    def test_bare_json_containing_fence_text(self):
+        from soul_agent.modules.classifier import _parse_llm_response
+
+        raw = '[{"category": "coding", "summary": "wrap code in ```json``` fences"}]'
+        result = _parse_llm_response(raw, count=1)
+        assert result[0]["summary"] == "wrap code in ```json``` fences"
+
 
 class TestClassifyBatch:
     @patch(
@@ -201,3 +217,134 @@ class TestClassifyBatch:
         assert len(result) == 1
         assert result[0].action_type == "new_task"
         assert result[0].action_detail == "Finish quarterly report by Friday"
+
+    def test_unknown_category_falls_back_to_source_default(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import classify_batch
+
+        items = [IngestItem(text="make test", source="terminal", timestamp=datetime(2026, 2, 25, 10, 0, 0))]
+        reply = json.dumps([{"category": "gaming", "tags": ["t"], "importance": 2, "summary": "s"}])
+
+        with patch("soul_agent.modules.classifier.call_deepseek", return_value=reply):
+            result = classify_batch(items, active_todos=[], config={})
+
+        assert result[0].category == "coding"
+        assert result[0].tags == ["t"]
+
+    def test_trivial_items_skip_llm(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import classify_batch
+
+        ts = datetime(2026, 2, 25, 10, 0, 0)
+        items = [
+            IngestItem(text=" ", source="terminal", timestamp=ts),
+            IngestItem(text="写周报", source="note", timestamp=ts),
+            IngestItem(text="q", source="terminal", timestamp=ts),
+        ]
+        reply = json.dumps([{"category": "work", "tags": [], "importance": 4, "summary": "周报"}])
+
+        with patch("soul_agent.modules.classifier.call_deepseek", return_value=reply) as mock_call:
+            result = classify_batch(items, active_todos=[], config={})
+
+        assert "1. [note] 写周报" in mock_call.call_args[0][0]
+        assert "[terminal]" not in mock_call.call_args[0][0]
+        assert [r.importance for r in result] == [3, 4, 3]
+        assert [r.category for r in result] == ["coding", "work", "coding"]
+
+        with patch("soul_agent.modules.classifier.call_deepseek") as mock_call, \
+                patch("soul_agent.modules.classifier.call_deepseek_many") as mock_many:
+            result = classify_batch(items[::2], active_todos=[], config={})
+        mock_call.assert_not_called()
+        mock_many.assert_not_called()
+        assert len(result) == 2
+
+    def test_active_todos_listed_in_prompt(self):
+        from datetime import datetime
+        from types import SimpleNamespace
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import classify_batch
+
+        items = [IngestItem(text="make test", source="terminal", timestamp=datetime(2026, 2, 25, 10, 0, 0))]
+        expected = "  - [t1] 写周报\n  - [t2] review PR"
+
+        for todos in (
+            [{"id": "t1", "text": "写周报"}, {"id": "t2", "text": "review PR"}],
+            [SimpleNamespace(id="t1", text="写周报"), SimpleNamespace(id="t2", text="review PR")],
+        ):
+            with patch("soul_agent.modules.classifier.call_deepseek", return_value="") as mock_call:
+                classify_batch(items, active_todos=todos, config={})
+            assert expected in mock_call.call_args[0][0]
+
+    def test_repeated_items_classified_once(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import classify_batch
+
+        items = [
+            IngestItem(text="git push", source="terminal", timestamp=datetime(2026, 2, 25, 10, 0, i))
+            for i in range(3)
+        ]
+        reply = json.dumps([{"category": "coding", "tags": [], "importance": 4, "summary": "push"}])
+
+        with patch("soul_agent.modules.classifier.call_deepseek", return_value=reply) as mock_call:
+            result = classify_batch(items, active_todos=[], config={})
+
+        assert mock_call.call_args[0][0].count("git push") == 1
+        assert [r.importance for r in result] == [4, 4, 4]
+        assert [r.timestamp.second for r in result] == [0, 1, 2]
+
+    def test_full_queue_batch_sent_as_one_prompt(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import classify_batch
+
+        items = [
+            IngestItem(text=f"item {i}", source="terminal", timestamp=datetime(2026, 2, 25, 10, 0, 0))
+            for i in range(10)
+        ]
+
+        with patch("soul_agent.modules.classifier.call_deepseek", return_value="") as mock_call, \
+                patch("soul_agent.modules.classifier.call_deepseek_many") as mock_many:
+            classify_batch(items, active_todos=[], config={})
+
+        mock_call.assert_called_once()
+        mock_many.assert_not_called()
+
+    def test_large_batch_split_into_concurrent_chunks(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem
+        from soul_agent.modules.classifier import CLASSIFY_CHUNK_SIZE, classify_batch
+
+        items = [
+            IngestItem(text=f"item {i}", source="terminal", timestamp=datetime(2026, 2, 25, 10, 0, 0))
+            for i in range(CLASSIFY_CHUNK_SIZE + 3)
+        ]
+        full = json.dumps([{"category": "learning", "tags": [], "importance": 2, "summary": "s"}] * CLASSIFY_CHUNK_SIZE)
+
+        with patch(
+            "soul_agent.modules.classifier.call_deepseek_many",
+            return_value=[full, "garbage"],
+        ) as mock_many:
+            result = classify_batch(items, active_todos=[], config={})
+
+        prompts = mock_many.call_args[0][0]
+        assert len(prompts) == 2
+        last = f"item {CLASSIFY_CHUNK_SIZE + 2}"
+        assert last in prompts[1] and last not in prompts[0]
+        assert [r.category for r in result[:CLASSIFY_CHUNK_SIZE]] == ["learning"] * CLASSIFY_CHUNK_SIZE
+        # Unparseable chunk falls back to rules: terminal -> coding
+        assert [r.category for r in result[CLASSIFY_CHUNK_SIZE:]] == ["coding"] * 3
@@ -114,6 +114,38 @@ class TestUninstallHook:
                 uninstall_hook()
 
 
+    def test_uninstall_leaves_foreign_settings_untouched(self):
+        from pathlib import Path
+        from unittest.mock import patch
+
+        from soul_agent.modules.claude_code import uninstall_hook
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            raw = '{"hooks": {"postToolUse": [{"hooks": [{"description": "other"}]}]}}'
+            settings_path.write_text(raw, encoding="utf-8")
+            with patch("soul_agent.modules.claude_code.CLAUDE_SETTINGS", settings_path):
+                uninstall_hook()
+
+            assert settings_path.read_text(encoding="utf-8") == raw
+
+    def test_uninstall_shrinks_file_in_place(self):
+        from pathlib import Path
+        from unittest.mock import patch
+
+        from soul_agent.modules.claude_code import install_hook, uninstall_hook
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            settings_path.write_text('{"theme": "dark"}', encoding="utf-8")
+            with patch("soul_agent.modules.claude_code.CLAUDE_SETTINGS", settings_path):
+                install_hook()
+                uninstall_hook()
+
+            settings = json.loads(settings_path.read_text(encoding="utf-8"))
+            assert settings == {"theme": "dark", "hooks": {"postToolUse": []}}
+
+
 class TestHookScript:
     def test_hook_script_exists(self):
         from soul_agent.modules.claude_code import HOOK_SCRIPT
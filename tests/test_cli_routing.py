@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,32 +14,101 @@ from soul_agent.cli import app
 runner = CliRunner()
 
 
+def _response(payload: Any) -> MagicMock:
+    """Build a 200 daemon response whose body encodes *payload*."""
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.content = json.dumps(payload).encode()
+    resp.json.return_value = payload
+    return resp
+
+
 # ── Service detection ────────────────────────────────────────────────────────
 
 class TestServiceDetection:
-    def test_service_running_returns_true(self):
+    def test_service_running_returns_true(self, monkeypatch):
         from soul_agent.cli import _service_is_running
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp) as mock_get:
+        monkeypatch.setenv("SOUL_FORCE_HTTP_PROBE", "1")
+        with patch("http.client.HTTPConnection") as mock_conn:
+            mock_conn.return_value.getresponse.return_value.status = 200
             assert _service_is_running() is True
-            mock_get.assert_called_once()
+            mock_conn.return_value.request.assert_called_once_with("GET", "/health")
+            mock_conn.return_value.close.assert_called_once()
 
-    def test_service_not_running_returns_false(self):
+    def test_service_not_running_returns_false(self, monkeypatch):
         from soul_agent.cli import _service_is_running
 
-        with patch("soul_agent.cli.httpx.get", side_effect=Exception("connection refused")):
+        monkeypatch.setenv("SOUL_FORCE_HTTP_PROBE", "1")
+        with patch("http.client.HTTPConnection") as mock_conn:
+            mock_conn.return_value.request.side_effect = ConnectionRefusedError()
             assert _service_is_running() is False
 
-    def test_service_bad_status_returns_false(self):
+    def test_service_bad_status_returns_false(self, monkeypatch):
         from soul_agent.cli import _service_is_running
 
-        mock_resp = MagicMock()
-        mock_resp.status_code = 500
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        monkeypatch.setenv("SOUL_FORCE_HTTP_PROBE", "1")
+        with patch("http.client.HTTPConnection") as mock_conn:
+            mock_conn.return_value.getresponse.return_value.status = 500
             assert _service_is_running() is False
 
+    def test_pid_file_alive_skips_http(self, tmp_path, monkeypatch):
+        import os
+        from soul_agent.cli import _service_is_running
+
+        monkeypatch.delenv("SOUL_FORCE_HTTP_PROBE", raising=False)
+        pid_file = tmp_path / "daemon.pid"
+        pid_file.write_text(str(os.getpid()))
+        with patch("soul_agent.cli._PID_FILE", pid_file), \
+                patch("soul_agent.cli._port_open", return_value=True), \
+                patch("http.client.HTTPConnection") as mock_conn:
+            assert _service_is_running() is True
+            mock_conn.assert_not_called()
+
+    def test_live_pid_with_closed_port_returns_false(self, tmp_path, monkeypatch):
+        import os
+        from soul_agent.cli import _service_is_running
+
+        # A reused PID from a stale file, or a daemon that hasn't bound yet
+        monkeypatch.delenv("SOUL_FORCE_HTTP_PROBE", raising=False)
+        pid_file = tmp_path / "daemon.pid"
+        pid_file.write_text(str(os.getpid()))
+        with patch("soul_agent.cli._PID_FILE", pid_file), \
+                patch("soul_agent.cli._port_open", return_value=False):
+            assert _service_is_running() is False
+
+    def test_missing_pid_file_returns_false(self, tmp_path, monkeypatch):
+        from soul_agent.cli import _service_is_running
+
+        monkeypatch.delenv("SOUL_FORCE_HTTP_PROBE", raising=False)
+        with patch("soul_agent.cli._PID_FILE", tmp_path / "missing.pid"), \
+                patch("http.client.HTTPConnection") as mock_conn:
+            assert _service_is_running() is False
+            mock_conn.assert_not_called()
+
+    def test_http_client_is_shared(self):
+        from soul_agent.cli import _http
+
+        assert str(_http.base_url) == "http://127.0.0.1:8330"
+        first = _http._target
+        _http.headers
+        assert _http._target is first
+
+    def test_json_decodes_body_bytes(self):
+        from soul_agent.cli import _json
+
+        resp = MagicMock()
+        resp.content = b'{"todos": [{"id": "abc1"}]}'
+        assert _json(resp) == {"todos": [{"id": "abc1"}]}
+
+    def test_json_without_orjson_uses_httpx_decoder(self):
+        from soul_agent import cli
+
+        resp = MagicMock()
+        resp.json.return_value = {"ok": True}
+        with patch.object(cli, "orjson", None):
+            assert cli._json(resp) == {"ok": True}
+
     def test_api_url_builds_correctly(self):
         from soul_agent.cli import _api_url
 
@@ -50,10 +121,8 @@ class TestServiceDetection:
 class TestNoteRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_note_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok"}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp) as mock_post:
+        mock_resp = _response({"status": "ok"})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp) as mock_post:
             result = runner.invoke(app, ["note", "test note"])
             assert result.exit_code == 0
             assert "via service" in result.output
@@ -74,10 +143,8 @@ class TestNoteRouting:
 class TestTodoRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_add_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "todo_id": "abc12345"}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp) as mock_post:
+        mock_resp = _response({"status": "ok", "todo_id": "abc12345"})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp) as mock_post:
             result = runner.invoke(app, ["todo", "add", "buy milk"])
             assert result.exit_code == 0
             assert "abc12345" in result.output
@@ -85,16 +152,14 @@ class TestTodoRouting:
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_ls_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        mock_resp = _response({
             "status": "ok",
             "todos": [
                 {"id": "abc1", "text": "buy milk", "due": "2026-03-01", "priority": "normal"},
                 {"id": "def2", "text": "write tests", "due": "", "priority": "high"},
             ],
-        }
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["todo", "ls"])
             assert result.exit_code == 0
             assert "buy milk" in result.output
@@ -102,40 +167,52 @@ class TestTodoRouting:
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_ls_empty(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "todos": []}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "todos": []})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["todo", "ls"])
             assert result.exit_code == 0
             assert "No active todos" in result.output
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_done_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "success": True}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "success": True})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp):
             result = runner.invoke(app, ["todo", "done", "abc1"])
             assert result.exit_code == 0
             assert "marked as done" in result.output
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_done_not_found(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "success": False}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "success": False})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp):
             result = runner.invoke(app, ["todo", "done", "xyz9"])
             assert result.exit_code == 0
             assert "not found" in result.output
 
+    @patch("soul_agent.cli._service_is_running", return_value=False)
+    @patch("soul_agent.cli._init_engine")
+    @patch("soul_agent.modules.todo.complete_todo")
+    def test_todo_done_falls_back_to_local(self, mock_complete, mock_init, mock_svc):
+        result = runner.invoke(app, ["todo", "done", "abc1", "-c", "cfg.json"])
+        assert result.exit_code == 0
+        mock_init.assert_called_once_with("cfg.json")
+        mock_complete.assert_called_once_with("abc1")
+
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    @patch("soul_agent.cli._init_engine")
+    @patch("soul_agent.modules.todo.complete_todo")
+    def test_todo_done_falls_back_when_daemon_unreachable(self, mock_complete, mock_init, mock_svc):
+        import httpx
+
+        with patch("soul_agent.cli._http.post", side_effect=httpx.ConnectError("refused")):
+            result = runner.invoke(app, ["todo", "done", "abc1"])
+        assert result.exit_code == 0
+        mock_complete.assert_called_once_with("abc1")
+
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_todo_rm_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "success": True}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "success": True})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp):
             result = runner.invoke(app, ["todo", "rm", "abc1"])
             assert result.exit_code == 0
             assert "deleted" in result.output
@@ -146,24 +223,32 @@ class TestTodoRouting:
 class TestSearchRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_search_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        mock_resp = _response({
             "results": [
                 {"path": "logs/2026-02-28.md", "snippet": "test snippet", "filename": "2026-02-28.md"},
             ]
-        }
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["search", "test query"])
             assert result.exit_code == 0
             assert "1 results" in result.output
 
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    def test_search_piped_output_is_plain(self, mock_svc):
+        mock_resp = _response({
+            "results": [
+                {"path": "logs/2026-02-28.md", "snippet": "test snippet", "filename": "2026-02-28.md"},
+            ]
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
+            result = runner.invoke(app, ["search", "test query"])
+            assert "[1] 2026-02-28.md\ntest snippet\nlogs/2026-02-28.md\n" in result.output
+            assert "\u256d" not in result.output  # no panel border
+
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_search_no_results(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"results": []}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"results": []})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["search", "nothing"])
             assert result.exit_code == 0
             assert "No results found" in result.output
@@ -174,26 +259,22 @@ class TestSearchRouting:
 class TestRecallRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_recall_today_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        mock_resp = _response({
             "status": "ok",
             "data": {"date": "2026-02-26", "memories": ["did something"], "todos": []},
-        }
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["recall"])
             assert result.exit_code == 0
             assert "Daily Recall" in result.output
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_recall_week_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
+        mock_resp = _response({
             "status": "ok",
             "data": {"week_start": "2026-02-23", "items": ["weekly item"]},
-        }
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["recall", "--week"])
             assert result.exit_code == 0
             assert "Weekly Recall" in result.output
@@ -204,10 +285,8 @@ class TestRecallRouting:
 class TestCompactRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_compact_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "report": "# Weekly summary\nAll good.", "report_length": 30}
-        with patch("soul_agent.cli.httpx.post", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "report": "# Weekly summary\nAll good.", "report_length": 30})
+        with patch("soul_agent.cli._http.post", return_value=mock_resp):
             result = runner.invoke(app, ["compact"])
             assert result.exit_code == 0
             assert "via service" in result.output
@@ -218,20 +297,16 @@ class TestCompactRouting:
 class TestCoreRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_core_show_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "content": "# My Memory\nSome content"}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "content": "# My Memory\nSome content"})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["core", "show"])
             assert result.exit_code == 0
             assert "My Memory" in result.output
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_core_show_empty(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"status": "ok", "content": ""}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"status": "ok", "content": ""})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["core", "show"])
             assert result.exit_code == 0
             assert "No permanent memory" in result.output
@@ -242,20 +317,108 @@ class TestCoreRouting:
 class TestInsightRouting:
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_insight_today_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"date": "2026-02-26", "report": "Today was productive."}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"date": "2026-02-26", "report": "Today was productive."})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["insight", "today"])
             assert result.exit_code == 0
             assert "productive" in result.output
 
     @patch("soul_agent.cli._service_is_running", return_value=True)
     def test_insight_suggest_routes_to_http(self, mock_svc):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {"suggestions": "\u5de5\u4f5c\u5efa\u8bae: focus on tests"}
-        with patch("soul_agent.cli.httpx.get", return_value=mock_resp):
+        mock_resp = _response({"suggestions": "\u5de5\u4f5c\u5efa\u8bae: focus on tests"})
+        with patch("soul_agent.cli._http.get", return_value=mock_resp):
             result = runner.invoke(app, ["insight", "suggest"])
             assert result.exit_code == 0
             assert "focus on tests" in result.output
+
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    def test_insight_week_single_request(self, mock_svc):
+        mock_resp = _response({
+            "reports": [
+                {"date": "2026-02-25", "report": "first day"},
+                {"date": "2026-02-26", "report": "# x\n\n\u65e0\u6570\u636e"},
+                {"date": "2026-02-27", "report": "last day"},
+            ]
+        })
+        with patch("soul_agent.cli._http.get", return_value=mock_resp) as mock_get:
+            result = runner.invoke(app, ["insight", "week"])
+            assert result.exit_code == 0
+            mock_get.assert_called_once()
+            assert result.output.index("first day") < result.output.index("last day")
+            assert "\u65e0\u6570\u636e" not in result.output
+
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    def test_insight_week_falls_back_per_day(self, mock_svc):
+        def fake_get(path, params=None, timeout=None):
+            if path == "/insight/week":
+                resp = MagicMock()
+                resp.status_code = 404
+                return resp
+            return _response({"report": f"report-{params['date']}"})
+
+        with patch("soul_agent.cli._http.get", side_effect=fake_get) as mock_get:
+            result = runner.invoke(app, ["insight", "week"])
+            assert result.exit_code == 0
+            assert mock_get.call_count == 8
+            dates = [line for line in result.output.splitlines() if line.startswith("report-")]
+            assert dates == sorted(dates)
+            assert len(dates) == 7
+
+
+# ── Soul chat ────────────────────────────────────────────────────────────────
+
+class TestSoulChatRouting:
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    def test_chat_streams_from_daemon(self, mock_svc):
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.iter_text.return_value = iter(["你好，", "[bold]今天", "很充实"])
+        mock_stream = MagicMock()
+        mock_stream.return_value.__enter__.return_value = mock_resp
+        with patch("soul_agent.cli._http.stream", mock_stream), \
+                patch("soul_agent.cli._http.post") as mock_post:
+            result = runner.invoke(app, ["soul", "chat", "怎么样"])
+            assert result.exit_code == 0
+            # Chunks are printed verbatim, not parsed as markup
+            assert "你好，[bold]今天很充实" in result.output
+            mock_post.assert_not_called()
+        assert mock_stream.call_args[0][:2] == ("POST", "/soul/chat/stream")
+
+    @patch("soul_agent.cli._service_is_running", return_value=True)
+    def test_chat_falls_back_to_blocking_endpoint(self, mock_svc):
+        stream_resp = MagicMock()
+        stream_resp.status_code = 404
+        mock_stream = MagicMock()
+        mock_stream.return_value.__enter__.return_value = stream_resp
+        post_resp = _response({"status": "ok", "answer": "old daemon answer"})
+        with patch("soul_agent.cli._http.stream", mock_stream), \
+                patch("soul_agent.cli._http.post", return_value=post_resp):
+            result = runner.invoke(app, ["soul", "chat", "q"])
+            assert result.exit_code == 0
+            assert "old daemon answer" in result.output
+
+    @patch("soul_agent.cli._service_is_running", return_value=False)
+    @patch("soul_agent.cli._init_engine")
+    @patch("soul_agent.cli._get_engine")
+    def test_chat_streams_locally(self, mock_engine, mock_init, mock_svc):
+        with patch("soul_agent.modules.soul.stream_chat_with_soul", return_value=iter(["a", "b"])):
+            result = runner.invoke(app, ["soul", "chat", "q"])
+            assert result.exit_code == 0
+            assert "ab" in result.output
+
+
+class TestEditInEditor:
+    def test_unchanged_returns_none(self, monkeypatch):
+        from soul_agent.cli import _edit_in_editor
+
+        monkeypatch.setenv("EDITOR", "true")
+        assert _edit_in_editor("# Memory\n") is None
+
+    def test_edited_content_returned(self, tmp_path, monkeypatch):
+        from soul_agent.cli import _edit_in_editor
+
+        editor = tmp_path / "editor.sh"
+        editor.write_text('#!/bin/sh\necho "new line" >> "$1"\n')
+        editor.chmod(0o755)
+        monkeypatch.setenv("EDITOR", str(editor))
+        assert _edit_in_editor("# Memory\n") == "# Memory\nnew line\n"
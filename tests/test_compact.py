@@ -85,6 +85,60 @@ class TestCompactWeek:
         assert "Week" in result or "test" in result
 
 
+    @patch("soul_agent.modules.compact.call_deepseek", return_value="# Weekly Report\n- Did things")
+    def test_unchanged_logs_reuse_report(self, mock_llm):
+        from soul_agent.modules.compact import compact_week
+
+        store: dict[str, str] = {}
+        logs = {"text": "[10:00] (note) test entry"}
+
+        def mock_read(rel_path):
+            if "logs/" in rel_path:
+                return f"---\ndate: 2026-02-23\n---\n{logs['text']}"
+            return store.get(rel_path)
+
+        engine = MagicMock()
+        engine.config = {}
+        engine.read_resource.side_effect = mock_read
+        engine.list_resources.return_value = []
+        engine.write_resource.side_effect = (
+            lambda content, directory, filename: store.__setitem__(f"{directory}/{filename}", content)
+        )
+
+        first = compact_week(date(2026, 2, 23), engine)
+        second = compact_week(date(2026, 2, 23), engine)
+        assert first == second
+        assert mock_llm.call_count == 1
+        assert engine.write_resource.call_count == 1
+
+        logs["text"] = "[11:00] (note) new entry"
+        compact_week(date(2026, 2, 23), engine)
+        assert mock_llm.call_count == 2
+
+    @patch("soul_agent.modules.compact.call_deepseek", return_value="")
+    def test_fallback_report_is_retried(self, mock_llm):
+        from soul_agent.modules.compact import compact_week
+
+        store: dict[str, str] = {}
+
+        def mock_read(rel_path):
+            if "logs/" in rel_path:
+                return "---\ndate: 2026-02-23\n---\n[10:00] (note) test"
+            return store.get(rel_path)
+
+        engine = MagicMock()
+        engine.config = {}
+        engine.read_resource.side_effect = mock_read
+        engine.list_resources.return_value = []
+        engine.write_resource.side_effect = (
+            lambda content, directory, filename: store.__setitem__(f"{directory}/{filename}", content)
+        )
+
+        compact_week(date(2026, 2, 23), engine)
+        compact_week(date(2026, 2, 23), engine)
+        assert mock_llm.call_count == 2
+
+
 class TestCompactMonth:
     @patch("soul_agent.modules.compact.call_deepseek", return_value="# Monthly Report\n- Overview")
     def test_compact_with_weekly_reports(self, mock_llm):
@@ -111,7 +165,7 @@ class TestCompactMonth:
         engine.config = {}
 
         # list_resources returns empty for insights (no weekly reports)
-        def mock_list(directory):
+        def mock_list(directory, pattern=None):
             return []
         engine.list_resources.side_effect = mock_list
 
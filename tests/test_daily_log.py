@@ -49,9 +49,12 @@ class TestAppendDailyLog:
 
         append_daily_log("second entry", "clipboard", engine)
 
-        engine.write_resource.assert_called_once()
-        content = engine.write_resource.call_args.kwargs["content"]
-        assert "first entry" in content
+        # Existing logs are appended to, not rewritten
+        engine.write_resource.assert_not_called()
+        engine.append_resource.assert_called_once()
+        content = engine.append_resource.call_args.kwargs["content"]
+        assert "first entry" not in content
+        assert content.startswith("\n[")
         assert "(clipboard) second entry" in content
 
     def test_log_filename_format(self):
@@ -66,6 +69,129 @@ class TestAppendDailyLog:
         assert filename == f"{date.today().isoformat()}.md"
 
 
+class TestBufferedWrites:
+    def test_burst_is_batched_until_flush(self):
+        from soul_agent.modules.daily_log import append_daily_log, flush_daily_log
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+
+        for i in range(5):
+            append_daily_log(f"entry {i}", "note", engine)
+        assert engine.write_resource.call_count == 1
+
+        flush_daily_log()
+        assert engine.write_resource.call_count == 1
+        engine.append_resource.assert_called_once()
+        content = engine.append_resource.call_args.kwargs["content"]
+        assert "entry 0" not in content
+        assert all(f"entry {i}" in content for i in range(1, 5))
+
+    def test_batch_size_forces_write(self):
+        from soul_agent.modules.daily_log import FLUSH_BATCH, append_daily_log
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+
+        for i in range(FLUSH_BATCH + 1):
+            append_daily_log(f"entry {i}", "note", engine)
+        assert engine.write_resource.call_count == 1
+        assert engine.append_resource.call_count == 1
+
+    def test_timer_writes_leftovers(self):
+        import time
+
+        from soul_agent.modules import daily_log
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+
+        with patch.object(daily_log, "FLUSH_INTERVAL", 0.05):
+            daily_log.append_daily_log("first", "note", engine)
+            daily_log.append_daily_log("second", "note", engine)
+            assert engine.write_resource.call_count == 1
+            time.sleep(0.3)
+
+        assert engine.append_resource.call_count == 1
+        assert "second" in engine.append_resource.call_args.kwargs["content"]
+
+    def test_get_daily_log_sees_buffered_entries(self):
+        from soul_agent.modules.daily_log import append_daily_log, get_daily_log
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+
+        append_daily_log("first", "note", engine)
+        append_daily_log("buffered", "note", engine)
+
+        assert "buffered" in get_daily_log(date.today(), engine)
+
+    def test_reads_not_blocked_by_slow_write(self):
+        import threading
+
+        from soul_agent.modules.daily_log import append_daily_log, get_daily_log
+
+        writing = threading.Event()
+        release = threading.Event()
+
+        def slow_write(**kwargs):
+            writing.set()
+            release.wait(5)
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+        engine.write_resource.side_effect = slow_write
+
+        writer = threading.Thread(target=append_daily_log, args=("first", "note", engine))
+        writer.start()
+        try:
+            assert writing.wait(5)
+            assert "first" in get_daily_log(date.today(), engine)
+            append_daily_log("second", "note", engine)
+        finally:
+            release.set()
+            writer.join(5)
+
+        assert "second" in get_daily_log(date.today(), engine)
+
+    def test_failed_write_is_retried(self):
+        from soul_agent.modules.daily_log import append_daily_log, flush_daily_log
+
+        engine = MagicMock()
+        engine.read_resource.return_value = None
+        engine.write_resource.side_effect = [OSError("disk full"), None]
+
+        with pytest.raises(OSError):
+            append_daily_log("first", "note", engine)
+        flush_daily_log()
+
+        assert engine.write_resource.call_count == 2
+        assert "first" in engine.write_resource.call_args.kwargs["content"]
+
+    def test_file_matches_full_render_after_appends(self, tmp_path):
+        from soul_agent.core.frontmatter import build_frontmatter
+        from soul_agent.core.vault import VaultEngine
+        from soul_agent.modules.daily_log import LOGS_DIR, append_daily_log, flush_daily_log
+
+        log_file = tmp_path / LOGS_DIR / f"{date.today().isoformat()}.md"
+        log_file.parent.mkdir()
+        log_file.write_text("---\ndate: 2026-02-23\nmood: ok\n---\n[09:00] (note) first", encoding="utf-8")
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None):
+            append_daily_log("second", "note", engine)
+            append_daily_log("third", "note", engine)
+            flush_daily_log()
+
+        content = log_file.read_text(encoding="utf-8")
+        body = content.split("---\n", 2)[2]
+        assert content == build_frontmatter({"date": "2026-02-23", "mood": "ok"}, body)
+        lines = body.split("\n")
+        assert lines[0] == "[09:00] (note) first"
+        assert lines[1].endswith("(note) second")
+        assert lines[2].endswith("(note) third")
+
+
 class TestGetDailyLog:
     def test_get_existing_log(self):
         from soul_agent.modules.daily_log import get_daily_log
@@ -113,7 +239,7 @@ class TestAppendClassifiedLog:
             return None
         engine.read_resource.side_effect = mock_read
         append_daily_log("read article about Rust", "browser", engine, category="learning", tags=["rust"], importance=2)
-        engine.write_resource.assert_called_once()
-        content = engine.write_resource.call_args.kwargs.get("content", "")
-        assert "[coding] first entry" in content
+        engine.append_resource.assert_called_once()
+        content = engine.append_resource.call_args.kwargs.get("content", "")
+        assert "[coding] first entry" not in content
         assert "[learning]" in content
@@ -58,6 +58,21 @@ class TestShouldIgnore:
 
         assert _should_ignore("/home/user/project/.venv/lib/python3.12/site.py") is True
 
+    def test_ignore_dir_must_be_whole_component(self):
+        from soul_agent.modules.filewatcher import _should_ignore
+
+        assert _should_ignore("/home/user/distro/notes.md") is False
+        assert _should_ignore("/home/user/mylogs/notes.md") is False
+        assert _should_ignore("/home/user/project/build/out.txt") is True
+
+    def test_accepts_path_and_uppercase_extension(self):
+        from pathlib import Path
+
+        from soul_agent.modules.filewatcher import _should_ignore
+
+        assert _should_ignore(Path("/home/user/photos/IMG_001.JPG")) is True
+        assert _should_ignore(Path("/home/user/notes/plan.md")) is False
+
 
 class TestExtractPreview:
     def test_extract_preview_basic(self):
@@ -87,6 +102,48 @@ class TestExtractPreview:
         finally:
             os.unlink(path)
 
+    def test_extract_preview_multibyte(self, tmp_path):
+        from soul_agent.modules.filewatcher import _extract_preview
+
+        f = tmp_path / "笔记.txt"
+        f.write_text("灵魂" * 300, encoding="utf-8")
+        assert _extract_preview(f, max_chars=200) == "灵魂" * 100
+
+    def test_extract_preview_skips_large_and_non_regular(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.modules import filewatcher
+
+        f = tmp_path / "big.txt"
+        f.write_text("x" * 64, encoding="utf-8")
+        with patch.object(filewatcher, "_PREVIEW_MAX_FILE_SIZE", 32):
+            assert filewatcher._extract_preview(f) == ""
+        assert filewatcher._extract_preview(tmp_path) == ""
+
+    def test_extract_preview_rejects_binary(self, tmp_path):
+        from soul_agent.modules.filewatcher import _extract_preview
+
+        f = tmp_path / "blob.txt"
+        f.write_bytes(b"abc\x00def")
+        assert _extract_preview(f) == ""
+
+    def test_extract_preview_cached_until_file_changes(self, tmp_path):
+        import os
+        from unittest.mock import patch
+
+        from soul_agent.modules import filewatcher
+
+        f = tmp_path / "note.txt"
+        f.write_text("first", encoding="utf-8")
+        with patch("soul_agent.modules.filewatcher.os.read", wraps=os.read) as mock_read:
+            assert filewatcher._extract_preview(f) == "first"
+            assert filewatcher._extract_preview(f) == "first"
+            assert mock_read.call_count == 1
+
+            f.write_text("second!", encoding="utf-8")
+            assert filewatcher._extract_preview(f) == "second!"
+            assert mock_read.call_count == 2
+
     def test_extract_preview_missing_file(self):
         from soul_agent.modules.filewatcher import _extract_preview
 
@@ -166,3 +223,31 @@ class TestFileHandler:
             assert item.meta["event_type"] == "created"
         finally:
             os.unlink(path)
+
+    def test_handler_coalesces_bursts_per_path(self):
+        from unittest.mock import MagicMock, patch
+
+        from soul_agent.modules import filewatcher
+
+        queue = MagicMock()
+        handler = filewatcher._FileHandler(queue)
+
+        def event(path, kind="modified"):
+            e = MagicMock()
+            e.is_directory = False
+            e.src_path = path
+            e.event_type = kind
+            return e
+
+        clock = [100.0]
+        with patch.object(filewatcher._time, "monotonic", lambda: clock[0]):
+            handler.dispatch(event("/home/user/a.md", "created"))
+            handler.dispatch(event("/home/user/a.md"))
+            handler.dispatch(event("/home/user/b.md"))
+            assert queue.put.call_count == 2
+
+            clock[0] += filewatcher._DEDUP_WINDOW
+            handler.dispatch(event("/home/user/a.md"))
+            assert queue.put.call_count == 3
+            # Only the path just accepted is still inside the window
+            assert list(handler._recent) == ["/home/user/a.md"]
@@ -14,7 +14,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from soul_agent.core.queue import IngestItem, IngestQueue
-from soul_agent.modules.daily_log import LOGS_DIR, append_daily_log, clear_daily_log_cache
+from soul_agent.modules.daily_log import LOGS_DIR, append_daily_log, clear_daily_log_cache, flush_daily_log
 
 
 # ---------------------------------------------------------------------------
@@ -583,6 +583,7 @@ class TestEndToEndPipeline:
             )
             mock_classify.return_value = [classified]
             process_batch([item], vault_engine)
+        flush_daily_log()
 
         today = date.today().isoformat()
         log_path = vault_engine.vault_root / LOGS_DIR / f"{today}.md"
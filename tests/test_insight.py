@@ -84,7 +84,7 @@ class TestComputeTimeAllocation:
         assert result["learning"]["count"] == 1
         assert result["learning"]["percent"] == 25.0
         assert result["work"]["count"] == 1
-        assert len(result["coding"]["entries"]) == 2
+        assert set(result["coding"]) == {"count", "percent"}
 
     def test_empty_entries(self):
         from soul_agent.modules.insight import compute_time_allocation
@@ -205,7 +205,10 @@ class TestBuildDailyInsight:
 
 
 class TestSaveDailyInsight:
-    @patch("soul_agent.modules.insight.build_daily_insight", return_value="# Insight Report\nsome content")
+    @patch(
+        "soul_agent.modules.insight._build_daily_insight",
+        return_value=("# Insight Report\nsome content", None, False),
+    )
     def test_save_daily_insight(self, mock_build):
         from soul_agent.modules.insight import save_daily_insight
 
@@ -218,6 +221,58 @@ class TestSaveDailyInsight:
         call_kwargs = engine.write_resource.call_args.kwargs
         assert "daily-2026-02-25.md" in call_kwargs["filename"]
 
+    def _vault_engine(self):
+        """MagicMock engine that serves today's log and remembers written files."""
+        files = {
+            "logs/2026-02-25.md": (
+                "---\ndate: 2026-02-25\n---\n"
+                "[10:00] (terminal) [coding] wrote unit tests\n"
+                "[14:00] (note) [work] plan the release"
+            ),
+        }
+        engine = MagicMock()
+        engine.config = {}
+        engine.read_resource.side_effect = files.get
+        engine.list_resources.return_value = []
+        engine.search.return_value = []
+        engine.write_resource.side_effect = (
+            lambda content, directory, filename: files.__setitem__(f"{directory}/{filename}", content)
+        )
+        return engine, files
+
+    @patch("soul_agent.modules.insight.call_deepseek", return_value="- 建议")
+    def test_unchanged_inputs_reuse_saved_report(self, mock_llm):
+        from soul_agent.modules.insight import build_daily_insight, save_daily_insight
+
+        engine, files = self._vault_engine()
+        with patch("soul_agent.modules.memory.extract_memories", return_value=[]) as mock_extract:
+            first = save_daily_insight(date(2026, 2, 25), engine)
+            second = save_daily_insight(date(2026, 2, 25), engine)
+
+        assert mock_llm.call_count == 2
+        assert engine.write_resource.call_count == 1
+        mock_extract.assert_called_once()
+        assert second == first.rstrip("\n")
+        assert build_daily_insight(date(2026, 2, 25), engine) == second
+        assert mock_llm.call_count == 2
+
+        # A new log entry changes the inputs, so the report is rebuilt
+        files["logs/2026-02-25.md"] += "\n[16:00] (terminal) [coding] fixed a bug"
+        with patch("soul_agent.modules.memory.extract_memories", return_value=[]):
+            save_daily_insight(date(2026, 2, 25), engine)
+        assert mock_llm.call_count == 4
+
+    @patch("soul_agent.modules.insight.call_deepseek", return_value=None)
+    def test_failed_llm_report_not_reused(self, mock_llm):
+        from soul_agent.modules.insight import build_daily_insight, save_daily_insight
+
+        engine, files = self._vault_engine()
+        save_daily_insight(date(2026, 2, 25), engine)
+        build_daily_insight(date(2026, 2, 25), engine)
+
+        assert "source_hash" not in files["insights/daily-2026-02-25.md"]
+        assert mock_llm.call_count == 4
+
 
 class TestFilterAndCluster:
     def test_is_noise(self):
@@ -247,6 +302,8 @@ class TestFilterAndCluster:
         assert _time_period("09:30") == "上午"
         assert _time_period("12:00") == "下午"
         assert _time_period("18:00") == "晚上"
+        # ENTRY_PATTERN's \d also matches non-ASCII digits
+        assert _time_period("０９:30") == "上午"
 
     def test_cluster_consecutive_entries(self):
         from soul_agent.modules.insight import _filter_and_cluster_entries
@@ -276,17 +333,89 @@ class TestFilterAndCluster:
         assert filtered[0]["text"] == "Edited main.py"
 
 
-class TestStartInsightThread:
-    def test_starts_and_stops(self):
-        from soul_agent.modules.insight import start_insight_thread
+class TestGetActiveTodosDetail:
+    def test_reads_all_active_todos_in_order(self):
+        from soul_agent.modules.insight import _get_active_todos_detail
 
+        files = {
+            f"todos/active/t{i}.md": f"---\nid: t{i}\npriority_label: high\n---\ntask {i}\n"
+            for i in range(20)
+        }
         engine = MagicMock()
-        engine.config = {}
-        engine.read_resource.return_value = None
-        engine.list_resources.return_value = []
+        engine.list_resources.return_value = [".hidden.md", "notes.txt"] + [f"t{i}.md" for i in range(20)]
+        engine.read_resource.side_effect = files.get
+
+        todos = _get_active_todos_detail(engine)
+
+        assert [t["id"] for t in todos] == [f"t{i}" for i in range(20)]
+        assert todos[3] == {"id": "t3", "text": "task 3", "due": "", "priority": "high", "created": ""}
+        assert engine.read_resource.call_count == 20
+
+    def test_unchanged_todo_not_reparsed(self):
+        from soul_agent.modules import insight
+
+        engine = MagicMock()
+        engine.list_resources.return_value = ["a.md"]
+        engine.read_resource.return_value = "---\nid: a\n---\nship it"
+
+        with patch.object(insight, "parse_frontmatter", wraps=insight.parse_frontmatter) as mock_parse:
+            insight._parse_todo.cache_clear()
+            first = insight._get_active_todos_detail(engine)
+            second = insight._get_active_todos_detail(engine)
+
+        assert first == second
+        assert mock_parse.call_count == 1
 
-        thread, stop_event = start_insight_thread(engine)
-        assert thread.is_alive()
-        stop_event.clear()
-        thread.join(timeout=3)
-        assert not thread.is_alive()
+
+class TestRunDailyInsightTick:
+    def test_generates_once_after_cutoff(self):
+        from datetime import datetime
+        from soul_agent.modules import insight
+
+        engine = MagicMock()
+        with patch.object(insight, "datetime") as mock_dt, \
+                patch.object(insight, "save_daily_insight") as mock_save:
+            mock_dt.now.return_value = datetime(2026, 3, 1, 20, 30)
+            assert insight.run_daily_insight_tick(engine, None) == date(2026, 3, 1)
+            assert insight.run_daily_insight_tick(engine, date(2026, 3, 1)) == date(2026, 3, 1)
+            mock_save.assert_called_once()
+
+    def test_next_day_generates_without_midnight_tick(self):
+        from datetime import datetime
+        from soul_agent.modules import insight
+
+        engine = MagicMock()
+        with patch.object(insight, "datetime") as mock_dt, \
+                patch.object(insight, "save_daily_insight") as mock_save:
+            # No tick lands between 00:00 and 00:01; the next day still runs
+            mock_dt.now.return_value = datetime(2026, 3, 1, 23, 59, 30)
+            generated_on = insight.run_daily_insight_tick(engine, None)
+            mock_dt.now.return_value = datetime(2026, 3, 2, 0, 1, 30)
+            generated_on = insight.run_daily_insight_tick(engine, generated_on)
+            mock_dt.now.return_value = datetime(2026, 3, 2, 20, 0, 30)
+            assert insight.run_daily_insight_tick(engine, generated_on) == date(2026, 3, 2)
+
+        assert [c.args[0] for c in mock_save.call_args_list] == [date(2026, 3, 1), date(2026, 3, 2)]
+
+    def test_skips_before_cutoff(self):
+        from datetime import datetime
+        from soul_agent.modules import insight
+
+        engine = MagicMock()
+        with patch.object(insight, "datetime") as mock_dt, \
+                patch.object(insight, "save_daily_insight") as mock_save:
+            mock_dt.now.return_value = datetime(2026, 3, 1, 9, 0)
+            assert insight.run_daily_insight_tick(engine, None) is None
+            mock_save.assert_not_called()
+
+    def test_seconds_until_next_insight(self):
+        from datetime import datetime
+        from soul_agent.modules.insight import seconds_until_insight
+
+        evening = datetime(2026, 3, 1, 19, 0)
+        assert seconds_until_insight(evening, None) == 3600
+        assert seconds_until_insight(evening, date(2026, 2, 28)) == 3600
+
+        night = datetime(2026, 3, 1, 21, 0)
+        assert seconds_until_insight(night, None) == 0
+        assert seconds_until_insight(night, date(2026, 3, 1)) == 23 * 3600
@@ -7,6 +7,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_cache():
+    from soul_agent.core import llm
+
+    llm._client_cache.clear()
+    yield
+    llm._client_cache.clear()
+
+
 class TestCallDeepseek:
     @patch("openai.OpenAI")
     @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
@@ -23,10 +32,11 @@ class TestCallDeepseek:
         result = call_deepseek("hello", system="be helpful")
 
         assert result == "test response"
-        mock_openai_cls.assert_called_once_with(
-            api_key="sk-test",
-            base_url="https://api.deepseek.com",
-        )
+        mock_openai_cls.assert_called_once()
+        kwargs = mock_openai_cls.call_args.kwargs
+        assert kwargs["api_key"] == "sk-test"
+        assert kwargs["base_url"] == "https://api.deepseek.com"
+        assert kwargs["http_client"] is not None
         call_args = mock_client.chat.completions.create.call_args
         messages = call_args.kwargs["messages"]
         assert len(messages) == 2
@@ -52,6 +62,14 @@ class TestCallDeepseek:
         assert len(messages) == 1
         assert messages[0]["role"] == "user"
 
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_blank_prompt_skips_api(self, mock_key, mock_openai_cls):
+        from soul_agent.core.llm import call_deepseek
+
+        assert call_deepseek("   \n") == ""
+        mock_openai_cls.assert_not_called()
+
     @patch("soul_agent.core.config.get_deepseek_api_key", return_value="")
     def test_no_api_key_returns_empty(self, mock_key):
         from soul_agent.core.llm import call_deepseek
@@ -85,3 +103,161 @@ class TestCallDeepseek:
 
         result = call_deepseek("hello")
         assert result == ""
+
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_client_reused_across_calls(self, mock_key, mock_openai_cls):
+        from soul_agent.core.llm import call_deepseek
+
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "ok"
+        mock_client.chat.completions.create.return_value = mock_response
+
+        call_deepseek("one")
+        call_deepseek("two")
+
+        mock_openai_cls.assert_called_once()
+        assert mock_client.chat.completions.create.call_count == 2
+
+
+class TestLLMCache:
+    def test_put_get_roundtrip(self, tmp_path):
+        from soul_agent.core.llm import _LLMCache
+
+        cache = _LLMCache(tmp_path / "c.sqlite", ttl=60, max_entries=10)
+        key = _LLMCache.cache_key("sys", "prompt", 512)
+        assert cache.get(key) is None
+        cache.put(key, "answer")
+        assert cache.get(key) == "answer"
+        assert key != _LLMCache.cache_key("sys", "prompt", 1024)
+        cache.close()
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        from soul_agent.core.llm import _LLMCache
+
+        cache = _LLMCache(tmp_path / "c.sqlite", ttl=60, max_entries=10)
+        cache.put("k", "v")
+        with patch("soul_agent.core.llm.time.time", return_value=10**12):
+            assert cache.get("k") is None
+        cache.close()
+
+    def test_evicts_oldest_beyond_max(self, tmp_path):
+        from soul_agent.core.llm import _LLMCache
+
+        cache = _LLMCache(tmp_path / "c.sqlite", ttl=3600, max_entries=2)
+        for i, now in enumerate((100.0, 200.0, 300.0)):
+            with patch("soul_agent.core.llm.time.time", return_value=1_000_000 + now):
+                cache.put(f"k{i}", f"v{i}")
+        with patch("soul_agent.core.llm.time.time", return_value=1_000_400.0):
+            assert cache.get("k0") is None
+            assert cache.get("k2") == "v2"
+        cache.close()
+
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_call_served_from_cache(self, mock_key, mock_openai_cls, tmp_path):
+        from soul_agent.core import llm
+
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "cached answer"
+        mock_client.chat.completions.create.return_value = mock_response
+
+        config = {"vault_path": str(tmp_path), "llm": {"cache": {"enabled": True}}}
+        with patch.object(llm, "_response_cache", None):
+            assert llm.call_deepseek("hi", config=config) == "cached answer"
+            assert llm.call_deepseek("hi", config=config) == "cached answer"
+            llm._response_cache.close()
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert (tmp_path / llm.CACHE_FILE).exists()
+
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_cache_disabled_by_default(self, mock_key, mock_openai_cls, tmp_path):
+        from soul_agent.core import llm
+
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "fresh"
+        mock_client.chat.completions.create.return_value = mock_response
+
+        config = {"vault_path": str(tmp_path), "llm": {}}
+        llm.call_deepseek("hi", config=config)
+        llm.call_deepseek("hi", config=config)
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert not (tmp_path / llm.CACHE_FILE).exists()
+
+
+class TestCallDeepseekMany:
+    def test_preserves_order(self):
+        from soul_agent.core.llm import call_deepseek_many
+
+        with patch("soul_agent.core.llm.call_deepseek", side_effect=lambda p, **kw: p.upper()) as mock_call:
+            assert call_deepseek_many(["a", "b", "c"], system="s") == ["A", "B", "C"]
+        assert mock_call.call_count == 3
+        assert mock_call.call_args.kwargs["system"] == "s"
+
+    def test_empty(self):
+        from soul_agent.core.llm import call_deepseek_many
+
+        assert call_deepseek_many([]) == []
+
+    def test_memo_serves_repeats_without_sqlite(self, tmp_path):
+        from soul_agent.core.llm import _LLMCache
+
+        cache = _LLMCache(tmp_path / "c.sqlite", ttl=60, max_entries=10)
+        cache.put("k", "v")
+        cache._conn.execute("DELETE FROM responses")
+        assert cache.get("k") == "v"
+        cache.close()
+
+    def test_memo_filled_from_sqlite_hit(self, tmp_path):
+        from soul_agent.core.llm import _LLMCache
+
+        first = _LLMCache(tmp_path / "c.sqlite", ttl=60, max_entries=10)
+        first.put("k", "v")
+        first.close()
+
+        second = _LLMCache(tmp_path / "c.sqlite", ttl=60, max_entries=10)
+        assert second.get("k") == "v"
+        assert "k" in second._memo
+        second.close()
+
+
+class TestCallDeepseekStream:
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_yields_deltas(self, mock_key, mock_openai_cls):
+        from soul_agent.core.llm import call_deepseek_stream
+
+        def event(text):
+            e = MagicMock()
+            e.choices = [MagicMock()]
+            e.choices[0].delta.content = text
+            return e
+
+        empty = MagicMock()
+        empty.choices = []
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = iter([event("Hel"), empty, event(None), event("lo")])
+
+        assert list(call_deepseek_stream("hi")) == ["Hel", "lo"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @patch("openai.OpenAI")
+    @patch("soul_agent.core.config.get_deepseek_api_key", return_value="sk-test")
+    def test_error_yields_nothing(self, mock_key, mock_openai_cls):
+        from soul_agent.core.llm import call_deepseek_stream
+
+        mock_openai_cls.return_value.chat.completions.create.side_effect = Exception("boom")
+        assert list(call_deepseek_stream("hi")) == []
@@ -49,3 +49,174 @@ class TestMCPResourceDefinitions:
         for r in RESOURCE_DEFINITIONS:
             assert "name" in r
             assert "description" in r
+
+
+class TestCallDaemon:
+    def test_reuses_shared_client(self):
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from soul_agent import mcp_server
+
+        calls: list = []
+
+        async def fake_request(method, path, **kwargs):
+            calls.append((method, path))
+            resp = MagicMock()
+            resp.json.return_value = {"ok": True}
+            return resp
+
+        fake = MagicMock()
+        fake.request = fake_request
+
+        async def run():
+            return [
+                await mcp_server._acall_daemon("GET", "/health"),
+                await mcp_server._acall_daemon("GET", "/todo/list"),
+            ]
+
+        with patch.object(mcp_server, "_aclient", fake):
+            assert asyncio.run(run()) == [{"ok": True}, {"ok": True}]
+
+        assert calls == [("GET", "/health"), ("GET", "/todo/list")]
+
+    def test_handlers_overlap_daemon_requests(self):
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        from soul_agent import mcp_server
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(method, path, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            resp = MagicMock()
+            resp.json.return_value = {"path": path}
+            return resp
+
+        fake = MagicMock()
+        fake.request = fake_request
+
+        async def run():
+            return await asyncio.gather(
+                mcp_server.handle_tool_call("soul_todos", {"status": "all"}),
+                mcp_server.handle_resource_read("soul://core/memory"),
+            )
+
+        with patch.object(mcp_server, "_aclient", fake):
+            results = asyncio.run(run())
+
+        assert peak == 2
+        assert '"/todo/list"' in results[0]
+        assert '"/abstract/core/MEMORY.md"' in results[1]
+
+    def test_connect_timeout_reported_as_daemon_down(self):
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        import httpx
+
+        from soul_agent import mcp_server
+
+        async def fake_request(method, path, **kwargs):
+            raise httpx.ConnectTimeout("timed out")
+
+        fake = MagicMock()
+        fake.request = fake_request
+        with patch.object(mcp_server, "_aclient", fake):
+            result = asyncio.run(mcp_server._acall_daemon("GET", "/health"))
+
+        assert "daemon is not running" in result
+
+
+class TestReadCache:
+    def _fake_client(self, calls):
+        from unittest.mock import MagicMock
+
+        async def fake_request(method, path, **kwargs):
+            calls.append((method, path))
+            resp = MagicMock()
+            resp.json.return_value = {"content": f"v{len(calls)}"}
+            return resp
+
+        fake = MagicMock()
+        fake.request = fake_request
+        return fake
+
+    def test_repeated_reads_hit_cache(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from soul_agent import mcp_server
+
+        calls: list = []
+        with patch.object(mcp_server, "_aclient", self._fake_client(calls)), \
+                patch.object(mcp_server, "_read_cache", {}):
+            first = asyncio.run(mcp_server.handle_resource_read("soul://core/memory"))
+            second = asyncio.run(mcp_server.handle_resource_read("soul://core/memory"))
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_note_invalidates_cache(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from soul_agent import mcp_server
+
+        calls: list = []
+        with patch.object(mcp_server, "_aclient", self._fake_client(calls)), \
+                patch.object(mcp_server, "_read_cache", {}):
+            asyncio.run(mcp_server.handle_resource_read("soul://insight/today"))
+            asyncio.run(mcp_server.handle_tool_call("soul_note", {"text": "hi"}))
+            asyncio.run(mcp_server.handle_resource_read("soul://insight/today"))
+
+        assert [m for m, _ in calls] == ["GET", "POST", "GET"]
+
+    def test_expired_entry_refetched(self):
+        import asyncio
+        from unittest.mock import patch
+
+        from soul_agent import mcp_server
+
+        calls: list = []
+        with patch.object(mcp_server, "_aclient", self._fake_client(calls)), \
+                patch.object(mcp_server, "_read_cache", {}), \
+                patch.object(mcp_server, "READ_CACHE_TTL", 0):
+            asyncio.run(mcp_server.handle_resource_read("soul://core/memory"))
+            asyncio.run(mcp_server.handle_resource_read("soul://core/memory"))
+
+        assert len(calls) == 2
+
+
+class TestDumps:
+    def test_pretty_prints_unicode(self):
+        import json
+
+        from soul_agent.mcp_server import _dumps
+
+        out = _dumps({"snippet": "今天的洞察", "n": 1})
+        assert "今天的洞察" in out
+        assert "\n  " in out
+        assert json.loads(out) == {"snippet": "今天的洞察", "n": 1}
+
+    def test_stdlib_fallback_matches_orjson(self):
+        from unittest.mock import patch
+
+        from soul_agent import mcp_server
+
+        result = {
+            "results": [{"path": "logs/今天.md", "score": 1.5, "tags": []}],
+            "meta": {},
+            "ok": True,
+            "next": None,
+            "quote": 'say "hi"\\',
+        }
+        fast = mcp_server._dumps(result)
+        with patch.object(mcp_server, "orjson", None):
+            assert mcp_server._dumps(result) == fast
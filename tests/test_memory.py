@@ -181,6 +181,28 @@ class TestDeduplication:
             ["user prefers vim editor for daily coding work"],
         ) is False
 
+    def test_matches_brute_force_over_many_memories(self):
+        from soul_agent.modules.memory import _deduplicate, _tokenize
+
+        existing = [f"topic{i} note about project{i % 7} planning" for i in range(200)] + ["", "。"]
+        candidates = [
+            {"text": "topic42 note about project0 planning", "category": "pattern", "importance": 3, "tags": ""},
+            {"text": "project3 planning", "category": "pattern", "importance": 3, "tags": ""},
+            {"text": "unrelated morning coffee", "category": "pattern", "importance": 3, "tags": ""},
+        ]
+
+        def brute(text):
+            new = set(_tokenize(text))
+            for old in existing:
+                old = set(_tokenize(old))
+                if old and len(new & old) / min(len(new), len(old)) >= 0.6:
+                    return True
+            return False
+
+        expected = [c for c in candidates if not brute(c["text"])]
+        assert _deduplicate(candidates, existing) == expected
+        assert [c["text"] for c in expected] == ["unrelated morning coffee"]
+
 
 class TestFallbackExtract:
     def test_extracts_from_insight_section(self):
@@ -226,6 +248,18 @@ class TestExtractMemories:
         assert "category: pattern" in content
         assert "importance: 4" in content
 
+    @patch("soul_agent.modules.memory.call_deepseek", return_value="[]")
+    def test_static_instructions_lead_the_prompt(self, mock_llm, engine):
+        from soul_agent.modules.memory import _EXTRACT_SYSTEM, _llm_extract
+
+        with patch("soul_agent.modules.soul.get_soul_context", return_value="喜欢深度工作"):
+            _llm_extract(SAMPLE_REPORT, engine)
+
+        kwargs = mock_llm.call_args.kwargs
+        assert kwargs["system"].startswith(_EXTRACT_SYSTEM)
+        assert kwargs["system"].endswith("喜欢深度工作")
+        assert kwargs["prompt"].endswith(SAMPLE_REPORT[:3000])
+
     @patch("soul_agent.modules.memory.call_deepseek", return_value="")
     def test_fallback_when_llm_fails(self, mock_llm, engine):
         from soul_agent.modules.memory import extract_memories
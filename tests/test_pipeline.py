@@ -2,6 +2,16 @@
 from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_log_cache():
+    from soul_agent.modules.daily_log import clear_daily_log_cache
+    clear_daily_log_cache()
+    yield
+    clear_daily_log_cache()
+
 
 class TestProcessBatch:
     @patch("soul_agent.modules.pipeline.classify_batch")
@@ -118,6 +118,20 @@ class TestIngestQueue:
         batch = q.get_batch(timeout=1.0)
         assert len(batch) == 3
 
+    def test_batch_detached_from_later_puts(self):
+        from datetime import datetime
+
+        from soul_agent.core.queue import IngestItem, IngestQueue
+
+        q = IngestQueue(batch_size=1, flush_interval=5.0)
+        ts = datetime(2026, 2, 1, 10, 0, 0)
+        q.put(IngestItem(text="first", source="note", timestamp=ts))
+        batch = q.get_batch(timeout=1.0)
+
+        q.put(IngestItem(text="second", source="note", timestamp=ts))
+        assert [i.text for i in batch] == ["first"]
+        assert q.pending_count() == 1
+
     def test_dedup_same_content_within_window(self):
         from datetime import datetime
 
@@ -133,6 +147,23 @@ class TestIngestQueue:
         assert result2 is False
         assert q.pending_count() == 1
 
+    def test_dedup_entries_expire_after_window(self):
+        from datetime import datetime
+        from unittest.mock import patch
+
+        from soul_agent.core.queue import IngestItem, IngestQueue
+
+        q = IngestQueue(batch_size=10, flush_interval=60.0, dedup_window=60.0)
+        ts = datetime(2026, 2, 1, 10, 0, 0)
+
+        with patch("soul_agent.core.queue.time.monotonic", side_effect=[100.0, 130.0, 170.0]):
+            assert q.put(IngestItem(text="a", source="note", timestamp=ts)) is True
+            assert q.put(IngestItem(text="b", source="note", timestamp=ts)) is True
+            # At t=170 "a" (t=100) has expired but "b" (t=130) has not
+            assert q.put(IngestItem(text="a", source="note", timestamp=ts)) is True
+
+        assert len(q._seen) == 2
+
     def test_no_dedup_for_different_content(self):
         from datetime import datetime
 
@@ -148,6 +179,32 @@ class TestIngestQueue:
         assert result2 is True
         assert q.pending_count() == 2
 
+    def test_get_batch_wakes_on_put_after_flush_window(self):
+        import threading
+        import time
+        from datetime import datetime
+
+        from soul_agent.core.queue import IngestItem, IngestQueue
+
+        q = IngestQueue(batch_size=10, flush_interval=0.05)
+        ts = datetime(2026, 2, 1, 10, 0, 0)
+        timer = threading.Timer(0.2, q.put, args=(IngestItem(text="late", source="note", timestamp=ts),))
+        timer.start()
+
+        start = time.monotonic()
+        batch = q.get_batch(timeout=5.0)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        assert [i.text for i in batch] == ["late"]
+        assert elapsed < 2.0
+
+    def test_get_batch_empty_on_timeout(self):
+        from soul_agent.core.queue import IngestQueue
+
+        q = IngestQueue(batch_size=10, flush_interval=0.05)
+        assert q.get_batch(timeout=0.1) == []
+
     def test_flush_interval_trigger(self):
         import time
         from datetime import datetime
@@ -165,3 +222,16 @@ class TestIngestQueue:
         assert len(batch) == 1
         assert batch[0].text == "waiting item"
         assert elapsed >= 0.2  # flushed by interval, not instantly
+
+    def test_items_use_slots(self):
+        from datetime import datetime
+
+        from soul_agent.core.queue import ClassifiedItem, IngestItem
+
+        ts = datetime(2026, 2, 1, 10, 0, 0)
+        for item in (
+            IngestItem(text="t", source="note", timestamp=ts),
+            ClassifiedItem(text="t", source="note", timestamp=ts, tags=["a"]),
+        ):
+            assert not hasattr(item, "__dict__")
+        assert ClassifiedItem(text="t", source="note", timestamp=ts).tags == []
@@ -0,0 +1,143 @@
+"""Tests for core/search_index.py — FTS index behind VaultEngine.search."""
+
+from __future__ import annotations
+
+import os
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestSearchIndex:
+    def test_matches_substrings_case_insensitively(self, tmp_path):
+        from soul_agent.core.search_index import SearchIndex
+
+        _write(tmp_path / "logs" / "a.md", "今天学习了知识图谱 Hello World")
+        _write(tmp_path / "logs" / "b.md", "nothing relevant")
+        index = SearchIndex(tmp_path / "idx.sqlite")
+        index.refresh(tmp_path, ["logs"])
+
+        assert [p for p, *_ in index.iter_matches(["hello"], "logs")] == ["logs/a.md"]
+        # Two-char CJK token is below the trigram minimum and still matches
+        assert [p for p, *_ in index.iter_matches(["学习", "llo wor"], "logs")] == ["logs/a.md"]
+        assert list(index.iter_matches(["hello", "missing"], "logs")) == []
+        index.close()
+
+    def test_refresh_picks_up_edits_and_deletes(self, tmp_path):
+        from soul_agent.core.search_index import SearchIndex
+
+        note = tmp_path / "memories" / "n.md"
+        _write(note, "old content")
+        index = SearchIndex(tmp_path / "idx.sqlite")
+        index.refresh(tmp_path, ["memories"])
+        assert list(index.iter_matches(["old"], "memories"))
+
+        _write(note, "new content here")
+        os.utime(note, ns=(0, note.stat().st_mtime_ns + 1_000_000))
+        index.refresh(tmp_path, ["memories"])
+        assert not list(index.iter_matches(["old"], "memories"))
+        assert list(index.iter_matches(["new"], "memories"))
+
+        note.unlink()
+        index.refresh(tmp_path, ["memories"])
+        assert not list(index.iter_matches(["content"], "memories"))
+        index.close()
+
+    def test_directory_filter_is_exact(self, tmp_path):
+        from soul_agent.core.search_index import SearchIndex
+
+        _write(tmp_path / "todos" / "active" / "t.md", "ship the release")
+        _write(tmp_path / "todos" / "done" / "d.md", "ship the beta")
+        index = SearchIndex(tmp_path / "idx.sqlite")
+        index.refresh(tmp_path, ["todos/active", "todos/done"])
+
+        assert [p for p, *_ in index.iter_matches(["ship"], "todos/active")] == ["todos/active/t.md"]
+        assert [p for p, *_ in index.iter_matches(["ship"], "todos/done")] == ["todos/done/d.md"]
+        index.close()
+
+    def test_fts_operators_in_query_are_literal(self, tmp_path):
+        from soul_agent.core.search_index import SearchIndex
+
+        _write(tmp_path / "logs" / "a.md", 'said "NOT OR" loudly')
+        index = SearchIndex(tmp_path / "idx.sqlite")
+        index.refresh(tmp_path, ["logs"])
+
+        assert [p for p, *_ in index.iter_matches(['"not'], "logs")] == ["logs/a.md"]
+        index.close()
+
+
+class TestVaultSearch:
+    def test_search_uses_index_and_write_resource_updates_it(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), \
+                patch.object(engine, "_index", None), \
+                patch.object(engine, "_index_failed", False):
+            engine.write_resource("first note about rust", "memories", "a.md")
+            results = engine.search("rust")
+            assert [r["path"] for r in results] == ["memories/a.md"]
+            assert results[0]["filename"] == "a.md"
+            assert "rust" in results[0]["snippet"]
+
+            engine.write_resource("now about python", "memories", "a.md")
+            assert engine.search("rust") == []
+            assert engine.search("python", directory="memories")[0]["path"] == "memories/a.md"
+            engine._index.close()
+
+
+class TestMatchAll:
+    def test_caseless_and_cased_tokens(self):
+        from soul_agent.core.search_index import match_all
+
+        text = "周报 Draft 2026 Review"
+        assert match_all(text, ["周报", "draft", "2026"]) == text.lower()
+        # No cased tokens: the raw text is searchable as-is
+        assert match_all(text, ["周报", "2026"]) is text
+        assert match_all(text, ["周报", "final"]) is None
+        assert match_all(text, ["月报", "draft"]) is None
+
+    def test_large_file_miss_skips_decode(self, tmp_path):
+        from soul_agent.core.vault import _MMAP_MIN_SIZE, _read_if_match
+
+        big = tmp_path / "big.md"
+        big.write_text("Alpha 学习 " + "x" * _MMAP_MIN_SIZE, encoding="utf-8")
+
+        assert _read_if_match(big, ["alpha", "学习"]) is not None
+        assert _read_if_match(big, ["alpha", "图谱"]) is None
+        assert _read_if_match(big, ["beta"]) is None
+
+
+class TestParallelReads:
+    def test_cold_refresh_indexes_every_file(self, tmp_path):
+        from soul_agent.core.search_index import SearchIndex
+
+        for i in range(20):
+            _write(tmp_path / "logs" / f"{i:02d}.md", f"entry {i} topic")
+        index = SearchIndex(tmp_path / "idx.sqlite")
+        index.refresh(tmp_path, ["logs"])
+
+        assert len(list(index.iter_matches(["topic"], "logs"))) == 20
+        index.close()
+
+    def test_scan_fallback_keeps_directory_order_and_limit(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        for i in range(12):
+            _write(tmp_path / "memories" / f"m{i:02d}.md", "shared keyword")
+        _write(tmp_path / "logs" / "l.md", "shared keyword")
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path):
+            results = engine._scan_search(["keyword"], ["logs", "memories"], limit=5)
+
+        assert [r["path"] for r in results][0] == "logs/l.md"
+        assert len(results) == 5
+        assert all(r["path"].startswith("memories/") for r in results[1:])
+
@@ -499,6 +499,22 @@ class TestChatWithSoul:
         assert "LLM 暂时不可用" in answer
         assert "灵魂摘要" in answer
 
+    @patch("soul_agent.modules.soul.call_deepseek_stream")
+    def test_stream_chat_yields_chunks(self, mock_stream, engine):
+        from soul_agent.modules.soul import stream_chat_with_soul
+
+        mock_stream.return_value = iter(["先完善", "灵魂系统"])
+        assert list(stream_chat_with_soul("q", engine)) == ["先完善", "灵魂系统"]
+        assert "q" in mock_stream.call_args.kwargs["prompt"]
+
+    @patch("soul_agent.modules.soul.call_deepseek_stream", return_value=iter([]))
+    def test_stream_chat_falls_back_when_empty(self, mock_stream, engine):
+        from soul_agent.modules.soul import stream_chat_with_soul
+
+        chunks = list(stream_chat_with_soul("q", engine))
+        assert len(chunks) == 1
+        assert "LLM 暂时不可用" in chunks[0]
+
     @patch("soul_agent.modules.soul.call_deepseek", return_value="")
     def test_chat_llm_failure_no_soul(self, mock_llm, engine):
         """LLM fails and no soul → specific fallback message."""
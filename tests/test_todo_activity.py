@@ -40,3 +40,47 @@ class TestGetStalledTodos:
         engine.read_resource.return_value = f"---\nid: a1b2c3d4\nstatus: active\nlast_activity: {today}\n---\nFresh task"
         stalled = get_stalled_todos(engine, stale_days=3)
         assert len(stalled) == 0
+
+
+class TestReadIdPrefix:
+    def test_reads_id_prefix(self):
+        from soul_agent.modules.todo import _read_id_prefix
+        content = "---\ncreated: 2026-02-20\nid: a1b2c3d4e5\nstatus: active\n---\nDo something"
+        assert _read_id_prefix(content) == "a1b2c3d4"
+
+    def test_ignores_body(self):
+        from soul_agent.modules.todo import _read_id_prefix
+        content = "---\nstatus: active\n---\nid: not-a-field"
+        assert _read_id_prefix(content) == ""
+
+    def test_skips_non_matching_todo(self):
+        from soul_agent.modules.todo import update_todo_activity
+        engine = MagicMock()
+        engine.list_resources.return_value = ["task-ffff.md"]
+        engine.read_resource.return_value = "---\nid: ffffffff\nstatus: active\n---\nOther task"
+        assert update_todo_activity("a1b2c3d4", "note", engine) is False
+        engine.write_resource.assert_not_called()
+
+
+class TestUpdateTodoActivityVault:
+    def test_sees_external_edit(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.frontmatter import parse_activity_log, parse_frontmatter
+        from soul_agent.core.vault import VaultEngine
+        from soul_agent.modules.todo import update_todo_activity
+
+        path = tmp_path / "todos/active/a1b2c3d4.md"
+        path.parent.mkdir(parents=True)
+        path.write_text("---\nid: a1b2c3d4\n---\nOld", encoding="utf-8")
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None):
+            assert engine.read_resource("todos/active/a1b2c3d4.md").endswith("Old")
+            # Edited outside the agent, e.g. in Obsidian
+            path.write_text("---\nid: a1b2c3d4\n---\nNewer text", encoding="utf-8")
+            assert update_todo_activity("a1b2c3d4", "note", engine) is True
+
+        fields, body = parse_frontmatter(path.read_text(encoding="utf-8"))
+        assert body.strip() == "Newer text"
+        assert parse_activity_log(fields["activity_log"])[0]["sources"] == ["note"]
@@ -0,0 +1,132 @@
+"""Tests for core/vault.py — VaultEngine file I/O."""
+
+from __future__ import annotations
+
+import pytest
+
+
+class TestVaultWrites:
+    def test_write_recreates_directory_removed_after_caching(self, tmp_path):
+        import shutil
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None):
+            engine.write_resource("one", "insights", "a.md")
+            assert tmp_path / "insights" in engine._dir_cache
+
+            shutil.rmtree(tmp_path / "insights")
+            engine.write_resource("two", "insights", "a.md")
+            assert (tmp_path / "insights" / "a.md").read_text(encoding="utf-8") == "two"
+
+    def test_move_within_same_lock_stripe(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None), \
+                patch.object(engine, "_lock_for", return_value=engine._locks[0]):
+            engine.write_resource("task", "todos/active", "t.md")
+            assert engine.move_resource("todos/active/t.md", "todos/done/t.md")
+        assert (tmp_path / "todos" / "done" / "t.md").exists()
+
+    def test_write_is_atomic_and_leaves_no_temp_file(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None):
+            engine.write_resource("v1", "memories", "m.md")
+            with patch("soul_agent.core.vault.os.replace", side_effect=OSError("disk full")), \
+                    pytest.raises(OSError):
+                engine.write_resource("v2", "memories", "m.md")
+
+        assert (tmp_path / "memories" / "m.md").read_text(encoding="utf-8") == "v1"
+        assert [p.name for p in (tmp_path / "memories").iterdir()] == ["m.md"]
+
+    def test_list_resources_matches_glob_selection(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        d = tmp_path / "logs"
+        d.mkdir()
+        for name in ("b.md", "a.md", ".hidden.md", "notes.txt"):
+            (d / name).write_text("x", encoding="utf-8")
+        (d / "dir.md").mkdir()
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path):
+            assert engine.list_resources("logs") == ["a.md", "b.md"]
+            assert engine.list_resources("missing") == []
+
+    def test_append_resource_creates_then_appends(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path), patch.object(engine, "_index", None):
+            engine.append_resource("a", "logs", "d.md")
+            engine.append_resource("\nb", "logs", "d.md")
+            assert engine.read_resource("logs/d.md") == "a\nb"
+
+    def test_list_resources_with_pattern(self, tmp_path):
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        insights = tmp_path / "insights"
+        insights.mkdir()
+        for name in ("2026-W08.md", "2026-W09.md", "2025-W52.md", "2026-02.md", "2026-W10.txt"):
+            (insights / name).write_text("x", encoding="utf-8")
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path):
+            assert engine.list_resources("insights", pattern="2026-W*.md") == ["2026-W08.md", "2026-W09.md"]
+            assert len(engine.list_resources("insights")) == 4
+
+    def test_read_resource_cached_until_file_changes(self, tmp_path):
+        import os
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        note = tmp_path / "insights" / "i.md"
+        note.parent.mkdir()
+        note.write_text("first", encoding="utf-8")
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path):
+            assert engine.read_resource("insights/i.md") == "first"
+            with patch("pathlib.Path.read_text", side_effect=AssertionError("re-read")):
+                assert engine.read_resource("insights/i.md") == "first"
+
+            note.write_text("second!", encoding="utf-8")
+            os.utime(note, ns=(0, note.stat().st_mtime_ns + 1_000_000))
+            assert engine.read_resource("insights/i.md") == "second!"
+            assert engine.read_resource("insights") is None
+            assert engine.read_resource("insights/missing.md") is None
+
+    def test_read_resource_sees_same_size_atomic_replace(self, tmp_path):
+        import os
+        from unittest.mock import patch
+
+        from soul_agent.core.vault import VaultEngine
+
+        note = tmp_path / "insights" / "i.md"
+        note.parent.mkdir()
+        note.write_text("aaaa", encoding="utf-8")
+        mtime = note.stat().st_mtime_ns
+
+        engine = VaultEngine()
+        with patch.object(engine, "_vault_root", tmp_path):
+            assert engine.read_resource("insights/i.md") == "aaaa"
+            engine.write_resource("bbbb", "insights", "i.md")
+            # Same size and mtime, as on a coarse-granularity filesystem
+            os.utime(note, ns=(mtime, mtime))
+            assert engine.read_resource("insights/i.md") == "bbbb"